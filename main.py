@@ -146,7 +146,9 @@ def main():
         senders_data,
         app_settings["sender_strategy"]
     )
-    rate_limiter = RateLimiter(senders_data, rate_limiter_settings["global_limit"], logger)
+    # duplicate_send runs every send on the main thread, so the limiter can skip locking
+    rate_limiter = RateLimiter(senders_data, rate_limiter_settings["global_limit"], logger,
+                               single_threaded=app_settings["sender_strategy"] == "duplicate_send")
     failure_tracker = SenderFailureTracker(failure_tracking_settings, logger)
     retry_handler = EmailRetryHandler(retry_settings, logger)
 
@@ -253,7 +255,7 @@ def main():
 
         if os.path.exists(file_path):
             cid_attachments[content_id] = file_path
-            logger.debug(f"CID attachment configured: {content_id} -> {file_path}")
+            logger.debug("CID attachment configured: %s -> %s", content_id, file_path)
         else:
             logger.warning(f"CID attachment file not found: {file_path}")
 
@@ -308,7 +310,7 @@ def main():
                         personalized_subject = email_composer.personalizer.personalize_email(
                             email_content_settings["subject"], recipient
                         )
-                        logger.debug(f"Processed email for {recipient_email} (personalization + anti-spam)")
+                        logger.debug("Processed email for %s (personalization + anti-spam)", recipient_email)
                     except Exception as e:
                         logger.warning(f"Email processing failed for {recipient_email}: {e}")
                         # Fallback to legacy personalization
@@ -348,7 +350,7 @@ def main():
                 # Queue the email task
                 if queue_manager.queue_email(email_task):
                     queued_in_batch += 1
-                    logger.debug(f"Queued email for {recipient_email}")
+                    logger.debug("Queued email for %s", recipient_email)
                 else:
                     logger.error(f"Failed to queue email for {recipient_email}")
                     failed_sends += 1
@@ -442,13 +444,19 @@ def main():
                     logger.info(f"Skipping blocked sender '{sender_email}' for {recipient}")
                     continue
 
-                # Check rate limits
+                # Check rate limits and gap; senders still in their gap are skipped, not waited on
                 if not rate_limiter.can_send(sender_email):
                     logger.info(f"Skipping rate-limited sender '{sender_email}' for {recipient}")
                     continue
 
                 # Attempt send with retries
                 rate_limiter.wait_if_needed(sender_email)
+
+                # Atomically check all limits and reserve a send slot; a refusal here means a
+                # count or gap limit still failed after waiting
+                if not rate_limiter.try_acquire(sender_email):
+                    logger.info(f"Skipping sender '{sender_email}' for {recipient}: rate limit refused the send after waiting")
+                    continue
                 
                 result = retry_handler.attempt_send_with_retries(
                     email_sender=email_sender,
@@ -464,7 +472,6 @@ def main():
                 senders_used += 1
                 
                 if result['success']:
-                    sender_manager.record_sent(sender_email)
                     rate_limiter.record_sent(sender_email)
                     failure_tracker.record_success(sender_email)
                     recipient_success = True
@@ -529,6 +536,9 @@ def main():
     
     logger.info("=" * 60)
 
+    # Write any queued recipient status updates
+    recipient_manager.close()
+
     # Cleanup browser automation resources
     try:
         email_sender.close()
@@ -257,7 +257,7 @@ class BrowserEmailSender:
                         page.close()
                         self.logger.debug("✅ Current page closed")
                     except Exception as e:
-                        self.logger.debug(f"Page close failed: {e}")
+                        self.logger.debug("Page close failed: %s", e)
 
                     self.browser_handler.close_context(sender_email)
                     self.logger.info("✅ Browser context closed")
@@ -314,7 +314,7 @@ class BrowserEmailSender:
                 # DON'T close the page - keep it open for session reuse
                 # The page will be closed when the sender's queue is empty
                 # or when cleanup_sender is called
-                self.logger.debug(f"Keeping page open for session reuse with {sender_email}")
+                self.logger.debug("Keeping page open for session reuse with %s", sender_email)
                 pass
                     
         except Exception as e:
@@ -353,7 +353,7 @@ class BrowserEmailSender:
 
             # Mark as prepared (actual validation happens during email sending)
             self.active_contexts[sender_email] = True
-            self.logger.debug(f"Sender {sender_email} prepared for browser automation")
+            self.logger.debug("Sender %s prepared for browser automation", sender_email)
             return True
 
         except Exception as e:
@@ -371,7 +371,7 @@ class BrowserEmailSender:
             if sender_email in self.active_contexts:
                 self.browser_handler.close_context(sender_email)
                 del self.active_contexts[sender_email]
-                self.logger.debug(f"Cleaned up resources for {sender_email}")
+                self.logger.debug("Cleaned up resources for %s", sender_email)
         except Exception as e:
             self.logger.error(f"Error cleaning up sender {sender_email}: {e}")
     
@@ -32,6 +32,7 @@ import time
 import threading
 import asyncio
 from datetime import datetime
+from functools import lru_cache
 from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
 from typing import Optional, Dict, Any, List
 
@@ -76,7 +77,7 @@ class BrowserHandler:
 
         except Exception as e:
             # If normal startup fails due to asyncio conflicts, try workaround
-            self.logger.debug(f"Normal Playwright start failed: {e}, trying asyncio workaround...")
+            self.logger.debug("Normal Playwright start failed: %s, trying asyncio workaround...", e)
 
             try:
                 # Temporarily monkey-patch asyncio detection only if needed
@@ -109,7 +110,7 @@ class BrowserHandler:
                 if not self._thread_local.playwright:
                     self.logger.error(f"Failed to start Playwright for thread {threading.current_thread().name}")
                     return None
-                self.logger.debug(f"Started separate Playwright for thread {threading.current_thread().name}")
+                self.logger.debug("Started separate Playwright for thread %s", threading.current_thread().name)
 
             # Configure browser options (same as main browser)
             browser_options = {
@@ -135,10 +136,10 @@ class BrowserHandler:
                 try:
                     if default_type == 'firefox':
                         browser_instance = self._thread_local.playwright.firefox.launch(**browser_options)
-                        self.logger.debug(f"Launched Firefox browser for thread {threading.current_thread().name}")
+                        self.logger.debug("Launched Firefox browser for thread %s", threading.current_thread().name)
                     else:
                         browser_instance = self._thread_local.playwright.chromium.launch(**browser_options)
-                        self.logger.debug(f"Launched Chromium browser for thread {threading.current_thread().name}")
+                        self.logger.debug("Launched Chromium browser for thread %s", threading.current_thread().name)
 
                     self._thread_local.browsers[default_type] = browser_instance
 
@@ -343,25 +344,13 @@ class BrowserHandler:
                 self.logger.error(f"Cookie file not found: {cookie_file}")
                 return None
             
-            # Load cookies from file
-            with open(cookie_file, 'r') as f:
-                cookies = json.load(f)
+            # Load cookies from file (parsed once per file version); each context
+            # gets its own copies
+            cached_cookies = self._load_cookies_cached(cookie_file, os.stat(cookie_file).st_mtime_ns)
+            cookies = [dict(cookie) for cookie in cached_cookies]
             
             self.logger.info(f"Loaded {len(cookies)} cookies for {email}")
             
-            # Fix sameSite values for Playwright compatibility
-            for cookie in cookies:
-                if 'sameSite' in cookie:
-                    samesite_value = cookie['sameSite'].lower()
-                    if samesite_value == 'lax':
-                        cookie['sameSite'] = 'Lax'
-                    elif samesite_value == 'strict':
-                        cookie['sameSite'] = 'Strict'
-                    elif samesite_value in ['none', 'no_restriction']:
-                        cookie['sameSite'] = 'None'
-                    else:
-                        cookie['sameSite'] = 'Lax'
-            
             # Create context exactly like LinkedIn automation (direct parameters)
             context_params = {
                 "storage_state": {"cookies": cookies},
@@ -376,7 +365,7 @@ class BrowserHandler:
             # Add random user agent if enabled
             if self.config.get("use_random_user_agent", True):
                 context_params["user_agent"] = random.choice(self.user_agents)
-                self.logger.debug(f"Using random user agent for {email}")
+                self.logger.debug("Using random user agent for %s", email)
 
             # Create context with direct parameters using main browser
             # This should only be called from main thread during preparation
@@ -399,6 +388,32 @@ class BrowserHandler:
             self.logger.error(f"Failed to create browser context for {email}: {e}")
             return None
     
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _load_cookies_cached(cookie_file: str, mtime_ns: int) -> tuple:
+        """
+        Load and normalize a cookie file.
+
+        Cached by path and modification time, so an edited file is read again.
+        """
+        with open(cookie_file, 'r') as f:
+            cookies = json.load(f)
+        
+        # Fix sameSite values for Playwright compatibility
+        for cookie in cookies:
+            if 'sameSite' in cookie:
+                samesite_value = cookie['sameSite'].lower()
+                if samesite_value == 'lax':
+                    cookie['sameSite'] = 'Lax'
+                elif samesite_value == 'strict':
+                    cookie['sameSite'] = 'Strict'
+                elif samesite_value in ['none', 'no_restriction']:
+                    cookie['sameSite'] = 'None'
+                else:
+                    cookie['sameSite'] = 'Lax'
+        
+        return tuple(cookies)
+    
     def _get_fullscreen_viewport(self) -> Dict[str, int]:
         """
         Generate full screen viewport size that matches actual screen dimensions.
@@ -464,7 +479,7 @@ class BrowserHandler:
                 except:
                     # Page is closed/invalid, remove it and create new one
                     del thread_pages[sender_email]
-                    self.logger.debug(f"🔄 Previous tab for {sender_email} was closed, creating new one")
+                    self.logger.debug("🔄 Previous tab for %s was closed, creating new one", sender_email)
 
             # Handle browser switching if requested
             if force_browser_switch:
@@ -476,7 +491,7 @@ class BrowserHandler:
                         del thread_contexts[sender_email]
                         self.logger.info(f"🔄 Closed old context for browser switch to {new_browser_type}")
                     except Exception as e:
-                        self.logger.debug(f"Failed to close old context: {e}")
+                        self.logger.debug("Failed to close old context: %s", e)
 
             # Check if context exists for this sender in current thread
             # KEY CHANGE: Use sender_email as context key to reuse sessions
@@ -503,7 +518,7 @@ class BrowserHandler:
                 thread_contexts[sender_email] = context
                 self.logger.info(f"🔄 Created new browser session for sender {sender_email} in thread {threading.current_thread().name}")
             else:
-                self.logger.debug(f"🔄 Reusing existing browser session for sender {sender_email}")
+                self.logger.debug("🔄 Reusing existing browser session for sender %s", sender_email)
 
             context = thread_contexts[sender_email]
             page = context.new_page()
@@ -515,9 +530,9 @@ class BrowserHandler:
             page.set_default_timeout(self.config.get("page_load_timeout", 30) * 1000)
 
             # Simple approach - let the browser use its natural size (like LinkedIn automation)
-            self.logger.debug(f"Page created with natural browser dimensions for {sender_email} in thread {threading.current_thread().name}")
+            self.logger.debug("Page created with natural browser dimensions for %s in thread %s", sender_email, threading.current_thread().name)
 
-            self.logger.debug(f"Created new page for {sender_email}")
+            self.logger.debug("Created new page for %s", sender_email)
             return page
 
         except Exception as e:
@@ -577,7 +592,7 @@ class BrowserHandler:
             """)
             self.logger.debug("Full-width content adjustments applied")
         except Exception as e:
-            self.logger.debug(f"Could not apply full-width content adjustments: {e}")
+            self.logger.debug("Could not apply full-width content adjustments: %s", e)
     
     def simulate_human_delay(self, min_delay: Optional[float] = None, max_delay: Optional[float] = None):
         """
@@ -594,7 +609,7 @@ class BrowserHandler:
         
         delay = random.uniform(min_delay, max_delay)
         time.sleep(delay)
-        self.logger.debug(f"Human delay: {delay:.2f} seconds")
+        self.logger.debug("Human delay: %.2f seconds", delay)
     
     def simulate_typing_delay(self) -> int:
         """
@@ -649,7 +664,7 @@ class BrowserHandler:
                 except:
                     pass  # Page might already be closed
                 del thread_pages[sender_email]
-                self.logger.debug(f"🔄 Closed browser tab for sender {sender_email}")
+                self.logger.debug("🔄 Closed browser tab for sender %s", sender_email)
 
             # Close context in thread-local storage
             thread_contexts = self._get_thread_contexts()
@@ -686,7 +701,7 @@ class BrowserHandler:
                     try:
                         page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
                     except Exception as e:
-                        self.logger.debug(f"Failed to clear storage for page: {e}")
+                        self.logger.debug("Failed to clear storage for page: %s", e)
 
                 self.logger.info(f"Cleared browser data for {sender_email}")
                 return True
@@ -70,7 +70,7 @@ class FileCaptchaManager:
             bool: True if verification completed successfully
         """
         self.logger.info(f"🚀 CAPTCHA verification request started for {email}")
-        self.logger.debug(f"🔧 Request details - Provider: {provider}, Detection: {detection_method}")
+        self.logger.debug("🔧 Request details - Provider: %s, Detection: %s", provider, detection_method)
 
         # Check if this is the first/only CAPTCHA or if there are multiple
         self.logger.debug(f"🔒 Acquiring lock for CAPTCHA count check...")
@@ -80,7 +80,7 @@ class FileCaptchaManager:
             existing_captcha_count = len(self.active_captchas)
             existing_accounts = list(self.active_captchas.keys())
 
-            self.logger.debug(f"📊 Current state - Existing: {existing_captcha_count}, Accounts: {existing_accounts}")
+            self.logger.debug("📊 Current state - Existing: %s, Accounts: %s", existing_captcha_count, existing_accounts)
 
             # Prevent duplicate entries for same email
             if email in self.active_captchas:
@@ -88,22 +88,22 @@ class FileCaptchaManager:
                 return False
 
             # Add this account to active list to track concurrent CAPTCHAs
-            self.logger.debug(f"➕ Adding {email} to active CAPTCHA list")
+            self.logger.debug("➕ Adding %s to active CAPTCHA list", email)
             self.active_captchas[email] = "PENDING"
             total_captcha_count = len(self.active_captchas)
-            self.logger.debug(f"✅ Added {email} to active list, new count: {total_captcha_count}")
+            self.logger.debug("✅ Added %s to active list, new count: %s", email, total_captcha_count)
         # Lock is released here - IMPORTANT!
 
         self.logger.debug(f"🔓 Lock released after CAPTCHA count check")
-        self.logger.debug(f"🔍 CAPTCHA count check: {existing_captcha_count} existing + 1 current = {total_captcha_count} total active CAPTCHAs")
-        self.logger.debug(f"🔍 Active CAPTCHAs: {list(self.active_captchas.keys())}")
+        self.logger.debug("🔍 CAPTCHA count check: %s existing + 1 current = %s total active CAPTCHAs", existing_captcha_count, total_captcha_count)
+        self.logger.debug("🔍 Active CAPTCHAs: %s", list(self.active_captchas.keys()))
 
         # SIMPLIFIED: Always use file-based CAPTCHA for multi-browser setup
         self.logger.info(f"🎯 Using file-based CAPTCHA system for {email} (total active: {total_captcha_count})")
 
-        self.logger.debug(f"🔧 Calling _handle_multiple_captcha_file for {email}")
+        self.logger.debug("🔧 Calling _handle_multiple_captcha_file for %s", email)
         result = self._handle_multiple_captcha_file(email, provider, browser_title, browser_url, detection_method)
-        self.logger.debug(f"🔧 _handle_multiple_captcha_file returned {result} for {email}")
+        self.logger.debug("🔧 _handle_multiple_captcha_file returned %s for %s", result, email)
         return result
     def _handle_single_captcha_terminal(self, email: str, provider: str, browser_title: str,
                                        browser_url: str, detection_method: str) -> bool:
@@ -219,38 +219,38 @@ class FileCaptchaManager:
         self.logger.info(f"🚀 Starting multiple CAPTCHA file handling for {email}")
 
         # Create unique temp file for this account
-        self.logger.debug(f"🔧 Creating temp file path for {email}")
+        self.logger.debug("🔧 Creating temp file path for %s", email)
         safe_email = email.replace('@', '_at_').replace('.', '_dot_')
 
         # Add microseconds to timestamp to avoid collisions
         import time
         timestamp = datetime.now().strftime("%H%M%S") + f"_{int(time.time() * 1000000) % 1000000:06d}"
         temp_file = os.path.join(self.temp_dir, f"captcha_{safe_email}_{timestamp}.txt")
-        self.logger.debug(f"📁 Temp file path created: {temp_file}")
+        self.logger.debug("📁 Temp file path created: %s", temp_file)
 
         # Small delay to avoid race conditions
         time.sleep(0.01)  # 10ms delay
 
         # Store active CAPTCHA info (quick lock for dictionary update only)
-        self.logger.debug(f"🔒 Acquiring lock to update active CAPTCHA info for {email}")
+        self.logger.debug("🔒 Acquiring lock to update active CAPTCHA info for %s", email)
         with self.lock:
             self.active_captchas[email] = temp_file
-        self.logger.debug(f"✅ Updated active_captchas[{email}] = {temp_file} (lock released)")
+        self.logger.debug("✅ Updated active_captchas[%s] = %s (lock released)", email, temp_file)
 
         try:
             # Create temp file with instructions
-            self.logger.debug(f"🔧 Creating CAPTCHA file for {email}: {temp_file}")
+            self.logger.debug("🔧 Creating CAPTCHA file for %s: %s", email, temp_file)
             self._create_captcha_file(temp_file, email, provider, browser_title, browser_url, detection_method)
-            self.logger.debug(f"✅ CAPTCHA file created successfully for {email}")
+            self.logger.debug("✅ CAPTCHA file created successfully for %s", email)
 
             self.logger.warning(f"🤖 Multiple CAPTCHAs detected - using file-based system")
             self.logger.warning(f"📁 Created CAPTCHA file for {email}: {temp_file}")
             self.logger.warning(f"🔄 Browser automation paused for {email} - waiting for user input in file")
 
             # Wait for user input in file
-            self.logger.debug(f"🔧 Starting file monitoring for {email}")
+            self.logger.debug("🔧 Starting file monitoring for %s", email)
             success = self._wait_for_file_input(temp_file, email)
-            self.logger.debug(f"🔧 File monitoring completed for {email}, success: {success}")
+            self.logger.debug("🔧 File monitoring completed for %s, success: %s", email, success)
 
             return success
 
@@ -267,7 +267,7 @@ class FileCaptchaManager:
                 with self.lock:
                     if email in self.active_captchas:
                         del self.active_captchas[email]
-                        self.logger.debug(f"🧹 Removed {email} from active CAPTCHA list")
+                        self.logger.debug("🧹 Removed %s from active CAPTCHA list", email)
             except Exception as e:
                 self.logger.error(f"Error cleaning up active captcha list for {email}: {e}")
 
@@ -290,19 +290,19 @@ class FileCaptchaManager:
         self.logger.info(f"🚀 Creating file for existing account: {email}")
 
         # Create unique temp file for this account
-        self.logger.debug(f"🔧 Creating temp file path for existing account {email}")
+        self.logger.debug("🔧 Creating temp file path for existing account %s", email)
         safe_email = email.replace('@', '_at_').replace('.', '_dot_')
         timestamp = datetime.now().strftime("%H%M%S")
         temp_file = os.path.join(self.temp_dir, f"captcha_{safe_email}_{timestamp}.txt")
-        self.logger.debug(f"📁 Temp file path for existing account: {temp_file}")
+        self.logger.debug("📁 Temp file path for existing account: %s", temp_file)
 
         # Update active CAPTCHA info (quick lock for dictionary update only)
         with self.lock:
             self.active_captchas[email] = temp_file
-        self.logger.debug(f"✅ Updated active_captchas[{email}] = {temp_file} for existing account")
+        self.logger.debug("✅ Updated active_captchas[%s] = %s for existing account", email, temp_file)
 
         # Create temp file with generic instructions since we don't have original details
-        self.logger.debug(f"🔧 Creating CAPTCHA file for existing account {email}")
+        self.logger.debug("🔧 Creating CAPTCHA file for existing account %s", email)
         self._create_captcha_file(
             temp_file,
             email,
@@ -311,7 +311,7 @@ class FileCaptchaManager:
             "Check your browser window",
             "Multiple CAPTCHA mode conversion"
         )
-        self.logger.debug(f"✅ CAPTCHA file created for existing account {email}")
+        self.logger.debug("✅ CAPTCHA file created for existing account %s", email)
 
         self.logger.warning(f"📁 Created CAPTCHA file for existing account {email}: {temp_file}")
         self.logger.warning(f"🔄 Account {email} switched from terminal to file-based input")
@@ -360,16 +360,16 @@ class FileCaptchaManager:
         
         try:
             # Ensure temp directory exists
-            self.logger.debug(f"🔧 Ensuring temp directory exists: {os.path.dirname(file_path)}")
+            self.logger.debug("🔧 Ensuring temp directory exists: %s", os.path.dirname(file_path))
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            self.logger.debug(f"✅ Temp directory confirmed: {os.path.dirname(file_path)}")
+            self.logger.debug("✅ Temp directory confirmed: %s", os.path.dirname(file_path))
 
             # Check if file already exists (shouldn't happen but let's be safe)
             if os.path.exists(file_path):
                 self.logger.warning(f"⚠️ File already exists, will overwrite: {file_path}")
 
-            self.logger.debug(f"🔧 Writing CAPTCHA instructions to file: {file_path}")
-            self.logger.debug(f"📝 Instructions length: {len(instructions)} characters")
+            self.logger.debug("🔧 Writing CAPTCHA instructions to file: %s", file_path)
+            self.logger.debug("📝 Instructions length: %s characters", len(instructions))
 
             # Write with explicit flushing
             with open(file_path, 'w', encoding='utf-8') as f:
@@ -378,12 +378,12 @@ class FileCaptchaManager:
                 os.fsync(f.fileno())  # Force write to disk
 
             self.logger.info(f"📝 Created CAPTCHA instruction file: {file_path}")
-            self.logger.debug(f"✅ File write completed successfully: {file_path}")
+            self.logger.debug("✅ File write completed successfully: %s", file_path)
 
             # Verify file was created and has content
             if os.path.exists(file_path):
                 file_size = os.path.getsize(file_path)
-                self.logger.debug(f"✅ File verification - Size: {file_size} bytes")
+                self.logger.debug("✅ File verification - Size: %s bytes", file_size)
             else:
                 self.logger.error(f"❌ File verification failed - File does not exist: {file_path}")
 
@@ -414,72 +414,72 @@ class FileCaptchaManager:
             bool: True if user input detected, False if timeout
         """
         self.logger.info(f"🚀 Starting file input monitoring for {email}")
-        self.logger.debug(f"🔧 File monitoring parameters - File: {file_path}, Interval: {check_interval}s, Max: {max_wait_minutes}m")
+        self.logger.debug("🔧 File monitoring parameters - File: %s, Interval: %ss, Max: %sm", file_path, check_interval, max_wait_minutes)
 
         max_checks = (max_wait_minutes * 60) // check_interval
         checks_done = 0
 
         self.logger.info(f"⏳ Waiting for user input in file: {file_path}")
-        self.logger.debug(f"📊 Will check file {max_checks} times with {check_interval}s intervals")
+        self.logger.debug("📊 Will check file %s times with %ss intervals", max_checks, check_interval)
 
-        self.logger.debug(f"🔄 Starting file monitoring loop for {email}")
+        self.logger.debug("🔄 Starting file monitoring loop for %s", email)
         while checks_done < max_checks:
-            self.logger.debug(f"🔄 File check iteration {checks_done + 1}/{max_checks} for {email}")
+            self.logger.debug("🔄 File check iteration %s/%s for %s", checks_done + 1, max_checks, email)
             try:
                 # Skip the active check to avoid deadlock - assume still active
-                self.logger.debug(f"✅ Continuing monitoring for {email} (skipping active check to avoid deadlock)")
+                self.logger.debug("✅ Continuing monitoring for %s (skipping active check to avoid deadlock)", email)
 
                 # Check if file still exists (no lock needed for file system check)
-                self.logger.debug(f"📁 Checking if file exists: {file_path}")
+                self.logger.debug("📁 Checking if file exists: %s", file_path)
                 if not os.path.exists(file_path):
                     self.logger.warning(f"⚠️  CAPTCHA file deleted externally: {file_path}")
                     # Quick lock only for dictionary cleanup
                     with self.lock:
                         if email in self.active_captchas:
                             del self.active_captchas[email]
-                    self.logger.debug(f"🧹 Removed {email} from active list due to deleted file")
+                    self.logger.debug("🧹 Removed %s from active list due to deleted file", email)
                     return False
-                self.logger.debug(f"✅ File exists: {file_path}")
+                self.logger.debug("✅ File exists: %s", file_path)
 
                 # Read file content with better error handling
-                self.logger.debug(f"📖 About to read file content: {file_path}")
+                self.logger.debug("📖 About to read file content: %s", file_path)
                 try:
-                    self.logger.debug(f"📖 Opening file for reading: {file_path}")
+                    self.logger.debug("📖 Opening file for reading: %s", file_path)
                     with open(file_path, 'r', encoding='utf-8') as f:
                         self.logger.debug(f"📖 File opened successfully, reading content...")
                         content = f.read().strip()
                         self.logger.debug(f"📖 File read operation completed")
-                    self.logger.debug(f"✅ File read successfully, content length: {len(content)} chars")
-                    self.logger.debug(f"📄 File content preview (last 50 chars): {repr(content[-50:])}")
+                    self.logger.debug("✅ File read successfully, content length: %s chars", len(content))
+                    self.logger.debug("📄 File content preview (last 50 chars): %s", repr(content[-50:]))
                 except (IOError, OSError, UnicodeDecodeError) as e:
                     self.logger.error(f"❌ Failed to read CAPTCHA file {file_path}: {e}")
                     self.logger.error(f"❌ File read error details: {type(e).__name__}: {str(e)}")
-                    self.logger.debug(f"😴 Sleeping {check_interval}s after file read error for {email}")
+                    self.logger.debug("😴 Sleeping %ss after file read error for %s", check_interval, email)
                     time.sleep(check_interval)
                     checks_done += 1
-                    self.logger.debug(f"⏰ Continuing after file read error, check {checks_done}/{max_checks} for {email}")
+                    self.logger.debug("⏰ Continuing after file read error, check %s/%s for %s", checks_done, max_checks, email)
                     continue
                 except Exception as e:
                     self.logger.error(f"❌ Unexpected error reading file {file_path}: {e}")
                     self.logger.error(f"❌ Unexpected error details: {type(e).__name__}: {str(e)}")
                     import traceback
                     self.logger.error(f"❌ Traceback: {traceback.format_exc()}")
-                    self.logger.debug(f"😴 Sleeping {check_interval}s after unexpected file error for {email}")
+                    self.logger.debug("😴 Sleeping %ss after unexpected file error for %s", check_interval, email)
                     time.sleep(check_interval)
                     checks_done += 1
-                    self.logger.debug(f"⏰ Continuing after unexpected file error, check {checks_done}/{max_checks} for {email}")
+                    self.logger.debug("⏰ Continuing after unexpected file error, check %s/%s for %s", checks_done, max_checks, email)
                     continue
 
                 # Check for user input
-                self.logger.debug(f"🔍 About to check user input for {email}")
+                self.logger.debug("🔍 About to check user input for %s", email)
                 user_input_detected = self._check_user_input(content)
-                self.logger.debug(f"🔍 User input check completed for {email}: {user_input_detected}")
+                self.logger.debug("🔍 User input check completed for %s: %s", email, user_input_detected)
 
                 if user_input_detected:
                     self.logger.info(f"✅ User input detected for {email} - CAPTCHA completed!")
                     return True
 
-                self.logger.debug(f"❌ No user input detected for {email}, continuing loop")
+                self.logger.debug("❌ No user input detected for %s, continuing loop", email)
 
                 # Log waiting status (but not too frequently to avoid spam)
                 if checks_done % 2 == 0:  # Log every 10 seconds instead of every 5
@@ -490,31 +490,31 @@ class FileCaptchaManager:
 
                     # Show current active CAPTCHAs (with thread safety)
                     try:
-                        self.logger.debug(f"📊 Logging active CAPTCHAs for iteration {checks_done + 1}")
+                        self.logger.debug("📊 Logging active CAPTCHAs for iteration %s", checks_done + 1)
                         self._log_active_captchas()
                     except Exception as log_error:
                         self.logger.error(f"Error logging active captchas: {log_error}")
 
-                self.logger.debug(f"😴 About to sleep for {check_interval}s before next check for {email}")
+                self.logger.debug("😴 About to sleep for %ss before next check for %s", check_interval, email)
                 time.sleep(check_interval)
-                self.logger.debug(f"😴 Sleep completed for {email}")
+                self.logger.debug("😴 Sleep completed for %s", email)
                 checks_done += 1
-                self.logger.debug(f"⏰ Completed check {checks_done}/{max_checks} for {email}")
-                self.logger.debug(f"🔄 About to start next iteration for {email}")
+                self.logger.debug("⏰ Completed check %s/%s for %s", checks_done, max_checks, email)
+                self.logger.debug("🔄 About to start next iteration for %s", email)
 
             except Exception as e:
                 self.logger.error(f"❌ Unexpected error in file monitoring for {email}: {e}")
                 self.logger.error(f"❌ Error details: {type(e).__name__}: {str(e)}")
                 import traceback
                 self.logger.error(f"❌ Traceback: {traceback.format_exc()}")
-                self.logger.debug(f"😴 Sleeping {check_interval}s after error for {email}")
+                self.logger.debug("😴 Sleeping %ss after error for %s", check_interval, email)
                 time.sleep(check_interval)
                 checks_done += 1
-                self.logger.debug(f"⏰ Continuing after error, check {checks_done}/{max_checks} for {email}")
+                self.logger.debug("⏰ Continuing after error, check %s/%s for %s", checks_done, max_checks, email)
 
         # Timeout reached
         self.logger.error(f"⏰ CAPTCHA verification timeout for {email} after {max_wait_minutes} minutes")
-        self.logger.debug(f"❌ File monitoring loop ended for {email} due to timeout")
+        self.logger.debug("❌ File monitoring loop ended for %s due to timeout", email)
         return False
     
     def _check_user_input(self, content: str) -> bool:
@@ -527,21 +527,21 @@ class FileCaptchaManager:
         Returns:
             bool: True if valid input found
         """
-        self.logger.debug(f"🔍 Checking user input in content (length: {len(content)})")
-        self.logger.debug(f"🔍 Content preview: {repr(content[:100])}...")
+        self.logger.debug("🔍 Checking user input in content (length: %s)", len(content))
+        self.logger.debug("🔍 Content preview: %s...", repr(content[:100]))
 
         # Look for "DONE" in the content (case insensitive)
         lines = content.lower().split('\n')
-        self.logger.debug(f"🔍 Split content into {len(lines)} lines")
+        self.logger.debug("🔍 Split content into %s lines", len(lines))
 
         for i, line in enumerate(lines):
             line = line.strip()
-            self.logger.debug(f"🔍 Checking line {i+1}: {repr(line)}")
+            self.logger.debug("🔍 Checking line %s: %s", i+1, repr(line))
             if line == 'done' or line == '"done"' or line == "'done'":
-                self.logger.debug(f"✅ Found DONE on line {i+1}: {repr(line)}")
+                self.logger.debug("✅ Found DONE on line %s: %s", i+1, repr(line))
                 return True
 
-        self.logger.debug(f"❌ No DONE found in {len(lines)} lines")
+        self.logger.debug("❌ No DONE found in %s lines", len(lines))
         return False
     
     def _log_active_captchas(self):
@@ -562,7 +562,7 @@ class FileCaptchaManager:
                     if filename.startswith('captcha_') and filename.endswith('.txt'):
                         file_path = os.path.join(self.temp_dir, filename)
                         os.remove(file_path)
-                        self.logger.debug(f"Cleaned up old CAPTCHA file: {file_path}")
+                        self.logger.debug("Cleaned up old CAPTCHA file: %s", file_path)
         except Exception as e:
             self.logger.warning(f"Failed to cleanup temp files: {e}")
     
@@ -175,7 +175,7 @@ Page Title: {page_title}
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(full_content)
             
-            self.logger.debug(f"HTML captured: {step_name} -> {filename}")
+            self.logger.debug("HTML captured: %s -> %s", step_name, filename)
             
             return filepath
             
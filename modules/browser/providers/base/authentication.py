@@ -56,16 +56,16 @@ class BaseAuthentication:
             try:
                 element = page.wait_for_selector(selector, timeout=timeout)
                 if element and element.is_visible():
-                    self.logger.debug(f"✅ Found element with selector: {selector}")
+                    self.logger.debug("✅ Found element with selector: %s", selector)
                     return element
             except PlaywrightTimeoutError:
-                self.logger.debug(f"⏰ Timeout waiting for selector: {selector}")
+                self.logger.debug("⏰ Timeout waiting for selector: %s", selector)
                 continue
             except Exception as e:
-                self.logger.debug(f"❌ Error with selector {selector}: {e}")
+                self.logger.debug("❌ Error with selector %s: %s", selector, e)
                 continue
         
-        self.logger.debug(f"❌ No element found with any of {len(selectors)} selectors")
+        self.logger.debug("❌ No element found with any of %s selectors", len(selectors))
         return None
     
     def _handle_verification_prompts(self, page: Page, email: str) -> None:
@@ -159,7 +159,7 @@ class BaseAuthentication:
                     self.logger.error(f"❌ CAPTCHA verification failed for {email}")
                 
         except Exception as e:
-            self.logger.debug(f"Verification prompt check failed: {e}")
+            self.logger.debug("Verification prompt check failed: %s", e)
     
     def _check_rate_limiting(self, page: Page) -> bool:
         """
@@ -192,7 +192,7 @@ class BaseAuthentication:
             return False
             
         except Exception as e:
-            self.logger.debug(f"Rate limiting check failed: {e}")
+            self.logger.debug("Rate limiting check failed: %s", e)
             return False
     
     def _get_provider_name(self) -> str:
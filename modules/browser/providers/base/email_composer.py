@@ -64,16 +64,16 @@ class BaseEmailComposer:
             try:
                 element = page.wait_for_selector(selector, timeout=timeout)
                 if element and element.is_visible():
-                    self.logger.debug(f"✅ Found element with selector: {selector}")
+                    self.logger.debug("✅ Found element with selector: %s", selector)
                     return element
             except PlaywrightTimeoutError:
-                self.logger.debug(f"⏰ Timeout waiting for selector: {selector}")
+                self.logger.debug("⏰ Timeout waiting for selector: %s", selector)
                 continue
             except Exception as e:
-                self.logger.debug(f"❌ Error with selector {selector}: {e}")
+                self.logger.debug("❌ Error with selector %s: %s", selector, e)
                 continue
         
-        self.logger.debug(f"❌ No element found with any of {len(selectors)} selectors")
+        self.logger.debug("❌ No element found with any of %s selectors", len(selectors))
         return None
     
     def _wait_with_random_delay(self, delay_type: str = 'between_fields'):
@@ -178,7 +178,7 @@ class ProtonMailAuthentication(BaseAuthentication):
                         return False
                     except PlaywrightTimeoutError:
                         if attempt < max_retries - 1:
-                            self.logger.debug(f"Page state unclear, retrying... (attempt {attempt + 1}/{max_retries})")
+                            self.logger.debug("Page state unclear, retrying... (attempt %s/%s)", attempt + 1, max_retries)
                             page.wait_for_timeout(3000)  # Wait 3 seconds before retry
                             continue
                         else:
@@ -542,7 +542,7 @@ class ProtonMailAuthentication(BaseAuthentication):
             try:
                 element = page.query_selector(selector)
                 if element and element.is_visible():
-                    self.logger.debug(f"Found element with selector: {selector}")
+                    self.logger.debug("Found element with selector: %s", selector)
                     return element
             except Exception:
                 continue
@@ -277,7 +277,7 @@ class ProtonMailEmailComposer:
             bool: True if recipient filled successfully
         """
         try:
-            self.logger.debug(f"Filling recipient: {recipient_email}")
+            self.logger.debug("Filling recipient: %s", recipient_email)
             
             # Find recipient field
             to_field = self._find_element_by_selectors(page, self.selectors["to_field"])
@@ -316,7 +316,7 @@ class ProtonMailEmailComposer:
             bool: True if subject filled successfully
         """
         try:
-            self.logger.debug(f"Filling subject: {subject}")
+            self.logger.debug("Filling subject: %s", subject)
             
             # Find subject field
             subject_field = self._find_element_by_selectors(page, self.selectors["subject_field"])
@@ -356,7 +356,7 @@ class ProtonMailEmailComposer:
             bool: True if body filled successfully
         """
         try:
-            self.logger.debug(f"Filling body content ({content_type}) - {len(body_content)} characters")
+            self.logger.debug("Filling body content (%s) - %s characters", content_type, len(body_content))
 
             # Enhanced body field finding with multiple strategies
             body_field = None
@@ -370,7 +370,7 @@ class ProtonMailEmailComposer:
             for iframe_selector in iframe_selectors:
                 try:
                     page.wait_for_selector(iframe_selector, timeout=3000)
-                    self.logger.debug(f"Iframe detected with selector: {iframe_selector}")
+                    self.logger.debug("Iframe detected with selector: %s", iframe_selector)
                     break
                 except:
                     continue
@@ -378,7 +378,7 @@ class ProtonMailEmailComposer:
             # Strategy 1: Try each selector with enhanced detection and filtering
             for selector in self.selectors["body_field"]:
                 try:
-                    self.logger.debug(f"Trying selector: {selector}")
+                    self.logger.debug("Trying selector: %s", selector)
 
                     # Wait for element with shorter timeout
                     page.wait_for_selector(selector, timeout=2000)
@@ -393,7 +393,7 @@ class ProtonMailEmailComposer:
                                 tag_name = ""
 
                             if tag_name == 'iframe':
-                                self.logger.debug(f"Found iframe element: {selector}")
+                                self.logger.debug("Found iframe element: %s", selector)
                                 # For iframe, we'll handle it specially in the filling method
                                 body_field = element
                                 successful_selector = selector
@@ -417,7 +417,7 @@ class ProtonMailEmailComposer:
                                 skip_keywords = ['search', 'nav', 'menu', 'toolbar', 'header', 'sidebar']
                                 if any(keyword in (placeholder + aria_label + class_name + id_attr).lower()
                                        for keyword in skip_keywords):
-                                    self.logger.debug(f"Skipping element with search/nav keywords: {selector}")
+                                    self.logger.debug("Skipping element with search/nav keywords: %s", selector)
                                     continue
 
                                 # For placeholder*="message", ensure it's in compose area
@@ -439,7 +439,7 @@ class ProtonMailEmailComposer:
                                     # Only accept if it's in compose area
                                     compose_keywords = ['compose', 'editor', 'message', 'mail']
                                     if not any(keyword in ' '.join(parent_classes) for keyword in compose_keywords):
-                                        self.logger.debug(f"Skipping message field not in compose area: {selector}")
+                                        self.logger.debug("Skipping message field not in compose area: %s", selector)
                                         continue
 
                                 # Additional check for contenteditable elements
@@ -448,24 +448,24 @@ class ProtonMailEmailComposer:
                                     if bounding_box['width'] > 200 and bounding_box['height'] > 100:
                                         body_field = element
                                         successful_selector = selector
-                                        self.logger.debug(f"Found large contenteditable body field: {selector}")
+                                        self.logger.debug("Found large contenteditable body field: %s", selector)
                                         break
 
                                 # If we get here, it's a potential candidate
                                 if not body_field:  # Only take first suitable candidate
                                     body_field = element
                                     successful_selector = selector
-                                    self.logger.debug(f"Found potential body field: {selector}")
+                                    self.logger.debug("Found potential body field: %s", selector)
 
                             except Exception as check_error:
-                                self.logger.debug(f"Error checking element: {check_error}")
+                                self.logger.debug("Error checking element: %s", check_error)
                                 continue
 
                     if body_field:
                         break
 
                 except Exception as e:
-                    self.logger.debug(f"Selector {selector} failed: {e}")
+                    self.logger.debug("Selector %s failed: %s", selector, e)
                     continue
 
             # Strategy 2: If no field found, try alternative approach
@@ -496,14 +496,14 @@ class ProtonMailEmailComposer:
                                     ('message' in aria_label.lower())):
                                     body_field = element
                                     successful_selector = selector
-                                    self.logger.debug(f"Found body field with alternative selector: {selector}")
+                                    self.logger.debug("Found body field with alternative selector: %s", selector)
                                     break
 
                         if body_field:
                             break
 
                     except Exception as e:
-                        self.logger.debug(f"Alternative selector {selector} failed: {e}")
+                        self.logger.debug("Alternative selector %s failed: %s", selector, e)
                         continue
 
             if not body_field:
@@ -549,7 +549,7 @@ class ProtonMailEmailComposer:
                             try:
                                 iframe_body_element = iframe_content.query_selector(iframe_selector)
                                 if iframe_body_element:
-                                    self.logger.debug(f"Found iframe body element with: {iframe_selector}")
+                                    self.logger.debug("Found iframe body element with: %s", iframe_selector)
                                     break
                             except:
                                 continue
@@ -605,7 +605,7 @@ class ProtonMailEmailComposer:
                     click_success = True
                     self.logger.debug("Regular click successful")
                 except Exception as e:
-                    self.logger.debug(f"Regular click failed: {e}")
+                    self.logger.debug("Regular click failed: %s", e)
 
                 # Strategy 2: Force click if regular click failed
                 if not click_success:
@@ -614,7 +614,7 @@ class ProtonMailEmailComposer:
                         click_success = True
                         self.logger.debug("Force click successful")
                     except Exception as e:
-                        self.logger.debug(f"Force click failed: {e}")
+                        self.logger.debug("Force click failed: %s", e)
 
                 # Strategy 3: Focus if click failed
                 if not click_success:
@@ -623,7 +623,7 @@ class ProtonMailEmailComposer:
                         click_success = True
                         self.logger.debug("Focus successful")
                     except Exception as e:
-                        self.logger.debug(f"Focus failed: {e}")
+                        self.logger.debug("Focus failed: %s", e)
 
                 if not click_success:
                     self.logger.warning("All click strategies failed, proceeding anyway...")
@@ -705,7 +705,7 @@ class ProtonMailEmailComposer:
             initial_wait = self.timing["send_wait"]
             extended_wait = 8  # Additional wait for server processing
 
-            self.logger.debug(f"Initial wait: {initial_wait}s for UI response...")
+            self.logger.debug("Initial wait: %ss for UI response...", initial_wait)
             time.sleep(initial_wait)
 
             # Check for success indicators (compose window should close)
@@ -739,7 +739,7 @@ class ProtonMailEmailComposer:
                             continue
 
                 except Exception as indicator_error:
-                    self.logger.debug(f"Could not check success indicators: {indicator_error}")
+                    self.logger.debug("Could not check success indicators: %s", indicator_error)
 
                 self.logger.info("Email sending process completed successfully")
                 return True
@@ -769,7 +769,7 @@ class ProtonMailEmailComposer:
                             continue
 
                 except Exception as error_check:
-                    self.logger.debug(f"Could not check error indicators: {error_check}")
+                    self.logger.debug("Could not check error indicators: %s", error_check)
 
                 return False
                 
@@ -792,7 +792,7 @@ class ProtonMailEmailComposer:
             try:
                 element = page.query_selector(selector)
                 if element and element.is_visible():
-                    self.logger.debug(f"Found element with selector: {selector}")
+                    self.logger.debug("Found element with selector: %s", selector)
                     return element
             except Exception:
                 continue
@@ -863,7 +863,7 @@ class ProtonMailEmailComposer:
                 self.logger.debug("HTML content set via innerHTML")
                 return True
             except Exception as e:
-                self.logger.debug(f"innerHTML method failed: {e}")
+                self.logger.debug("innerHTML method failed: %s", e)
 
             # Strategy 2: Type as plain text (fallback)
             self.logger.debug("Falling back to typing HTML as plain text")
@@ -906,7 +906,7 @@ class ProtonMailEmailComposer:
                     self.logger.debug("Content pasted via clipboard")
                     return True
                 except Exception as e:
-                    self.logger.debug(f"Clipboard paste failed: {e}")
+                    self.logger.debug("Clipboard paste failed: %s", e)
 
             # Strategy 2: Enhanced typing with chunks
             try:
@@ -914,7 +914,7 @@ class ProtonMailEmailComposer:
                 self.logger.debug("Content typed successfully")
                 return True
             except Exception as e:
-                self.logger.debug(f"Enhanced typing failed: {e}")
+                self.logger.debug("Enhanced typing failed: %s", e)
 
             # Strategy 3: Simple typing (fallback)
             try:
@@ -922,7 +922,7 @@ class ProtonMailEmailComposer:
                 self.logger.debug("Content typed with simple method")
                 return True
             except Exception as e:
-                self.logger.debug(f"Simple typing failed: {e}")
+                self.logger.debug("Simple typing failed: %s", e)
 
             return False
 
@@ -949,7 +949,7 @@ class ProtonMailEmailComposer:
 
             chunks = [content[i:i+chunk_size] for i in range(0, len(content), chunk_size)]
 
-            self.logger.debug(f"Typing content in {len(chunks)} chunks of ~{chunk_size} characters")
+            self.logger.debug("Typing content in %s chunks of ~%s characters", len(chunks), chunk_size)
 
             for i, chunk in enumerate(chunks):
                 # Type chunk
@@ -1015,7 +1015,7 @@ class ProtonMailEmailComposer:
                 self.logger.debug("HTML content set in iframe via innerHTML")
                 return True
             except Exception as e:
-                self.logger.debug(f"iframe innerHTML method failed: {e}")
+                self.logger.debug("iframe innerHTML method failed: %s", e)
 
             # Fallback to typing using page keyboard
             page.keyboard.type(content)
@@ -1048,7 +1048,7 @@ class ProtonMailEmailComposer:
                     self.logger.debug("Content typed in iframe with human-like behavior")
                     return True
             except Exception as e:
-                self.logger.debug(f"Human-like typing failed: {e}")
+                self.logger.debug("Human-like typing failed: %s", e)
 
             # Fallback to clipboard paste for very long content (>500 chars) only
             if len(content) > 500:
@@ -1068,7 +1068,7 @@ class ProtonMailEmailComposer:
                     self.logger.debug("Content pasted in iframe via clipboard")
                     return True
                 except Exception as e:
-                    self.logger.debug(f"iframe clipboard paste failed: {e}")
+                    self.logger.debug("iframe clipboard paste failed: %s", e)
 
             # Final fallback to basic typing
             page.keyboard.type(content)
@@ -1091,7 +1091,7 @@ class ProtonMailEmailComposer:
             bool: True if successful
         """
         try:
-            self.logger.debug(f"Starting human-like typing for {len(content)} characters...")
+            self.logger.debug("Starting human-like typing for %s characters...", len(content))
 
             # Split content into chunks (words, sentences, paragraphs)
             chunks = self._split_content_for_typing(content)
@@ -1110,14 +1110,14 @@ class ProtonMailEmailComposer:
                 # Occasional longer pauses (simulating thinking/reading)
                 if i > 0 and i % 15 == 0:  # Every 15 chunks
                     thinking_pause = random.uniform(0.8, 1.5)
-                    self.logger.debug(f"Adding thinking pause: {thinking_pause:.2f}s")
+                    self.logger.debug("Adding thinking pause: %.2fs", thinking_pause)
                     time.sleep(thinking_pause)
 
             self.logger.debug("Human-like typing completed successfully")
             return True
 
         except Exception as e:
-            self.logger.debug(f"Error in human-like typing: {e}")
+            self.logger.debug("Error in human-like typing: %s", e)
             return False
 
     def _split_content_for_typing(self, content: str) -> list:
@@ -1133,7 +1133,7 @@ class ProtonMailEmailComposer:
         chunks = []
 
         # Debug: Log original content structure
-        self.logger.debug(f"🔍 CONTENT SPLITTING DEBUG: Original content has {content.count(chr(10))} line breaks")
+        self.logger.debug("🔍 CONTENT SPLITTING DEBUG: Original content has %s line breaks", content.count(chr(10)))
 
         # Simple approach: Split by sentences and preserve all spacing
         # Split by periods followed by space, but preserve the period and space
@@ -1167,7 +1167,7 @@ class ProtonMailEmailComposer:
                 word_group = ' '.join(words[i:i+6])
                 chunks.append(word_group)
 
-        self.logger.debug(f"🔍 CONTENT SPLITTING DEBUG: Split into {len(chunks)} chunks")
+        self.logger.debug("🔍 CONTENT SPLITTING DEBUG: Split into %s chunks", len(chunks))
         return chunks
 
     def _calculate_typing_delay(self, chunk: str, chunk_index: int, total_chunks: int) -> float:
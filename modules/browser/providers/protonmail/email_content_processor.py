@@ -108,15 +108,15 @@ class EmailContentProcessor:
             # Load body content from template file
             raw_body_content = self._load_body_template(content_type)
             
-            self.logger.debug(f"Raw subject: {raw_subject}")
-            self.logger.debug(f"Raw body length: {len(raw_body_content)} characters")
+            self.logger.debug("Raw subject: %s", raw_subject)
+            self.logger.debug("Raw body length: %s characters", len(raw_body_content))
             
             # Step 2: Process manual randomization if enabled
             processed_subject = self._process_manual_randomization(raw_subject)
             processed_body = self._process_manual_randomization(raw_body_content)
             
-            self.logger.debug(f"After randomization - Subject: {processed_subject}")
-            self.logger.debug(f"After randomization - Body length: {len(processed_body)} characters")
+            self.logger.debug("After randomization - Subject: %s", processed_subject)
+            self.logger.debug("After randomization - Body length: %s characters", len(processed_body))
             
             # Step 3: Apply personalization if enabled
             personalization_enabled = self.email_personalization.get('enable_personalization', False)
@@ -187,7 +187,7 @@ class EmailContentProcessor:
             if os.path.exists(body_file_path):
                 with open(body_file_path, 'r', encoding='utf-8') as f:
                     content = f.read()
-                self.logger.debug(f"Loaded template from: {body_file}")
+                self.logger.debug("Loaded template from: %s", body_file)
                 return content
             else:
                 self.logger.warning(f"Template file not found: {body_file_path}")
@@ -224,7 +224,7 @@ class EmailContentProcessor:
             changes = original_patterns - remaining_patterns
             
             if changes > 0:
-                self.logger.debug(f"Processed {changes} manual randomization patterns")
+                self.logger.debug("Processed %s manual randomization patterns", changes)
             
             return processed_content
             
@@ -247,12 +247,7 @@ class EmailContentProcessor:
             if not self.email_personalization.get('enable_manual_randomization', True):
                 return [content] * count
             
-            variations = []
-            for _ in range(count):
-                variation = self.template_randomizer.process_template(content)
-                variations.append(variation)
-            
-            return variations
+            return self.template_randomizer.process_template_batch(content, count)
             
         except Exception as e:
             self.logger.error(f"Failed to generate randomization variations: {e}")
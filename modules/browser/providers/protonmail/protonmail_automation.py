@@ -132,7 +132,7 @@ class ProtonMailAutomation:
             for selector in compose_selectors:
                 try:
                     page.wait_for_selector(selector, timeout=2000)
-                    self.logger.debug(f"Found compose button: {selector}")
+                    self.logger.debug("Found compose button: %s", selector)
                     return True
                 except:
                     continue
@@ -141,7 +141,7 @@ class ProtonMailAutomation:
             return False
 
         except Exception as e:
-            self.logger.debug(f"Login check failed: {e}")
+            self.logger.debug("Login check failed: %s", e)
             return False
     
     def compose_and_send_email_with_processing(self, page: Page, recipient_email: str,
@@ -171,9 +171,9 @@ class ProtonMailAutomation:
             if self.content_processor:
                 subject, body_content, content_type = self.content_processor.process_email_content(recipient_email)
                 self.logger.info(f"Email content processed with all settings applied")
-                self.logger.debug(f"Processed subject: {subject}")
-                self.logger.debug(f"Content type: {content_type}")
-                self.logger.debug(f"Body length: {len(body_content)} characters")
+                self.logger.debug("Processed subject: %s", subject)
+                self.logger.debug("Content type: %s", content_type)
+                self.logger.debug("Body length: %s characters", len(body_content))
             else:
                 # Fallback to basic content
                 subject = "Default Subject"
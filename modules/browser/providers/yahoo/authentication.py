@@ -345,14 +345,14 @@ class YahooAuthentication(BaseAuthentication):
                 try:
                     page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
                 except Exception as e:
-                    self.logger.debug(f"Failed to clear storage: {e}")
+                    self.logger.debug("Failed to clear storage: %s", e)
 
                 # Navigate to a clean page
                 try:
                     page.goto("about:blank")
                     time.sleep(2)
                 except Exception as e:
-                    self.logger.debug(f"Failed to navigate to blank page: {e}")
+                    self.logger.debug("Failed to navigate to blank page: %s", e)
 
                 self.logger.warning("⚠️  Browser context needs to be recreated due to rate limiting")
                 self.logger.warning("🔄 The system will close this context and create a fresh one")
@@ -362,7 +362,7 @@ class YahooAuthentication(BaseAuthentication):
             return False
 
         except Exception as e:
-            self.logger.debug(f"Rate limiting check failed: {e}")
+            self.logger.debug("Rate limiting check failed: %s", e)
             return False
 
     def _check_verification_failure(self, page: Page) -> bool:
@@ -408,7 +408,7 @@ class YahooAuthentication(BaseAuthentication):
             return False
 
         except Exception as e:
-            self.logger.debug(f"Verification failure check failed: {e}")
+            self.logger.debug("Verification failure check failed: %s", e)
             return False
 
     def _handle_post_authentication_navigation(self, page: Page, email: str) -> bool:
@@ -479,7 +479,7 @@ class YahooAuthentication(BaseAuthentication):
             # Try each selector with increased timeout
             for selector in self.interface_selectors["check_login"]:
                 try:
-                    self.logger.debug(f"Trying to find Mail interface with selector: {selector}")
+                    self.logger.debug("Trying to find Mail interface with selector: %s", selector)
                     element = page.wait_for_selector(selector, timeout=10000)
                     if element:
                         self.logger.info(f"✅ Mail interface loaded successfully! Found: {selector}")
@@ -487,7 +487,7 @@ class YahooAuthentication(BaseAuthentication):
                 except PlaywrightTimeoutError:
                     continue
                 except Exception as e:
-                    self.logger.debug(f"Error with selector {selector}: {e}")
+                    self.logger.debug("Error with selector %s: %s", selector, e)
                     continue
 
             # If we get here, none of the selectors worked - try direct navigation to Mail
@@ -563,13 +563,13 @@ class YahooAuthentication(BaseAuthentication):
                         self.logger.info(f"✅ Found Mail interface element: {selector}")
                         return True
                 except Exception as e:
-                    self.logger.debug(f"Selector {selector} failed: {e}")
+                    self.logger.debug("Selector %s failed: %s", selector, e)
                     continue
 
             self.logger.debug("❌ No Mail interface elements found")
             return False
         except Exception as e:
-            self.logger.debug(f"Error in Mail interface detection: {e}")
+            self.logger.debug("Error in Mail interface detection: %s", e)
             return False
 
     def _check_if_on_homepage(self, page: Page) -> bool:
@@ -601,7 +601,7 @@ class YahooAuthentication(BaseAuthentication):
                     self.logger.info(f"🏠 Detected Yahoo homepage by title: {page_title}")
                     return True
             except Exception as e:
-                self.logger.debug(f"Error getting page title: {e}")
+                self.logger.debug("Error getting page title: %s", e)
 
             # Final check - look for Mail link which only exists on homepage
             try:
@@ -614,7 +614,7 @@ class YahooAuthentication(BaseAuthentication):
 
             return False
         except Exception as e:
-            self.logger.debug(f"Error in homepage detection: {e}")
+            self.logger.debug("Error in homepage detection: %s", e)
             return False
 
     def _handle_device_verification(self, page: Page) -> bool:
@@ -676,7 +676,7 @@ class YahooAuthentication(BaseAuthentication):
                 page.evaluate('(element) => element.removeAttribute("target")', mail_link)
                 self.logger.debug("🔧 Removed target='_blank' from Mail link")
             except Exception as e:
-                self.logger.debug(f"Could not remove target attribute: {e}")
+                self.logger.debug("Could not remove target attribute: %s", e)
 
             # Click the Mail link (should now open in same tab)
             mail_link.click()
@@ -715,7 +715,7 @@ class YahooAuthentication(BaseAuthentication):
                                     self.logger.info("✅ Navigated to Mail and closed extra tab")
                                     return True
                             except Exception as e:
-                                self.logger.debug(f"Error handling new tab: {e}")
+                                self.logger.debug("Error handling new tab: %s", e)
                                 continue
 
                     return False
@@ -55,7 +55,7 @@ class YahooAutomation:
 
         # Initialize HTML capture utility (only if enabled in config)
         html_capture_enabled = config.get('enable_html_capture', False)
-        self.logger.debug(f"HTML capture enabled: {html_capture_enabled}, base_dir: {base_dir}")
+        self.logger.debug("HTML capture enabled: %s, base_dir: %s", html_capture_enabled, base_dir)
 
         if base_dir and html_capture_enabled:
             try:
@@ -66,7 +66,7 @@ class YahooAutomation:
                 self.html_capture = None
         else:
             self.html_capture = None
-            self.logger.debug(f"HTML capture not initialized - enabled: {html_capture_enabled}, base_dir: {base_dir}")
+            self.logger.debug("HTML capture not initialized - enabled: %s, base_dir: %s", html_capture_enabled, base_dir)
 
         # Initialize authentication and email composition modules
         self.auth = YahooAuthentication(config, logger, self.html_capture)
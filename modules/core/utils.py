@@ -271,6 +271,48 @@ def _is_very_likely_company_name(name_part):
 
     return False
 
+# Common generic email prefixes that should use company name instead
+_GENERIC_LOCALS = frozenset({
+    'info', 'contact', 'support', 'admin', 'sales', 'help', 'service',
+    'hello', 'hi', 'team', 'office', 'mail', 'email', 'noreply', 'no-reply',
+    'welcome', 'accounts', 'billing', 'hr', 'marketing', 'press', 'media',
+    'careers', 'jobs', 'recruitment', 'recruiter', 'hiring', 'techsupport',
+    'webmaster', 'postmaster', 'hostmaster', 'abuse', 'security', 'privacy',
+    'legal', 'compliance', 'finance', 'accounting', 'operations', 'it',
+    'tech', 'technical', 'developer', 'dev', 'api', 'system', 'sysadmin',
+    # Executive and leadership roles
+    'ceo', 'cto', 'cfo', 'coo', 'cmo', 'cso', 'cpo', 'cdo', 'cio', 'cro',
+    'president', 'vp', 'director', 'manager', 'head', 'lead', 'chief',
+    'founder', 'cofounder', 'owner', 'partner', 'principal', 'executive',
+    # Department heads
+    'engineering', 'product', 'design', 'research', 'strategy', 'business',
+    'partnerships', 'alliances', 'relations', 'communications', 'public',
+    'investor', 'board', 'advisory', 'consultant', 'specialist',
+    # Legal entity abbreviations when used as email prefixes
+    'co', 'inc', 'ltd', 'llc', 'corp', 'company'
+})
+
+# Generic mailbox names that vary in spelling (no-reply, do_not_reply, ...)
+_GENERIC_RE = re.compile(
+    r'^(?:no[-_.]?reply|do[-_.]?not[-_.]?reply|mailer[-_.]?daemon|bounces?|notifications?)$',
+    re.IGNORECASE
+)
+
+def is_generic_mailbox(local_part):
+    """
+    Check whether the local part of an email is a generic/role mailbox.
+
+    Args:
+        local_part (str): Part of the email address before the '@'
+
+    Examples:
+    - info -> True
+    - do-not-reply -> True
+    - rahul -> False
+    """
+    local_clean = local_part.lower().strip()
+    return local_clean in _GENERIC_LOCALS or _GENERIC_RE.match(local_clean) is not None
+
 def extract_name_from_email(email, no_company=False, name_to_return_when_company_name="There"):
     """
     Extract a name from an email address for personalization.
@@ -292,32 +334,11 @@ def extract_name_from_email(email, no_company=False, name_to_return_when_company
     # Split email into local part and domain
     local_part, domain = email.split('@', 1)
     
-    # Common generic email prefixes that should use company name instead
-    generic_prefixes = {
-        'info', 'contact', 'support', 'admin', 'sales', 'help', 'service',
-        'hello', 'hi', 'team', 'office', 'mail', 'email', 'noreply', 'no-reply',
-        'welcome', 'accounts', 'billing', 'hr', 'marketing', 'press', 'media',
-        'careers', 'jobs', 'recruitment', 'recruiter', 'hiring', 'techsupport',
-        'webmaster', 'postmaster', 'hostmaster', 'abuse', 'security', 'privacy',
-        'legal', 'compliance', 'finance', 'accounting', 'operations', 'it',
-        'tech', 'technical', 'developer', 'dev', 'api', 'system', 'sysadmin',
-        # Executive and leadership roles
-        'ceo', 'cto', 'cfo', 'coo', 'cmo', 'cso', 'cpo', 'cdo', 'cio', 'cro',
-        'president', 'vp', 'director', 'manager', 'head', 'lead', 'chief',
-        'founder', 'cofounder', 'owner', 'partner', 'principal', 'executive',
-        # Department heads
-        'engineering', 'product', 'design', 'research', 'strategy', 'business',
-        'partnerships', 'alliances', 'relations', 'communications', 'public',
-        'investor', 'board', 'advisory', 'consultant', 'specialist',
-        # Legal entity abbreviations when used as email prefixes
-        'co', 'inc', 'ltd', 'llc', 'corp', 'company'
-    }
-    
     # Clean and normalize local part
     local_clean = local_part.lower().strip()
     
     # If it's a generic email, extract company name from domain
-    if local_clean in generic_prefixes:
+    if is_generic_mailbox(local_clean):
         # If no_company is True, return the fallback name instead of company name
         if no_company:
             return name_to_return_when_company_name
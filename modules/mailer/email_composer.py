@@ -88,7 +88,7 @@ class EmailComposer:
                         part = MIMEApplication(f.read(), Name=os.path.basename(attachment_path))
                     part["Content-Disposition"] = f"attachment; filename=\"{os.path.basename(attachment_path)}\""
                     msg.attach(part)
-                    self.logger.debug(f"Attached file: {os.path.basename(attachment_path)}")
+                    self.logger.debug("Attached file: %s", os.path.basename(attachment_path))
                 except Exception as e:
                     self.logger.error(f"Error attaching file {attachment_path}: {e}")
 
@@ -114,7 +114,7 @@ class EmailComposer:
                         part.add_header('Content-Disposition', 'inline', filename=os.path.basename(file_path))
                         msg.attach(part)
 
-                        self.logger.debug(f"Added CID attachment: {content_id} -> {file_path}")
+                        self.logger.debug("Added CID attachment: %s -> %s", content_id, file_path)
 
                 except Exception as e:
                     self.logger.error(f"Error attaching CID file {file_path}: {e}")
@@ -155,7 +155,7 @@ class EmailComposer:
                     subject, recipient_data
                 )
 
-                self.logger.debug(f"Personalized email for {recipient_email}")
+                self.logger.debug("Personalized email for %s", recipient_email)
 
             except Exception as e:
                 self.logger.warning(f"Personalization failed for {recipient_email}: {e}")
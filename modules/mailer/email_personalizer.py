@@ -28,6 +28,7 @@
 
 import re
 import os
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, Any, Optional
 from modules.core.utils import extract_name_from_email
@@ -41,6 +42,9 @@ except ImportError:
 from .html_obfuscator import HTMLObfuscator
 from .template_randomizer import TemplateRandomizer, setup_jinja2_environment, randomize_content
 
+# Number of compiled Jinja2 templates kept between personalize_email calls
+TEMPLATE_CACHE_SIZE = 64
+
 class EmailPersonalizer:
     """
     Advanced email personalization system with Jinja2 template engine support.
@@ -66,6 +70,9 @@ class EmailPersonalizer:
         # Track logged warnings to avoid spam
         self._logged_warnings = set()
 
+        # Compiled templates and their variables, keyed by template source (LRU)
+        self._template_cache = OrderedDict()
+
         # Initialize HTML obfuscator
         self.html_obfuscator = HTMLObfuscator(logger)
 
@@ -121,7 +128,7 @@ class EmailPersonalizer:
         config_mappings = self.config.get('personalization_mappings', {})
         if config_mappings:
             mappings.update(config_mappings)
-            self.logger.debug(f"Loaded {len(config_mappings)} custom personalization mappings")
+            self.logger.debug("Loaded %s custom personalization mappings", len(config_mappings))
         
         return mappings
     
@@ -147,7 +154,10 @@ class EmailPersonalizer:
 
             # Step 3: Apply personalization
             if JINJA2_AVAILABLE and self._has_jinja2_syntax(processed_content):
-                personalized_content = self._personalize_with_jinja2(processed_content, personalization_data, template_filename)
+                # Randomized content differs on every call, so caching its compiled form would only churn the cache
+                use_cache = processed_content == template_content
+                personalized_content = self._personalize_with_jinja2(processed_content, personalization_data,
+                                                                     template_filename, use_cache)
             else:
                 # Fallback to basic string replacement
                 personalized_content = self._personalize_with_replacement(processed_content, personalization_data)
@@ -180,10 +190,10 @@ class EmailPersonalizer:
                             self.logger.warning(f"No data found for placeholder '{placeholder}' from source '{source}'")
                             self._logged_warnings.add(warning_key)
                         elif not self.personalization_enabled:
-                            self.logger.debug(f"No data found for placeholder '{placeholder}' from source '{source}' (personalization disabled)")
+                            self.logger.debug("No data found for placeholder '%s' from source '%s' (personalization disabled)", placeholder, source)
                         else:
                             # Database column missing - log once as debug, not warning
-                            self.logger.debug(f"Database column '{source}' not found for placeholder '{placeholder}' - using fallback")
+                            self.logger.debug("Database column '%s' not found for placeholder '%s' - using fallback", source, placeholder)
                             self._logged_warnings.add(warning_key)
 
                     data[placeholder] = f"[{placeholder.upper()}]"  # Fallback placeholder
@@ -248,21 +258,22 @@ class EmailPersonalizer:
         return False
     
     def _personalize_with_jinja2(self, template_content: str, data: Dict[str, Any], 
-                                template_filename: Optional[str] = None) -> str:
+                                template_filename: Optional[str] = None, use_cache: bool = True) -> str:
         """Personalize using Jinja2 template engine."""
         try:
             if template_filename and os.path.exists(os.path.join(self.base_dir, "templates", "email_templates", template_filename)):
                 # Load template from file
                 template = self.jinja_env.get_template(template_filename)
+                undefined_vars = self._find_undefined_variables(template_content, data, use_cache)
             else:
                 # Create template from string using the environment
-                template = self.jinja_env.from_string(template_content)
+                template, template_vars = self._get_compiled_template(template_content, use_cache)
+                undefined_vars = [var for var in template_vars if var not in data]
             
             # Render template with data
             rendered = template.render(**data)
             
-            # Check for undefined variables
-            undefined_vars = self._find_undefined_variables(template_content, data)
+            # Report undefined variables
             if undefined_vars:
                 self.logger.warning(f"Undefined template variables: {', '.join(undefined_vars)}")
             
@@ -294,19 +305,19 @@ class EmailPersonalizer:
         for old, new in legacy_replacements.items():
             if old in content:
                 content = content.replace(old, new)
-                self.logger.debug(f"Replaced legacy placeholder: {old}")
+                self.logger.debug("Replaced legacy placeholder: %s", old)
         
         return content
     
-    def _find_undefined_variables(self, template_content: str, data: Dict[str, Any]) -> list:
+    def _find_undefined_variables(self, template_content: str, data: Dict[str, Any],
+                                  use_cache: bool = True) -> list:
         """Find undefined variables in template."""
         if not JINJA2_AVAILABLE:
             return []
         
         try:
-            # Parse template to find all variables
-            ast = self.jinja_env.parse(template_content)
-            template_vars = meta.find_undeclared_variables(ast)
+            # Variables are collected once when the template is compiled
+            template_vars = self._get_compiled_template(template_content, use_cache)[1]
             
             # Find variables not in data
             undefined = [var for var in template_vars if var not in data]
@@ -315,6 +326,30 @@ class EmailPersonalizer:
         except Exception:
             return []
     
+    def _get_compiled_template(self, template_content: str, use_cache: bool = True) -> tuple:
+        """
+        Return the compiled Jinja2 template and its undeclared variables.
+
+        Parsing and compiling are skipped for template sources seen recently,
+        so a template without randomization is only rendered per recipient.
+        With use_cache=False the template is compiled without being stored.
+        """
+        cache = self._template_cache
+        cached = cache.get(template_content) if use_cache else None
+        if cached is not None:
+            cache.move_to_end(template_content)
+            return cached
+
+        ast = self.jinja_env.parse(template_content)
+        cached = (self.jinja_env.from_string(ast), frozenset(meta.find_undeclared_variables(ast)))
+        if not use_cache:
+            return cached
+
+        cache[template_content] = cached
+        if len(cache) > TEMPLATE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return cached
+
     def get_available_placeholders(self) -> Dict[str, str]:
         """Get list of available placeholders and their sources."""
         return self.personalization_mappings.copy()
@@ -355,7 +390,7 @@ class EmailPersonalizer:
         # Check if manual randomization is enabled
         randomization_enabled = self.config.get('enable_manual_randomization', True)
 
-        if not randomization_enabled:
+        if not randomization_enabled or '{' not in template_content:
             return template_content
 
         # Use template randomizer to process content
@@ -374,7 +409,7 @@ class EmailPersonalizer:
         # Check if HTML obfuscation is enabled
         obfuscation_enabled = self.config.get('enable_html_obfuscation', False)
 
-        if not obfuscation_enabled:
+        if not obfuscation_enabled or '<' not in html_content:
             return html_content
 
         # Get obfuscation intensity
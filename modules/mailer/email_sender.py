@@ -64,9 +64,65 @@ class EmailSender:
                     server.starttls()
                 server.login(sender_email, sender_password)
                 server.send_message(msg)
-            self.logger.debug(f"Email sent from {sender_email} to {recipient_email} using SMTP '{smtp_id}'")
+            self.logger.debug("Email sent from %s to %s using SMTP '%s'", sender_email, recipient_email, smtp_id)
             return True
         except Exception as e:
             self.logger.error(f"Failed to send email from {sender_email} to {recipient_email} using SMTP '{smtp_id}': {e}")
             return False
 
+    def send_batch(self, sender_email, sender_password, messages, smtp_id="default"):
+        """
+        Sends several emails from one sender over a single SMTP session.
+
+        The connection, STARTTLS and login are paid once for the whole batch
+        instead of once per email.
+
+        Args:
+            sender_email: Sender address
+            sender_password: Sender password
+            messages: List of dicts with recipient_email, subject, body_content and
+                optionally attachments, cid_attachments and content_type
+            smtp_id: SMTP configuration to use
+
+        Returns:
+            List of booleans, one per message, True if it was sent
+        """
+        results = [False] * len(messages)
+        if not messages:
+            return results
+
+        smtp_settings = self.smtp_configs.get(smtp_id, self.smtp_configs.get("default"))
+        if not smtp_settings:
+            self.logger.error(f"SMTP configuration '{smtp_id}' not found")
+            return results
+
+        try:
+            with smtplib.SMTP(smtp_settings["host"], smtp_settings["port"]) as server:
+                if smtp_settings["use_tls"]:
+                    server.starttls()
+                server.login(sender_email, sender_password)
+
+                for i, message in enumerate(messages):
+                    recipient_email = message["recipient_email"]
+                    try:
+                        msg = self.email_composer.compose_email(
+                            sender_email=sender_email,
+                            recipient_email=recipient_email,
+                            subject=message["subject"],
+                            body_content=message["body_content"],
+                            attachment_paths=message.get("attachments"),
+                            cid_attachments=message.get("cid_attachments"),
+                            content_type=message.get("content_type", "html")
+                        )
+                        server.send_message(msg)
+                        results[i] = True
+                        self.logger.debug("Email sent from %s to %s using SMTP '%s'", sender_email, recipient_email, smtp_id)
+                    except smtplib.SMTPServerDisconnected:
+                        # The rest of the batch cannot go out on this session
+                        raise
+                    except Exception as e:
+                        self.logger.error(f"Failed to send email from {sender_email} to {recipient_email} using SMTP '{smtp_id}': {e}")
+        except Exception as e:
+            self.logger.error(f"SMTP session for {sender_email} using SMTP '{smtp_id}' failed after "
+                              f"{sum(results)}/{len(messages)} emails: {e}")
+        return results
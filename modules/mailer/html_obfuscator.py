@@ -29,6 +29,26 @@ import random
 import string
 from typing import Dict, List, Optional
 
+# Tokens the single-pass walker looks at
+_TAG_RE = re.compile(r'<[^>]+>')
+_OPEN_TAG_RE = re.compile(r'<(\w+[^>]*)>')
+_STYLE_ATTR_RE = re.compile(r'style="([^"]*)"')
+_CLASS_ATTR_RE = re.compile(r'\bclass="([^"]*)"')
+_CLASS_NAME_RE = re.compile(r'\S+')
+_CSS_CLASS_REF_RE = re.compile(r'\.([a-zA-Z][a-zA-Z0-9_-]*)')
+_COLON_SPACING_RE = re.compile(r':\s*')
+_SEMICOLON_SPACING_RE = re.compile(r';\s*')
+
+# Character-level rewrite applied in one C-level pass
+_COLON_SPACING_TABLE = str.maketrans({':': ': '})
+
+# Closing tags that may be followed by random line breaks
+_LINE_BREAK_TAGS = frozenset(('</div>', '</p>', '</span>'))
+
+# Attributes that keep their position when shuffling, and those safe to move
+_CRITICAL_ATTR_PREFIXES = ('src=', 'href=', 'id=', 'name=', 'alt=', 'class=', 'style=', 'type=', 'value=')
+_SAFE_ATTR_PREFIXES = ('title=', 'data-', 'aria-')
+
 class HTMLObfuscator:
     """
     HTML template obfuscator that makes subtle variations to HTML structure
@@ -66,40 +86,31 @@ class HTMLObfuscator:
         Returns:
             Obfuscated HTML content
         """
-        if not html_content:
+        # Plain text has no tags to obfuscate
+        if not html_content or '<' not in html_content:
             return html_content
             
         try:
             # Set obfuscation intensity
             self._set_intensity(intensity)
             
-            # Apply obfuscation techniques
-            obfuscated = html_content
-            
-            if self.techniques['whitespace_injection']:
-                obfuscated = self._inject_whitespace(obfuscated)
+            # Class renames are decided up front so CSS and markup stay in sync
+            techniques = self.techniques
+            class_mappings = (self._generate_class_mappings(html_content)
+                              if techniques['class_variations'] else {})
             
-            if self.techniques['css_reordering']:
-                obfuscated = self._reorder_css_properties(obfuscated)
+            # Apply the per-tag and per-text techniques in a single walk
+            obfuscated = self._obfuscate_tokens(html_content, class_mappings)
 
             # CSS class reordering temporarily disabled to prevent CSS loss
             # if self.techniques['css_class_reordering']:
             #     obfuscated = self._reorder_css_classes(obfuscated)
 
-            if self.techniques['attribute_shuffling']:
-                obfuscated = self._shuffle_attributes(obfuscated)
-            
-            if self.techniques['comment_insertion']:
+            if techniques['comment_insertion']:
                 obfuscated = self._insert_comments(obfuscated)
             
-            if self.techniques['class_variations']:
-                obfuscated = self._vary_class_names(obfuscated)
-            
-            if self.techniques['style_formatting']:
-                obfuscated = self._vary_style_formatting(obfuscated)
-            
             if self.logger:
-                self.logger.debug(f"HTML obfuscated with {intensity} intensity")
+                self.logger.debug("HTML obfuscated with %s intensity", intensity)
             
             return obfuscated
             
@@ -141,22 +152,62 @@ class HTMLObfuscator:
                 'style_formatting': True
             })
     
-    def _inject_whitespace(self, html: str) -> str:
-        """Inject random whitespace in safe locations."""
-        # Add random spaces/tabs around HTML tags
-        html = re.sub(r'(<[^>]+>)', lambda m: self._add_random_whitespace(m.group(1)), html)
+    def _obfuscate_tokens(self, html: str, class_mappings: dict) -> str:
+        """
+        Walk the markup once, transforming each tag and each text run as it
+        passes instead of running one regex pass per technique.
+        """
+        techniques = self.techniques
+        inject_whitespace = techniques['whitespace_injection']
+        reorder_css = techniques['css_reordering']
+        shuffle_attributes = techniques['attribute_shuffling']
+        format_style = techniques['style_formatting']
         
-        # Add random line breaks in safe locations
-        html = re.sub(r'(</div>|</p>|</span>)', lambda m: m.group(1) + self._random_newlines(), html)
+        out = []
+        append = out.append
+        pos = 0
+        for match in _TAG_RE.finditer(html):
+            text = html[pos:match.start()]
+            if text:
+                # Class selectors in <style> blocks
+                append(self._rename_css_classes(text, class_mappings) if class_mappings else text)
+            pos = match.end()
+            
+            tag = match.group(0)
+            if _OPEN_TAG_RE.fullmatch(tag):
+                if reorder_css:
+                    tag = _STYLE_ATTR_RE.sub(self._reorder_style, tag)
+                if shuffle_attributes:
+                    tag = self._shuffle_tag_attributes(tag)
+                if class_mappings:
+                    tag = _CLASS_ATTR_RE.sub(
+                        lambda m: 'class="' + self._rename_classes(m.group(1), class_mappings) + '"', tag)
+                if format_style:
+                    tag = _STYLE_ATTR_RE.sub(self._format_style, tag)
+            
+            if inject_whitespace:
+                # Random whitespace around tags, random line breaks after block ends;
+                # pieces are appended as-is so the tag is never copied to pad it
+                spaces = self._random_spaces()
+                append(spaces)
+                append(tag)
+                if tag in _LINE_BREAK_TAGS:
+                    append(self._random_newlines())
+                append(spaces)
+            else:
+                append(tag)
         
-        return html
+        text = html[pos:]
+        if text:
+            append(self._rename_css_classes(text, class_mappings) if class_mappings else text)
+        
+        return ''.join(out)
     
-    def _add_random_whitespace(self, tag: str) -> str:
-        """Add random whitespace around a tag."""
+    def _random_spaces(self) -> str:
+        """Generate random whitespace to put around a tag."""
         if random.random() < 0.3:  # 30% chance
-            spaces = ' ' * random.randint(0, 2)
-            return spaces + tag + spaces
-        return tag
+            return ' ' * random.randint(0, 2)
+        return ''
     
     def _random_newlines(self) -> str:
         """Generate random newlines."""
@@ -164,18 +215,15 @@ class HTMLObfuscator:
             return '\n' * random.randint(1, 2)
         return ''
     
-    def _reorder_css_properties(self, html: str) -> str:
-        """Randomly reorder CSS properties in style attributes."""
-        def reorder_style(match):
-            style_content = match.group(1)
-            properties = [prop.strip() for prop in style_content.split(';') if prop.strip()]
-            
-            # Shuffle properties randomly
-            random.shuffle(properties)
-            
-            return f'style="{"; ".join(properties)}"'
+    def _reorder_style(self, match) -> str:
+        """Randomly reorder the CSS properties of a style attribute."""
+        style_content = match.group(1)
+        properties = [prop.strip() for prop in style_content.split(';') if prop.strip()]
         
-        return re.sub(r'style="([^"]*)"', reorder_style, html)
+        # Shuffle properties randomly
+        random.shuffle(properties)
+        
+        return f'style="{"; ".join(properties)}"'
 
     def _reorder_css_classes(self, html: str) -> str:
         """
@@ -320,12 +368,9 @@ class HTMLObfuscator:
         # Add random spacing and formatting
         formatted_properties = []
         for prop in properties:
-            # Add random spacing around colons
-            if ':' in prop:
-                if random.random() < 0.5:
-                    prop = prop.replace(':', ': ')
-                else:
-                    prop = prop.replace(':', ':')
+            # Add random spacing around colons (the other half keep them as-is)
+            if ':' in prop and random.random() < 0.5:
+                prop = prop.translate(_COLON_SPACING_TABLE)
             formatted_properties.append(prop)
 
         # Reconstruct with random indentation and line breaks
@@ -373,45 +418,40 @@ class HTMLObfuscator:
 
         return '\n        ' + '\n        '.join(result_parts) + '\n    '
     
-    def _shuffle_attributes(self, html: str) -> str:
+    def _shuffle_tag_attributes(self, tag: str) -> str:
         """Randomly shuffle HTML attributes (except critical ones) - SAFER VERSION."""
-        def shuffle_attrs(match):
-            tag_content = match.group(1)
-
-            # Extract tag name and attributes
-            parts = tag_content.split()
-            if len(parts) < 3:  # Need at least tag + 2 attributes to shuffle
-                return match.group(0)
-
-            tag_name = parts[0]
-            attrs = parts[1:]
-
-            # Don't shuffle critical attributes that can break functionality
-            critical_attrs = []
-            safe_attrs = []
-
-            for attr in attrs:
-                # Keep critical attributes in original position
-                if any(attr.startswith(critical) for critical in [
-                    'src=', 'href=', 'id=', 'name=', 'alt=', 'class=', 'style=', 'type=', 'value='
-                ]):
-                    critical_attrs.append(attr)
-                else:
-                    # Only shuffle very safe attributes
-                    if any(attr.startswith(safe) for safe in ['title=', 'data-', 'aria-']):
-                        safe_attrs.append(attr)
-                    else:
-                        critical_attrs.append(attr)  # Treat as critical if unsure
+        tag_content = tag[1:-1]
+
+        # Extract tag name and attributes
+        parts = tag_content.split()
+        if len(parts) < 3:  # Need at least tag + 2 attributes to shuffle
+            return tag
 
-            # Only shuffle if we have safe attributes to shuffle
-            if len(safe_attrs) > 1:
-                random.shuffle(safe_attrs)
+        tag_name = parts[0]
+        attrs = parts[1:]
 
-            # Reconstruct tag
-            all_attrs = critical_attrs + safe_attrs
-            return f'<{tag_name} {" ".join(all_attrs)}>'
+        # Don't shuffle critical attributes that can break functionality
+        critical_attrs = []
+        safe_attrs = []
 
-        return re.sub(r'<(\w+[^>]*)>', shuffle_attrs, html)
+        for attr in attrs:
+            # Keep critical attributes in original position
+            if attr.startswith(_CRITICAL_ATTR_PREFIXES):
+                critical_attrs.append(attr)
+            else:
+                # Only shuffle very safe attributes
+                if attr.startswith(_SAFE_ATTR_PREFIXES):
+                    safe_attrs.append(attr)
+                else:
+                    critical_attrs.append(attr)  # Treat as critical if unsure
+
+        # Only shuffle if we have safe attributes to shuffle
+        if len(safe_attrs) > 1:
+            random.shuffle(safe_attrs)
+
+        # Reconstruct tag
+        all_attrs = critical_attrs + safe_attrs
+        return f'<{tag_name} {" ".join(all_attrs)}>'
     
     def _insert_comments(self, html: str) -> str:
         """Insert random HTML comments that look natural."""
@@ -449,47 +489,15 @@ class HTMLObfuscator:
 
         return html
     
-    def _vary_class_names(self, html: str) -> str:
-        """Consistently rename CSS classes throughout the document."""
-        # Extract all class names from CSS and HTML
-        class_mappings = self._generate_class_mappings(html)
-
-        if not class_mappings:
-            return html
-
-        # Apply mappings to both CSS definitions and HTML usage
-        modified_html = html
-
-        for original_class, new_class in class_mappings.items():
-            # Replace in CSS definitions (e.g., .email-container { ... })
-            modified_html = re.sub(
-                rf'\.{re.escape(original_class)}\b',
-                f'.{new_class}',
-                modified_html
-            )
-
-            # Replace in HTML class attributes
-            modified_html = re.sub(
-                rf'\bclass="([^"]*\b){re.escape(original_class)}\b([^"]*)"',
-                rf'class="\1{new_class}\2"',
-                modified_html
-            )
-
-            # Handle multiple classes in same attribute
-            modified_html = re.sub(
-                rf'\bclass="([^"]*\s){re.escape(original_class)}\b(\s[^"]*)"',
-                rf'class="\1{new_class}\2"',
-                modified_html
-            )
-
-            # Handle single class attributes
-            modified_html = re.sub(
-                rf'\bclass="{re.escape(original_class)}"',
-                f'class="{new_class}"',
-                modified_html
-            )
-
-        return modified_html
+    def _rename_css_classes(self, text: str, class_mappings: dict) -> str:
+        """Rename class selectors (e.g. .email-container) in CSS text."""
+        return _CSS_CLASS_REF_RE.sub(
+            lambda m: '.' + class_mappings.get(m.group(1), m.group(1)), text)
+
+    def _rename_classes(self, class_value: str, class_mappings: dict) -> str:
+        """Rename each class in a class attribute value, keeping its spacing."""
+        return _CLASS_NAME_RE.sub(
+            lambda m: class_mappings.get(m.group(0), m.group(0)), class_value)
 
     def _generate_class_mappings(self, html: str) -> dict:
         """Generate consistent random mappings for CSS class names."""
@@ -549,24 +557,20 @@ class HTMLObfuscator:
 
         return mappings
     
-    def _vary_style_formatting(self, html: str) -> str:
-        """Vary CSS formatting (spacing, quotes, etc.)."""
-        # Randomly add/remove spaces around colons and semicolons
-        def vary_css_spacing(match):
-            style_content = match.group(1)
-            
-            # Vary spacing around colons
-            if random.random() < 0.5:
-                style_content = re.sub(r':\s*', ': ', style_content)
-            else:
-                style_content = re.sub(r':\s*', ':', style_content)
-            
-            # Vary spacing around semicolons
-            if random.random() < 0.5:
-                style_content = re.sub(r';\s*', '; ', style_content)
-            else:
-                style_content = re.sub(r';\s*', ';', style_content)
-            
-            return f'style="{style_content}"'
+    def _format_style(self, match) -> str:
+        """Vary CSS formatting (spacing around colons and semicolons) of a style attribute."""
+        style_content = match.group(1)
+        
+        # Vary spacing around colons
+        if random.random() < 0.5:
+            style_content = _COLON_SPACING_RE.sub(': ', style_content)
+        else:
+            style_content = _COLON_SPACING_RE.sub(':', style_content)
+        
+        # Vary spacing around semicolons
+        if random.random() < 0.5:
+            style_content = _SEMICOLON_SPACING_RE.sub('; ', style_content)
+        else:
+            style_content = _SEMICOLON_SPACING_RE.sub(';', style_content)
         
-        return re.sub(r'style="([^"]*)"', vary_css_spacing, html)
+        return f'style="{style_content}"'
@@ -25,6 +25,7 @@
 
 import re
 import random
+from functools import lru_cache
 from typing import List, Dict, Any
 
 try:
@@ -34,6 +35,24 @@ try:
 except ImportError:
     JINJA2_AVAILABLE = False
 
+# Randomization groups without nested braces: {option1|option2}
+_PATTERN_RE = re.compile(r'\{([^{}]*\|[^{}]*)\}')
+
+# Picks index options with the shared generator directly, so random.seed()
+# still applies but random.choice's per-call overhead is skipped
+_random = random.random
+
+# Pattern for randomization syntax: {option1|option2|option3}
+_RANDOMIZATION_RE = re.compile(r'\{([^{}]*(?:\|[^{}]*)+)\}', re.DOTALL)
+
+# Loose group match used only to count processed patterns for logging
+_LOGGED_PATTERN_RE = re.compile(r'\{[^}]*\|[^}]*\}')
+
+# CSS helpers
+_STYLE_BLOCK_RE = re.compile(r'<style[^>]*>(.*?)</style>', re.DOTALL | re.IGNORECASE)
+_CSS_RULE_RE = re.compile(r'([^{}]+?)\s*\{\s*([^{}]*?)\s*\}', re.DOTALL)
+_CSS_PROPERTY_NAME_RE = re.compile(r'^[a-zA-Z-]+$')
+
 class TemplateRandomizer:
     """
     Template randomizer that processes custom syntax for manual content variations.
@@ -50,8 +69,7 @@ class TemplateRandomizer:
         self.logger = logger
 
         # Pattern for randomization syntax: {option1|option2|option3}
-        # Use a simpler approach that handles most cases
-        self.randomization_pattern = re.compile(r'\{([^{}]*(?:\|[^{}]*)+)\}', re.DOTALL)
+        self.randomization_pattern = _RANDOMIZATION_RE
 
         # Storage for synchronized randomization values
         self.sync_values = {}
@@ -66,7 +84,8 @@ class TemplateRandomizer:
         Returns:
             Processed template with random selections
         """
-        if not template_content:
+        # Without braces there are no groups and no CSS rules to shuffle
+        if not template_content or '{' not in template_content:
             return template_content
 
         try:
@@ -74,11 +93,11 @@ class TemplateRandomizer:
             processed = self._process_with_balanced_braces(template_content)
 
             if self.logger:
-                original_patterns = len(re.findall(r'\{[^}]*\|[^}]*\}', template_content))
-                remaining_patterns = len(re.findall(r'\{[^}]*\|[^}]*\}', processed))
+                original_patterns = len(_LOGGED_PATTERN_RE.findall(template_content))
+                remaining_patterns = len(_LOGGED_PATTERN_RE.findall(processed))
                 changes = original_patterns - remaining_patterns
                 if changes > 0:
-                    self.logger.debug(f"Processed {changes} randomization patterns")
+                    self.logger.debug("Processed %s randomization patterns", changes)
 
             return processed
 
@@ -95,49 +114,100 @@ class TemplateRandomizer:
         # Clear sync values for each new template processing
         self.sync_values = {}
 
-        # Use regex to find all randomization patterns first
-        pattern = re.compile(r'\{([^{}]*\|[^{}]*)\}')
+        # Parsing is cached per template; only the random selections run per call
+        tokens, has_sync = self._tokenize(content)
+        rand = _random
+
+        if not has_sync and not self.logger:
+            result = ''.join([token if token.__class__ is str else token[2][int(rand() * token[3])]
+                              for token in tokens])
+        else:
+            parts = []
+            for token in tokens:
+                if token.__class__ is str:
+                    parts.append(token)
+                    continue
+
+                context, sync_key, options, size = token
+                if sync_key is not None:
+                    selected = self._select_synchronized(sync_key, options)
+                else:
+                    selected = options[int(rand() * size)]
+                    if self.logger:
+                        self.logger.debug("%s randomization: %s...", context, selected[:50])
+                parts.append(selected)
+            result = ''.join(parts)
+
+        # Apply CSS property shuffling after randomization
+        result = self._shuffle_css_properties(result)
+
+        return result
 
-        def replace_pattern(match):
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _tokenize(content: str) -> tuple:
+        """
+        Split a template into literal text and randomization groups.
+
+        Returns:
+            (tokens, has_sync) where tokens is a tuple of literal strings and
+            (context, sync_key, options, option_count) group tuples in template order
+        """
+        tokens = []
+        has_sync = False
+        last_end = 0
+        for start, end, context, sync_key, options in TemplateRandomizer._parse_patterns(content):
+            if start > last_end:
+                tokens.append(content[last_end:start])
+            tokens.append((context, sync_key, options, len(options)))
+            has_sync = has_sync or sync_key is not None
+            last_end = end
+        if last_end < len(content):
+            tokens.append(content[last_end:])
+        return tuple(tokens), has_sync
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _parse_patterns(content: str) -> tuple:
+        """
+        Parse the randomization patterns of a template.
+
+        Returns:
+            Tuple of (start, end, context, sync_key, options) per pattern, where
+            sync_key is None for plain patterns and options is a tuple of the
+            stripped choices
+        """
+        parsed = []
+        for match in _PATTERN_RE.finditer(content):
             inner_content = match.group(1)
 
             # Check for synchronized randomization syntax: @sync_key:option1|option2|option3
             if inner_content.startswith('@'):
-                return self._process_synchronized_randomization(inner_content)
+                if ':' in inner_content:
+                    sync_key, options_string = inner_content[1:].split(':', 1)  # Remove @ and split
+                    options = tuple(option.strip() for option in options_string.split('|'))
+                    parsed.append((match.start(), match.end(), 'SYNC', sync_key, options))
+                    continue
+                # Invalid syntax, treat as regular randomization
+                inner_content = inner_content[1:]  # Remove @
 
             # Determine context based on position
-            position = match.start()
-            context = 'HTML'  # Default context
-
-            # Check if we're in a CSS context
-            if self._is_css_context(content, position):
+            if TemplateRandomizer._is_css_context(content, match.start()):
                 context = 'CSS'
-                selected = self._process_css_randomization_advanced(inner_content)
             else:
-                selected = self._process_html_randomization(inner_content)
-
-            if self.logger:
-                self.logger.debug(f"{context} randomization: {selected[:50]}...")
+                context = 'HTML'
 
-            return selected
-
-        # Replace all randomization patterns
-        result = pattern.sub(replace_pattern, content)
-
-        # Apply CSS property shuffling after randomization
-        result = self._shuffle_css_properties(result)
+            options = tuple(option.strip() for option in inner_content.split('|'))
+            parsed.append((match.start(), match.end(), context, None, options))
 
-        return result
+        return tuple(parsed)
 
     def _extract_css_blocks(self, content: str) -> list:
         """Extract all CSS blocks from the content for context awareness."""
         css_blocks = []
 
         # Find all <style> blocks
-        style_pattern = r'<style[^>]*>(.*?)</style>'
-        matches = re.finditer(style_pattern, content, re.DOTALL | re.IGNORECASE)
-
-        for match in matches:
+        for match in _STYLE_BLOCK_RE.finditer(content):
             css_blocks.append({
                 'start': match.start(),
                 'end': match.end(),
@@ -246,17 +316,21 @@ class TemplateRandomizer:
         if not options:
             return inner_content
 
+        return self._select_synchronized(sync_key, options)
+
+    def _select_synchronized(self, sync_key: str, options) -> str:
+        """Select a value for a sync key, reusing the value chosen earlier in this template."""
         # Check if we already have a value for this sync key
         if sync_key in self.sync_values:
             selected_value = self.sync_values[sync_key]
             if self.logger:
-                self.logger.debug(f"Using cached sync value for '{sync_key}': {selected_value}")
+                self.logger.debug("Using cached sync value for '%s': %s", sync_key, selected_value)
         else:
             # First time seeing this sync key, select a random value
             selected_value = random.choice(options)
             self.sync_values[sync_key] = selected_value
             if self.logger:
-                self.logger.debug(f"New sync value for '{sync_key}': {selected_value}")
+                self.logger.debug("New sync value for '%s': %s", sync_key, selected_value)
 
         return selected_value
 
@@ -288,7 +362,7 @@ class TemplateRandomizer:
                 # Basic validation
                 if property_name and property_value:
                     # Property name should be valid CSS identifier
-                    if re.match(r'^[a-zA-Z-]+$', property_name):
+                    if _CSS_PROPERTY_NAME_RE.match(property_name):
                         return True
 
         # Allow CSS values (for cases where property is separate)
@@ -298,7 +372,8 @@ class TemplateRandomizer:
 
         return False
 
-    def _is_css_context(self, content: str, position: int) -> bool:
+    @staticmethod
+    def _is_css_context(content: str, position: int) -> bool:
         """
         Determine if the current position is within a CSS context.
         """
@@ -375,7 +450,7 @@ class TemplateRandomizer:
             return False
 
         # Property name should be valid CSS identifier
-        if not re.match(r'^[a-zA-Z-]+$', property_name):
+        if not _CSS_PROPERTY_NAME_RE.match(property_name):
             return False
 
         return True
@@ -385,9 +460,6 @@ class TemplateRandomizer:
         Shuffle CSS properties within each CSS rule AND shuffle the order of CSS rules
         for maximum anti-spam protection.
         """
-        import re
-        import random
-
         def shuffle_css_rule(match):
             """Shuffle properties within a single CSS rule."""
             selector = match.group(1)
@@ -508,8 +580,7 @@ class TemplateRandomizer:
 
                         # Reconstruct rule and apply shuffling
                         rule_text = '\n'.join(rule_lines)
-                        css_rule_pattern = re.compile(r'([^{}]+?)\s*\{\s*([^{}]*?)\s*\}', re.DOTALL)
-                        match = css_rule_pattern.match(rule_text)
+                        match = _CSS_RULE_RE.match(rule_text)
                         if match:
                             shuffled_rule = shuffle_css_rule(match)
                             result_lines.extend(shuffled_rule.split('\n'))
@@ -541,8 +612,7 @@ class TemplateRandomizer:
             return f"<style>\n        {shuffled_style}\n    </style>"
 
         # Find and process all <style> blocks
-        style_pattern = re.compile(r'<style[^>]*>(.*?)</style>', re.DOTALL | re.IGNORECASE)
-        result = style_pattern.sub(process_style_block, content)
+        result = _STYLE_BLOCK_RE.sub(process_style_block, content)
 
         return result
 
@@ -557,17 +627,19 @@ class TemplateRandomizer:
             List of dictionaries with pattern information
         """
         patterns = []
+        append = patterns.append
         
-        for match in self.randomization_pattern.finditer(template_content):
+        # One linear scan; each group's options come from a single C-level split
+        for match in _RANDOMIZATION_RE.finditer(template_content):
             options_string = match.group(1)
-            options = [option.strip() for option in options_string.split('|')]
+            start, end = match.span()
             
-            patterns.append({
+            append({
                 'full_match': match.group(0),
                 'options_string': options_string,
-                'options': options,
-                'start': match.start(),
-                'end': match.end()
+                'options': list(map(str.strip, options_string.split('|'))),
+                'start': start,
+                'end': end
             })
         
         return patterns
@@ -619,6 +691,60 @@ class TemplateRandomizer:
         
         return randomize_filter
     
+    def process_template_batch(self, template_content: str, count: int) -> List[str]:
+        """
+        Process a template several times in one go.
+
+        The template is tokenized once and each group's picks for all
+        variations are drawn together. Outputs follow the same distribution
+        as calling process_template count times, and sync_values holds the
+        picks of the last variation; per-group debug logging is skipped.
+
+        Args:
+            template_content: Template content with randomization syntax
+            count: Number of processed templates to generate
+
+        Returns:
+            List of processed templates
+        """
+        if count <= 0:
+            return []
+        if not template_content or '{' not in template_content:
+            return [template_content] * count
+        
+        try:
+            self.sync_values = {}
+            tokens, _ = self._tokenize(template_content)
+            
+            # Draw every variation's pick for a group in one call; groups with a
+            # sync key share one column of picks
+            choices = random.choices
+            columns = []
+            sync_columns = {}
+            for token in tokens:
+                if token.__class__ is str:
+                    columns.append((token,) * count)
+                    continue
+                
+                context, sync_key, options, _ = token
+                if sync_key is None:
+                    columns.append(choices(options, k=count))
+                else:
+                    column = sync_columns.get(sync_key)
+                    if column is None:
+                        column = sync_columns[sync_key] = choices(options, k=count)
+                    columns.append(column)
+            
+            self.sync_values = {sync_key: column[-1] for sync_key, column in sync_columns.items()}
+            
+            shuffle_css = self._shuffle_css_properties
+            return [shuffle_css(''.join(parts)) for parts in zip(*columns)]
+        
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Template randomization failed: {e}")
+            return [template_content] * count
+
     def preview_variations(self, template_content: str, count: int = 5) -> List[str]:
         """
         Generate multiple variations of the template for preview.
@@ -630,13 +756,7 @@ class TemplateRandomizer:
         Returns:
             List of template variations
         """
-        variations = []
-        
-        for _ in range(count):
-            variation = self.process_template(template_content)
-            variations.append(variation)
-        
-        return variations
+        return self.process_template_batch(template_content, count)
 
 
 class RandomizerExtension(Extension):
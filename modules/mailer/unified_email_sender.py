@@ -243,7 +243,7 @@ class UnifiedEmailSender:
                     if not password:
                         self.logger.error(f"Either cookie file or password required for browser mode: {email}")
                         return False
-                    self.logger.debug(f"No cookie file for {email}, will use password authentication")
+                    self.logger.debug("No cookie file for %s, will use password authentication", email)
                 
                 if not self.browser_sender.is_provider_supported(provider):
                     self.logger.error(f"Provider '{provider}' not supported for {email}")
@@ -58,7 +58,7 @@ class QueueWorker:
     def run(self):
         """Main worker loop - processes emails from the sender's queue."""
         self.start_time = time.time()
-        self.logger.debug(f"Starting worker for sender: {self.sender_email}")
+        self.logger.debug("Starting worker for sender: %s", self.sender_email)
         
         try:
             while True:
@@ -80,6 +80,9 @@ class QueueWorker:
             self.logger.error(f"Worker {self.sender_email} encountered error: {e}")
         finally:
             self.stop_time = time.time()
+            if self.recipient_manager:
+                # Write any status updates still queued by this worker
+                self.recipient_manager.close()
             self._log_worker_stats()
     
     def _process_email(self, email_task):
@@ -95,8 +98,8 @@ class QueueWorker:
         # Wait for gap if needed (with randomization)
         self.rate_limiter.wait_if_needed(self.sender_email)
 
-        # Atomically check limits and reserve slot (prevents race conditions)
-        if not self.rate_limiter.try_reserve_send_slot(self.sender_email):
+        # Atomically check all limits and reserve slot (prevents race conditions)
+        if not self.rate_limiter.try_acquire(self.sender_email):
             self.logger.warning(f"Sender {self.sender_email} rate limited, requeuing email")
             self.queue_manager.requeue_failed_email(email_task, self.sender_email, "Rate limit exceeded")
             return
@@ -156,7 +156,7 @@ class SmartQueueManager:
         
         if optimal_sender:
             self.sender_queues[optimal_sender].put(email_task)
-            self.logger.debug(f"Queued email to {email_task.recipient_email} in {optimal_sender} queue")
+            self.logger.debug("Queued email to %s in %s queue", email_task.recipient_email, optimal_sender)
             return True
         else:
             # Handle overflow based on strategy
@@ -279,7 +279,7 @@ class SmartQueueManager:
         self.sender_queues[sender_email].record_result(success=True)
         self.total_emails_processed += 1
 
-        self.logger.debug(f"Successfully sent email to {email_task.recipient_email} using {sender_email}")
+        self.logger.debug("Successfully sent email to %s using %s", email_task.recipient_email, sender_email)
 
     def should_rebalance_queues(self) -> bool:
         """Check if queues should be rebalanced."""
@@ -345,8 +345,8 @@ class SmartQueueManager:
                     if better_sender and better_sender != overloaded_sender:
                         self.sender_queues[better_sender].put(email_task)
                         moved_count += 1
-                        self.logger.debug(f"Rebalanced: moved {email_task.recipient_email} "
-                                        f"from {overloaded_sender} to {better_sender}")
+                        self.logger.debug("Rebalanced: moved %s from %s to %s",
+                                          email_task.recipient_email, overloaded_sender, better_sender)
                     else:
                         # Put it back in original queue
                         queue.put(email_task)
@@ -27,49 +27,108 @@
 # ================================================================================
 
 import time
-import random
+import logging
+import warnings
+import itertools
 import threading
-from collections import defaultdict, deque
-from datetime import datetime, timedelta
+import contextlib
+from collections import deque
+from random import random as _rand
+
+# Randomized gaps are drawn in blocks of this size and handed out one at a time
+GAP_POOL_SIZE = 1024
+
+# Bit flags for the limits a sender has enabled (precomputed once per sender)
+LIMIT_TOTAL = 1
+LIMIT_PER_MIN = 2
+LIMIT_PER_HOUR = 4
+LIMIT_GAP = 8
+COUNT_LIMITS = LIMIT_TOTAL | LIMIT_PER_MIN | LIMIT_PER_HOUR
 
 class RateLimiter:
-    """Manages sending rates per sender to avoid exceeding limits."""
+    """
+    Manages sending rates per sender to avoid exceeding limits.
+
+    Per-minute and per-hour limits are token buckets: a sender starts with a
+    full bucket of `limit` tokens, each send spends one, and tokens refill
+    continuously at limit/60 (or limit/3600) per second. State is two floats
+    per bucket, so checks are constant time however many emails were sent.
+
+    All timings are taken from time.monotonic(), so wall-clock adjustments
+    (NTP, DST) never shorten or stretch a refill or gap. Any current_time/now
+    passed in must come from the same clock.
+
+    Pass single_threaded=True when only one thread ever uses the limiter
+    (e.g. the sequential duplicate_send strategy) to skip all locking.
+    """
 
-    def __init__(self, senders_data, global_limit=0, logger=None):
+    def __init__(self, senders_data, global_limit=0, logger=None, single_threaded=False):
         self.senders_data = senders_data
         self.global_limit = global_limit
         self.logger = logger
-
-        # Thread safety for concurrent access
-        self._lock = threading.Lock()
-
-        # Track counts and timings per sender
-        self.sent_counts = defaultdict(int)  # Total sent per run for each sender
-        self.sent_timestamps = defaultdict(deque)  # Timestamps for minute/hour tracking
-        self.last_sent_time = defaultdict(float)  # Last sent time for gap control
-        self.next_gap_time = defaultdict(float)  # Store next randomized gap for each sender
+        self.single_threaded = single_threaded
+
+        # Debug messages sit on the per-send hot path; check the level once up front
+        self._debug = logger.isEnabledFor(logging.DEBUG) if logger else False
+
+        # Guards the count of senders without configured limits; configured
+        # senders each get their own lock so independent senders never contend.
+        # A single-threaded run has nothing to guard, so a no-op context stands in.
+        self._lock = contextlib.nullcontext() if single_threaded else threading.Lock()
+
+        # Global send slots are handed out by an atomic counter (next() on
+        # itertools.count is atomic under the GIL), so reserving a slot needs no lock
+        self._global_slots = itertools.count(1)
+        # Highest slot number allowed, so the check is one comparison (no limit: inf)
+        self._slot_cap = global_limit if global_limit > 0 else float('inf')
+        self._unlimited_sent = 0  # Sends by senders without configured limits
         
-        # Global counter for all emails sent
-        self.global_sent_count = 0
-        
-        # Parse rate limit settings from senders_data
-        self.rate_limits = self._parse_rate_limits()
+        # Parse rate limit settings from senders_data into one list per setting
+        self._parse_rate_limits()
+
+        # Track counts and timings per sender as parallel lists (struct-of-arrays),
+        # indexed by the sender's slot so a hot check is one dict lookup plus list reads
+        self.sent_counts = [0] * len(self.sender_idx)  # Total sent per run for each sender
+        # Token buckets for minute/hour limits, starting full
+        self.tokens_min = [float(limit) for limit in self.limit_per_min]
+        self.tokens_hour = [float(limit) for limit in self.limit_per_hour]
+        self.last_refill = [float('-inf')] * len(self.sender_idx)  # Last bucket refill time
+        # Last sent time for gap control (-inf so the first send never waits on a gap)
+        self.last_sent_time = [float('-inf')] * len(self.sender_idx)
+        # Next (randomized) gap for each sender, starting from the base gap
+        self.next_gap_time = [float(gap) for gap in self.per_email_gap_sec]
+        self._sender_locks = [self._lock if single_threaded else threading.Lock() for _ in self.sender_idx]
+        self._gap_pool = [deque() for _ in self.sender_idx]  # Pre-drawn randomized gaps
+        # Which limits each sender has enabled, so unlimited senders skip every check
+        self.limit_flags = [self._limit_flags(i) for i in range(len(self.sender_idx))]
+
+    @property
+    def global_sent_count(self):
+        """Total emails sent (or reserved) across all senders."""
+        return sum(self.sent_counts) + self._unlimited_sent
+
+    def _take_global_slot(self):
+        """Take the next global send slot; returns False if it is past the global limit."""
+        return next(self._global_slots) <= self._slot_cap
     
-    def _parse_rate_limits(self):
-        """Parse rate limit settings from sender configurations."""
-        rate_limits = {}
-
-        for sender in self.senders_data:
-            sender_email = sender['email']
-            rate_limits[sender_email] = {
-                'total_limit_per_run': sender.get('total_limit_per_run', 0),
-                'limit_per_min': sender.get('limit_per_min', 0),
-                'limit_per_hour': sender.get('limit_per_hour', 0),
-                'per_email_gap_sec': sender.get('per_email_gap_sec', 0),
-                'per_email_gap_sec_randomizer': sender.get('per_email_gap_sec_randomizer', 0)
-            }
+    def _limit_flags(self, i):
+        """Build the LIMIT_* bit flags for the limits enabled for the sender in slot i."""
+        return ((LIMIT_TOTAL if self.total_limit_per_run[i] > 0 else 0)
+                | (LIMIT_PER_MIN if self.limit_per_min[i] > 0 else 0)
+                | (LIMIT_PER_HOUR if self.limit_per_hour[i] > 0 else 0)
+                | (LIMIT_GAP if self.per_email_gap_sec[i] > 0 else 0))
 
-        return rate_limits
+    def _parse_rate_limits(self):
+        """Parse rate limit settings from sender configurations into per-setting lists."""
+        # Later entries for the same email override earlier ones
+        senders = {sender['email']: sender for sender in self.senders_data}
+
+        self.sender_idx = {sender_email: i for i, sender_email in enumerate(senders)}
+        self.total_limit_per_run = [sender.get('total_limit_per_run', 0) for sender in senders.values()]
+        self.limit_per_min = [sender.get('limit_per_min', 0) for sender in senders.values()]
+        self.limit_per_hour = [sender.get('limit_per_hour', 0) for sender in senders.values()]
+        self.per_email_gap_sec = [sender.get('per_email_gap_sec', 0) for sender in senders.values()]
+        self.per_email_gap_sec_randomizer = [sender.get('per_email_gap_sec_randomizer', 0) for sender in senders.values()]
     
     def can_send(self, sender_email):
         """Check if we can send an email with the given sender (including gap control)."""
@@ -82,102 +141,115 @@ class RateLimiter:
 
     def can_send_ignoring_gap(self, sender_email):
         """Check if we can send an email with the given sender (ignoring gap control)."""
-        # Check global limit first (thread-safe)
-        with self._lock:
-            if self.global_limit > 0 and self.global_sent_count >= self.global_limit:
-                if self.logger:
-                    self.logger.warning(f"Global limit reached ({self.global_limit} emails). Cannot send more emails.")
-                return False
+        # Check global limit first
+        if self.is_global_limit_reached():
+            self._warn_global_limit()
+            return False
 
-        if sender_email not in self.rate_limits:
+        i = self.sender_idx.get(sender_email)
+        if i is None:
             return True
 
-        limits = self.rate_limits[sender_email]
+        # Fast path: no count-based limits configured for this sender
+        flags = self.limit_flags[i]
+        if not flags & COUNT_LIMITS:
+            return True
+
+        with self._sender_locks[i]:
+            return self._within_count_limits(sender_email, i, flags, time.monotonic())
 
+    def _within_count_limits(self, sender_email, i, flags, now):
+        """
+        Check the per-run, per-minute and per-hour limits for the sender in slot i.
+        The caller must hold the sender's lock.
+        """
         # Check total limit per run
-        if limits['total_limit_per_run'] > 0:
-            if self.sent_counts[sender_email] >= limits['total_limit_per_run']:
-                if self.logger:
-                    self.logger.warning(f"Sender '{sender_email}' has reached total limit per run ({limits['total_limit_per_run']})")
-                return False
+        if flags & LIMIT_TOTAL and self.sent_counts[i] >= self.total_limit_per_run[i]:
+            if self.logger:
+                self.logger.warning("Sender '%s' has reached total limit per run (%s)", sender_email, self.total_limit_per_run[i])
+            return False
+
+        if flags & (LIMIT_PER_MIN | LIMIT_PER_HOUR):
+            self._refill_buckets(i, flags, now)
 
         # Check per minute limit
-        if limits['limit_per_min'] > 0:
-            now = datetime.now()
-            minute_ago = now - timedelta(minutes=1)
-
-            # Remove old timestamps
-            timestamps = self.sent_timestamps[sender_email]
-            while timestamps and datetime.fromtimestamp(timestamps[0]) < minute_ago:
-                timestamps.popleft()
-
-            if len(timestamps) >= limits['limit_per_min']:
-                if self.logger:
-                    self.logger.warning(f"Sender '{sender_email}' has reached per minute limit ({limits['limit_per_min']})")
-                return False
+        if flags & LIMIT_PER_MIN and self.tokens_min[i] < 1.0:
+            if self.logger:
+                self.logger.warning("Sender '%s' has reached per minute limit (%s)", sender_email, self.limit_per_min[i])
+            return False
 
         # Check per hour limit
-        if limits['limit_per_hour'] > 0:
-            now = datetime.now()
-            hour_ago = now - timedelta(hours=1)
-
-            # Count emails sent in the last hour
-            timestamps = self.sent_timestamps[sender_email]
-            emails_last_hour = sum(1 for ts in timestamps if datetime.fromtimestamp(ts) >= hour_ago)
-
-            if emails_last_hour >= limits['limit_per_hour']:
-                if self.logger:
-                    self.logger.warning(f"Sender '{sender_email}' has reached per hour limit ({limits['limit_per_hour']})")
-                return False
+        if flags & LIMIT_PER_HOUR and self.tokens_hour[i] < 1.0:
+            if self.logger:
+                self.logger.warning("Sender '%s' has reached per hour limit (%s)", sender_email, self.limit_per_hour[i])
+            return False
 
         return True
 
+    def _refill_buckets(self, i, flags, now):
+        """Top up the minute/hour token buckets for slot i. The caller must hold the sender's lock."""
+        last_refill = self.last_refill
+        elapsed = now - last_refill[i]
+        if elapsed <= 0:
+            return
+        last_refill[i] = now
+
+        if flags & LIMIT_PER_MIN:
+            limit = self.limit_per_min[i]
+            tokens = self.tokens_min
+            tokens[i] = min(limit, tokens[i] + elapsed * limit / 60.0)
+        if flags & LIMIT_PER_HOUR:
+            limit = self.limit_per_hour[i]
+            tokens = self.tokens_hour
+            tokens[i] = min(limit, tokens[i] + elapsed * limit / 3600.0)
+
+    def _warn_global_limit(self):
+        """Log that the global limit has been reached."""
+        if self.logger:
+            self.logger.warning("Global limit reached (%s emails). Cannot send more emails.", self.global_limit)
+
     def is_gap_satisfied(self, sender_email, current_time=None):
         """Check if the gap period has been satisfied for a sender."""
         if current_time is None:
-            current_time = time.time()
-
-        if sender_email not in self.rate_limits:
-            return True
-
-        limits = self.rate_limits[sender_email]
-        per_email_gap_sec = limits['per_email_gap_sec']
+            current_time = time.monotonic()
 
-        if per_email_gap_sec > 0:
-            time_since_last = current_time - self.last_sent_time[sender_email]
-            # Use the randomized gap time if available, otherwise use base gap
-            required_gap = self.next_gap_time.get(sender_email, per_email_gap_sec)
-            return time_since_last >= required_gap
-
-        return True
+        return current_time >= self.schedule_next_slot(sender_email)
 
     def get_gap_wait_time(self, sender_email, current_time=None):
         """Get the remaining wait time for a sender's gap period."""
         if current_time is None:
-            current_time = time.time()
+            current_time = time.monotonic()
 
-        if sender_email not in self.rate_limits:
-            return 0.0
+        return max(0.0, self.schedule_next_slot(sender_email) - current_time)
 
-        limits = self.rate_limits[sender_email]
-        per_email_gap_sec = limits['per_email_gap_sec']
+    def schedule_next_slot(self, sender_email):
+        """
+        Get the time at which a sender's current gap ends.
 
-        if per_email_gap_sec > 0:
-            time_since_last = current_time - self.last_sent_time[sender_email]
-            # Use the randomized gap time if available, otherwise use base gap
-            required_gap = self.next_gap_time.get(sender_email, per_email_gap_sec)
-            if time_since_last < required_gap:
-                return required_gap - time_since_last
+        Unlike wait_if_needed(), this never sleeps: callers can hand work to
+        other senders and come back once the deadline has passed.
 
-        return 0.0
+        Args:
+            sender_email: Email address of the sender
+
+        Returns:
+            float: time.monotonic() deadline after which the sender may send again
+                   (-inf if the sender has no gap control)
+        """
+        i = self.sender_idx.get(sender_email)
+        if i is None or not self.limit_flags[i] & LIMIT_GAP:
+            return float('-inf')
+
+        # Use the randomized gap time (base gap until the first send)
+        return self.last_sent_time[i] + self.next_gap_time[i]
     
     def wait_if_needed(self, sender_email):
         """Wait if needed based on the gap settings for the sender."""
         wait_time = self.get_gap_wait_time(sender_email)
 
         if wait_time > 0:
-            if self.logger:
-                self.logger.debug(f"Sender '{sender_email}' gap control: waiting {wait_time:.2f} seconds")
+            if self._debug:
+                self.logger.debug("Sender '%s' gap control: waiting %.2f seconds", sender_email, wait_time)
             time.sleep(wait_time)
 
     def wait_with_randomized_gap(self, sender_email):
@@ -185,14 +257,20 @@ class RateLimiter:
         Wait for the randomized gap time after sending an email.
         This should be called after a successful email send.
 
+        Deprecated: this blocks the calling thread for the whole gap. Use
+        schedule_next_slot() and dispatch other work until the deadline passes.
+
         Args:
             sender_email: Email address of the sender
         """
+        warnings.warn("wait_with_randomized_gap() is deprecated, use schedule_next_slot()",
+                      DeprecationWarning, stacklevel=2)
+
         randomized_gap = self.get_randomized_gap_time(sender_email)
 
         if randomized_gap > 0:
-            if self.logger:
-                self.logger.debug(f"Sender '{sender_email}' randomized gap: waiting {randomized_gap:.2f} seconds")
+            if self._debug:
+                self.logger.debug("Sender '%s' randomized gap: waiting %.2f seconds", sender_email, randomized_gap)
             time.sleep(randomized_gap)
 
     def get_randomized_gap_time(self, sender_email):
@@ -205,12 +283,12 @@ class RateLimiter:
         Returns:
             float: Randomized gap time in seconds
         """
-        if sender_email not in self.rate_limits:
+        i = self.sender_idx.get(sender_email)
+        if i is None:
             return 0.0
 
-        limits = self.rate_limits[sender_email]
-        base_gap = limits['per_email_gap_sec']
-        randomizer = limits['per_email_gap_sec_randomizer']
+        base_gap = self.per_email_gap_sec[i]
+        randomizer = self.per_email_gap_sec_randomizer[i]
 
         if base_gap <= 0:
             return 0.0
@@ -224,14 +302,24 @@ class RateLimiter:
         min_gap = max(1.0, base_gap - randomizer)  # Ensure minimum 1 second
         max_gap = base_gap + randomizer
 
-        randomized_gap = random.uniform(min_gap, max_gap)
+        pool = self._gap_pool[i]
+        if not pool:
+            self._refill_gap_pool(i, min_gap, max_gap)
+        randomized_gap = pool.popleft()
 
-        if self.logger:
-            self.logger.debug(f"Sender '{sender_email}' randomized gap: {randomized_gap:.2f}s "
-                            f"(base: {base_gap}s, randomizer: ±{randomizer}s, range: {min_gap:.1f}-{max_gap:.1f}s)")
+        if self._debug:
+            self.logger.debug("Sender '%s' randomized gap: %.2fs (base: %ss, randomizer: ±%ss, range: %.1f-%.1fs)",
+                              sender_email, randomized_gap, base_gap, randomizer, min_gap, max_gap)
 
         return randomized_gap
 
+    def _refill_gap_pool(self, i, min_gap, max_gap):
+        """Draw a block of GAP_POOL_SIZE randomized gaps for the sender in slot i."""
+        # Scaled random() is cheaper than uniform() and gives the same distribution
+        span = max_gap - min_gap
+        rand = _rand
+        self._gap_pool[i].extend([min_gap + span * rand() for _ in range(GAP_POOL_SIZE)])
+
     def get_average_gap_time(self, sender_email):
         """
         Get the average gap time for a sender (used for queue calculations).
@@ -242,115 +330,145 @@ class RateLimiter:
         Returns:
             float: Average gap time in seconds
         """
-        if sender_email not in self.rate_limits:
+        i = self.sender_idx.get(sender_email)
+        if i is None:
             return 0.0
 
-        limits = self.rate_limits[sender_email]
-        base_gap = limits['per_email_gap_sec']
+        base_gap = self.per_email_gap_sec[i]
 
         # For queue calculations, use the base gap time as the average
         # since randomization averages out to the base value over time
         return float(base_gap) if base_gap > 0 else 0.0
 
-    def try_reserve_send_slot(self, sender_email):
+    def try_acquire(self, sender_email, now=None):
         """
-        Atomically check if we can send and reserve a slot if possible.
-        This prevents race conditions in concurrent environments.
+        Atomically check every limit for a sender and reserve a send slot.
+
+        The global, per-run, per-minute, per-hour and gap checks all run in one
+        critical section, so there is no window between checking and reserving.
+        On success the send is counted and the sender's next gap starts at now,
+        so a second acquire inside the gap is refused; call record_sent() once
+        the email has gone out to restart that gap from the actual send time.
+
+        Args:
+            sender_email: Email address of the sender
+            now: Current time from time.monotonic() (defaults to now)
 
         Returns:
-            bool: True if slot was reserved, False if limits would be exceeded
+            bool: True if a slot was reserved, False if any limit would be exceeded
         """
-        with self._lock:
-            # Check global limit first
-            if self.global_limit > 0 and self.global_sent_count >= self.global_limit:
-                if self.logger:
-                    self.logger.warning(f"Global limit reached ({self.global_limit} emails). Cannot send more emails.")
+        if now is None:
+            now = time.monotonic()
+
+        i = self.sender_idx.get(sender_email)
+        if i is None:
+            # No limits for this sender, only the global slot is needed
+            if not self._take_global_slot():
+                self._warn_global_limit()
                 return False
+            with self._lock:
+                self._unlimited_sent += 1
+            return True
 
-            # Check sender-specific limits
-            if sender_email not in self.rate_limits:
-                # No limits for this sender, reserve slot
-                self.global_sent_count += 1
-                return True
+        flags = self.limit_flags[i]
 
-            sender_limits = self.rate_limits[sender_email]
+        with self._sender_locks[i]:
+            if flags & COUNT_LIMITS and not self._within_count_limits(sender_email, i, flags, now):
+                return False
+
+            # Check gap control
+            if flags & LIMIT_GAP and now - self.last_sent_time[i] < self.next_gap_time[i]:
+                return False
 
-            # Check total limit per run
-            if sender_limits['total_limit_per_run'] > 0:
-                if self.sent_counts[sender_email] >= sender_limits['total_limit_per_run']:
-                    if self.logger:
-                        self.logger.warning(f"Sender '{sender_email}' has reached total limit per run ({sender_limits['total_limit_per_run']})")
-                    return False
+            # Check global limit last, so a refused sender never consumes a global slot
+            if not self._take_global_slot():
+                self._warn_global_limit()
+                return False
 
-            # All checks passed, reserve the slot
-            self.global_sent_count += 1
-            self.sent_counts[sender_email] += 1
+            # All checks passed, reserve the slot and start the gap in the same section
+            self._count_send(i, flags, now)
+            if flags & LIMIT_GAP:
+                self._start_gap(sender_email, i, now)
             return True
 
+    def _count_send(self, i, flags, now):
+        """Count a send for the sender in slot i. The caller must hold the sender's lock."""
+        self.sent_counts[i] += 1
+        # Spend a token from each enabled bucket (legacy sends may drive it below zero)
+        if flags & LIMIT_PER_MIN:
+            self.tokens_min[i] -= 1.0
+        if flags & LIMIT_PER_HOUR:
+            self.tokens_hour[i] -= 1.0
+
+    def _start_gap(self, sender_email, i, now):
+        """Start the next randomized gap for the sender in slot i. The caller must hold the sender's lock."""
+        self.last_sent_time[i] = now
+
+        # Generate next randomized gap time for this sender
+        self.next_gap_time[i] = self.get_randomized_gap_time(sender_email)
+
+        if self._debug:
+            self.logger.debug("Sender '%s' send counted. Total this run: %d, Global total: %d, Next gap: %.2fs",
+                              sender_email, self.sent_counts[i], self.global_sent_count, self.next_gap_time[i])
+
     def record_sent(self, sender_email):
         """
         Record that an email was sent using the specified sender.
-        Note: If using try_reserve_send_slot(), counters are already incremented.
-        This method only updates timestamps and gap timing.
+        Note: try_acquire() already counted the send and drew the next gap.
+        This method only restarts that gap from the time the send finished.
         """
-        current_time = time.time()
+        current_time = time.monotonic()
 
-        # Update timestamps and timing (thread-safe)
-        with self._lock:
-            self.sent_timestamps[sender_email].append(current_time)
-            self.last_sent_time[sender_email] = current_time
+        # Senders without configured limits have no per-sender state to update
+        i = self.sender_idx.get(sender_email)
+        if i is None or not self.limit_flags[i] & LIMIT_GAP:
+            return
 
-            # Generate next randomized gap time for this sender
-            self.next_gap_time[sender_email] = self.get_randomized_gap_time(sender_email)
-
-            if self.logger:
-                self.logger.debug(f"Sender '{sender_email}' email sent. Total this run: {self.sent_counts[sender_email]}, "
-                                 f"Global total: {self.global_sent_count}, Next gap: {self.next_gap_time[sender_email]:.2f}s")
+        with self._sender_locks[i]:
+            self.last_sent_time[i] = current_time
 
     def record_sent_legacy(self, sender_email):
         """
-        Legacy method that increments counters. Use this if not using try_reserve_send_slot().
+        Legacy method that increments counters. Use this if not using try_acquire().
         """
-        current_time = time.time()
+        current_time = time.monotonic()
 
-        # Update counters (thread-safe)
-        with self._lock:
-            self.sent_counts[sender_email] += 1
-            self.sent_timestamps[sender_email].append(current_time)
-            self.last_sent_time[sender_email] = current_time
+        i = self.sender_idx.get(sender_email)
 
-            # Generate next randomized gap time for this sender
-            self.next_gap_time[sender_email] = self.get_randomized_gap_time(sender_email)
+        # Consume a global slot so reservations stay in step with legacy sends
+        next(self._global_slots)
 
-            # Increment global counter
-            self.global_sent_count += 1
+        # Senders without configured limits only count towards the global total
+        if i is None:
+            with self._lock:
+                self._unlimited_sent += 1
+            return
 
-            if self.logger:
-                self.logger.debug(f"Sender '{sender_email}' email sent. Total this run: {self.sent_counts[sender_email]}, "
-                                 f"Global total: {self.global_sent_count}, Next gap: {self.next_gap_time[sender_email]:.2f}s")
+        with self._sender_locks[i]:
+            self._count_send(i, self.limit_flags[i], current_time)
+            self._start_gap(sender_email, i, current_time)
     
     def is_global_limit_reached(self):
         """Check if the global email limit has been reached."""
-        with self._lock:
-            return self.global_limit > 0 and self.global_sent_count >= self.global_limit
+        return self.global_limit > 0 and self.global_sent_count >= self.global_limit
     
     def get_stats(self):
         """Get statistics for all senders."""
-        with self._lock:
-            stats = {
-                'global': {
-                    'total_sent': self.global_sent_count,
-                    'global_limit': self.global_limit,
-                    'remaining': max(0, self.global_limit - self.global_sent_count) if self.global_limit > 0 else 'unlimited'
-                }
+        global_sent_count = self.global_sent_count
+        stats = {
+            'global': {
+                'total_sent': global_sent_count,
+                'global_limit': self.global_limit,
+                'remaining': max(0, self.global_limit - global_sent_count) if self.global_limit > 0 else 'unlimited'
             }
+        }
 
-            for sender_email in self.rate_limits:
-                stats[sender_email] = {
-                    'total_sent_this_run': self.sent_counts[sender_email],
-                    'total_limit_per_run': self.rate_limits[sender_email]['total_limit_per_run'],
-                    'remaining_this_run': max(0, self.rate_limits[sender_email]['total_limit_per_run'] - self.sent_counts[sender_email]) if self.rate_limits[sender_email]['total_limit_per_run'] > 0 else 'unlimited'
-                }
+        for sender_email, i in self.sender_idx.items():
+            stats[sender_email] = {
+                'total_sent_this_run': self.sent_counts[i],
+                'total_limit_per_run': self.total_limit_per_run[i],
+                'remaining_this_run': max(0, self.total_limit_per_run[i] - self.sent_counts[i]) if self.total_limit_per_run[i] > 0 else 'unlimited'
+            }
         return stats
 
 
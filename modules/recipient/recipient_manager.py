@@ -30,9 +30,119 @@
 import os
 import csv
 import sqlite3
+import queue
 import threading
+import atexit
+from contextlib import contextmanager
 import fnmatch
-from typing import List, Dict, Optional, Tuple
+import re
+from collections import deque
+from collections.abc import Mapping
+from functools import lru_cache
+from urllib.parse import quote
+from typing import Iterator, List, Dict, Optional, Tuple
+
+# Upper bound on cached ignore-pattern results before the cache is reset
+IGNORE_CACHE_MAX_SIZE = 50000
+
+# CSV reading: read buffer size, and how much of the file is sampled for quoted fields
+CSV_BUFFER_SIZE = 1 << 20
+CSV_SAMPLE_SIZE = 4096
+CSV_SOURCE = 'csv'
+
+# Rows fetched from SQLite per round trip when loading recipients
+DB_FETCH_SIZE = 1000
+
+# Database-wide settings, applied once: WAL lets sender threads read while a status update commits
+DB_INIT_PRAGMAS = "PRAGMA journal_mode=WAL; PRAGMA mmap_size=268435456;"
+# Per-connection settings, applied to every thread-local connection
+DB_CONNECTION_PRAGMAS = "PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY; PRAGMA cache_size=-65536;"
+
+# Idle read-only connections kept for reuse; extra connections are closed when returned
+READ_POOL_SIZE = min(32, (os.cpu_count() or 1) * 4)
+
+# Status updates are written in batches of up to this many rows, or after this many seconds
+STATUS_BATCH_SIZE = 200
+STATUS_FLUSH_INTERVAL = 0.5
+# Pending updates beyond this are written synchronously by the caller
+STATUS_QUEUE_MAX_SIZE = 10000
+
+# Ignore patterns of the form "*@domain" (no other glob characters)
+DOMAIN_PATTERN_RE = re.compile(r'^\*@[^*?\[]+$')
+
+
+@lru_cache(maxsize=32)
+def _build_ignore_matchers(patterns: Tuple[str, ...]):
+    """
+    Split ignore patterns by kind so most emails are checked with hash lookups.
+
+    Exact addresses and "*@domain" patterns go into dicts keyed by the
+    lowercased address/domain; only true wildcards are compiled into a
+    single case-insensitive regex. Cached, since every queue worker builds
+    its own RecipientManager from the same configuration.
+
+    Returns:
+        Tuple of (exact dict, domain dict, wildcard pattern list, regex or None).
+        The results are shared and must not be modified.
+    """
+    ignore_exact: Dict[str, str] = {}
+    ignore_domains: Dict[str, str] = {}
+    wildcard_patterns = []
+
+    for pattern in patterns:
+        pattern = pattern.strip() if pattern else ''
+        if not pattern:
+            continue
+
+        pattern_lower = pattern.lower()
+        if not any(char in pattern_lower for char in '*?['):
+            ignore_exact.setdefault(pattern_lower, pattern)
+        elif DOMAIN_PATTERN_RE.match(pattern_lower):
+            ignore_domains.setdefault(pattern_lower[2:], pattern)
+        else:
+            wildcard_patterns.append(pattern)
+
+    # Each wildcard pattern gets its own named group so a match can report which
+    # one hit (translate() may add numbered groups of its own on older Pythons);
+    # IGNORECASE lets the regex run on the email as-is, without a lowercased copy
+    parts = [f"(?P<p{index}>{fnmatch.translate(pattern)})"
+             for index, pattern in enumerate(wildcard_patterns)]
+    ignore_re = re.compile('|'.join(parts), re.IGNORECASE) if parts else None
+
+    return ignore_exact, ignore_domains, wildcard_patterns, ignore_re
+
+
+class Recipient(Mapping):
+    """
+    A single recipient record.
+
+    Stored in __slots__ rather than a per-recipient dict, but still behaves as
+    a read-only mapping (recipient['email'], recipient.get(...), dict(recipient))
+    for code that expects recipient dicts.
+    """
+
+    __slots__ = ('email', 'row_id', 'source', 'status')
+
+    def __init__(self, email: str, row_id: int, source: str, status: Optional[str] = None):
+        self.email = email
+        self.row_id = row_id
+        self.source = source
+        self.status = status
+
+    def __getitem__(self, key):
+        if key in Recipient.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(Recipient.__slots__)
+
+    def __len__(self):
+        return len(Recipient.__slots__)
+
+    def __repr__(self):
+        return (f"Recipient(email={self.email!r}, row_id={self.row_id!r}, "
+                f"source={self.source!r}, status={self.status!r})")
 
 
 class RecipientManager:
@@ -42,14 +152,28 @@ class RecipientManager:
         self.config = config_settings
         self.base_dir = base_dir
         self.logger = logger
-        self.local_data = threading.local()  # Thread-local storage for database connections
+        self._read_pool = queue.LifoQueue(maxsize=READ_POOL_SIZE)  # Idle read-only database connections
         self.db_path = None
+        self._writer_conn = None  # Single connection for all writes, shared across threads
+        self._writer_lock = threading.Lock()
+
+        # Status updates are queued and written in batches by a background thread
+        self._pending_statuses = deque()
+        self._pending_cond = threading.Condition()
+        self._status_thread = None
+        self._closing = False
         
         # Validate configuration
         self._validate_config()
+
+        # Compile ignore patterns once instead of matching each glob per email
+        self._compile_ignore_patterns()
+
+        # Source type is checked on every status update, look it up once
+        self._recipients_from = self.config['recipients_from']
         
         # Initialize database connection if using db source
-        if self.config['recipients_from'] == 'db':
+        if self._recipients_from == 'db':
             self._init_database()
     
     def _validate_config(self):
@@ -68,6 +192,16 @@ class RecipientManager:
                 if not self.config.get(field):
                     raise ValueError(f"{field} is required when recipients_from is 'db'")
     
+    def _compile_ignore_patterns(self):
+        """Set up the ignore-pattern matchers (shared with other managers using the same patterns)."""
+        (self._ignore_exact, self._ignore_domains, self._ignore_patterns,
+         self._ignore_re) = _build_ignore_matchers(tuple(self.config.get('ignore_patterns', []) or ()))
+        self._has_lookup_patterns = bool(self._ignore_exact or self._ignore_domains)
+        self._has_ignore_patterns = bool(self._has_lookup_patterns or self._ignore_re is not None)
+
+        # Email -> matching pattern (None if not ignored), so repeated emails skip the regex
+        self._ignore_cache: Dict[str, Optional[str]] = {}
+
     def _init_database(self):
         """Initialize database connection and ensure email_sent column exists."""
         try:
@@ -81,23 +215,25 @@ class RecipientManager:
             # Store db_path for thread-local connections
             self.db_path = db_path
 
-            # Test connection and verify table structure
-            connection = self._get_db_connection()
-            connection.row_factory = sqlite3.Row  # Enable column access by name
+            # All writes go through one connection so threads never contend for the write lock;
+            # reads borrow pooled read-only connections (see _borrow_read_conn)
+            self._writer_conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._apply_pragmas(self._writer_conn, DB_INIT_PRAGMAS + DB_CONNECTION_PRAGMAS)
+
+            # Verify table structure
+            connection = self._writer_conn
 
             # Check if table exists
-            cursor = connection.cursor()
-            cursor.execute("""
+            table_row = connection.execute("""
                 SELECT name FROM sqlite_master 
                 WHERE type='table' AND name=?
-            """, (self.config['db_table'],))
+            """, (self.config['db_table'],)).fetchone()
             
-            if not cursor.fetchone():
+            if not table_row:
                 raise ValueError(f"Table '{self.config['db_table']}' does not exist in database")
             
             # Check if required columns exist
-            cursor.execute(f"PRAGMA table_info({self.config['db_table']})")
-            columns = [column[1] for column in cursor.fetchall()]
+            columns = [column[1] for column in connection.execute(f"PRAGMA table_info({self.config['db_table']})").fetchall()]
             
             if self.config['db_email_column'] not in columns:
                 raise ValueError(f"Column '{self.config['db_email_column']}' does not exist in table '{self.config['db_table']}'")
@@ -107,36 +243,127 @@ class RecipientManager:
             
             # Add email_sent column if it doesn't exist
             if 'email_sent' not in columns:
-                cursor.execute(f"""
+                connection.execute(f"""
                     ALTER TABLE {self.config['db_table']} 
                     ADD COLUMN email_sent TEXT DEFAULT NULL
                 """)
                 connection.commit()
                 self.logger.info(f"Added 'email_sent' column to table '{self.config['db_table']}'")
+
+            self._create_indexes(connection, columns)
+            self._build_statements()
             
         except Exception as e:
             self.logger.error(f"Error initializing database: {e}")
             raise
 
-    def _get_db_connection(self):
-        """Get thread-local database connection."""
-        if not hasattr(self.local_data, 'connection'):
-            self.local_data.connection = sqlite3.connect(self.db_path)
-            self.local_data.connection.row_factory = sqlite3.Row
-        return self.local_data.connection
+    def _build_statements(self):
+        """
+        Compose the SQL statements once. Table and column names have already
+        been checked against the schema, and stable statement text lets
+        sqlite3 reuse its prepared statements across calls.
+        """
+        table = self.config['db_table']
+        email_column = self.config['db_email_column']
+        id_column = self.config['db_id_column']
+
+        self._select_unsent_sql = f"""
+                SELECT {id_column} as id, {email_column} as email, email_sent
+                FROM {table}
+                WHERE {email_column} IS NOT NULL
+                AND {email_column} != ''
+                AND (email_sent IS NULL OR email_sent = '')
+            """
+        # Filter and ignore conditions only depend on the configuration
+        self._filter_sql = self._build_filter_conditions()
+        self._ignore_sql = self._build_ignore_conditions()
+        self._update_status_sql = f"UPDATE {table} SET email_sent = ? WHERE {id_column} = ?"
+        # Total, sent and error counts in a single pass over the table
+        self._stats_sql = f"""
+                SELECT COUNT(*) as total,
+                       COALESCE(SUM(CASE WHEN email_sent = 'sent' THEN 1 ELSE 0 END), 0) as sent,
+                       COALESCE(SUM(CASE WHEN email_sent = 'error' THEN 1 ELSE 0 END), 0) as errors
+                FROM {table}
+                WHERE {email_column} IS NOT NULL
+                AND {email_column} != ''
+            """
+
+    def _create_indexes(self, connection, columns: List[str]):
+        """Create indexes for the recipients query: unsent rows and configured filter columns."""
+        table = self.config['db_table']
 
-    def get_recipients(self, limit: int = None) -> List[Dict]:
+        # Partial index matching the query's unsent condition, so sent rows are never scanned
+        statements = [f"""
+            CREATE INDEX IF NOT EXISTS idx_{table}_unsent ON {table}(email_sent)
+            WHERE email_sent IS NULL OR email_sent = ''
+        """]
+        for column_name in self.config.get('filter_columns', {}):
+            if column_name in columns:
+                statements.append(f"CREATE INDEX IF NOT EXISTS idx_{table}_{column_name} ON {table}({column_name})")
+
+        try:
+            for statement in statements:
+                connection.execute(statement)
+            # Sampled statistics so the planner picks the indexes without a full-table ANALYZE
+            connection.execute("PRAGMA analysis_limit=1000")
+            connection.execute(f"ANALYZE {table}")
+            connection.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not create indexes on table '{table}': {e}")
+
+    @contextmanager
+    def _borrow_read_conn(self):
+        """
+        Borrow a read-only database connection from the pool.
+
+        Connections are shared between threads and reused, so the database,
+        -wal and -shm files are not reopened (and PRAGMAs not re-applied) for
+        every thread that reads.
+        """
+        try:
+            connection = self._read_pool.get_nowait()
+        except queue.Empty:
+            connection = sqlite3.connect(f"file:{quote(self.db_path)}?mode=ro", uri=True,
+                                         check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            self._apply_pragmas(connection, DB_CONNECTION_PRAGMAS)
+
+        try:
+            yield connection
+        finally:
+            try:
+                self._read_pool.put_nowait(connection)
+            except queue.Full:
+                connection.close()
+
+    def _apply_pragmas(self, connection, pragmas: str):
+        """Apply SQLite tuning PRAGMAs; failures are logged since they only affect speed."""
+        try:
+            connection.executescript(pragmas)
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not apply SQLite settings ({pragmas}): {e}")
+
+    def get_recipients(self, limit: int = None) -> List[Recipient]:
         """Get list of recipients from configured source."""
-        if self.config['recipients_from'] == 'csv':
-            return self._get_recipients_from_csv(limit=limit)
-        elif self.config['recipients_from'] == 'db':
-            return self._get_recipients_from_db(limit=limit)
+        return list(self.iter_recipients(limit=limit))
+
+    def iter_recipients(self, limit: int = None) -> Iterator[Recipient]:
+        """
+        Yield recipients from configured source one at a time.
+
+        Rows are read as they are consumed, so a caller can start working on
+        the first recipients without holding the whole list in memory.
+        """
+        if self._recipients_from == 'csv':
+            return self._iter_recipients_from_csv(limit=limit)
+        elif self._recipients_from == 'db':
+            return self._iter_recipients_from_db(limit=limit)
         else:
-            raise ValueError(f"Unsupported recipients_from value: {self.config['recipients_from']}")
+            raise ValueError(f"Unsupported recipients_from value: {self._recipients_from}")
     
-    def _get_recipients_from_csv(self, limit: int = None) -> List[Dict]:
+    def _iter_recipients_from_csv(self, limit: int = None) -> Iterator[Recipient]:
         """Load recipients from CSV file."""
-        recipients = []
+        loaded_count = 0
         ignored_count = 0
         recipients_path = self.config['recipients_path']
 
@@ -147,94 +374,121 @@ class RecipientManager:
             raise FileNotFoundError(f"Recipients file not found: {recipients_path}")
 
         try:
-            with open(recipients_path, mode="r", newline="", encoding="utf-8") as csvfile:
-                reader = csv.reader(csvfile)
-                for row_num, row in enumerate(reader, 1):
-                    if row and row[0].strip():  # Skip empty rows
-                        email = row[0].strip()
-
-                        # Check if email should be ignored
-                        if self._should_ignore_email(email):
-                            ignored_count += 1
-                            continue
-
-                        recipients.append({
-                            'email': email,
-                            'row_id': row_num,
-                            'source': 'csv'
-                        })
-
-                        # Check if we've reached the limit
-                        if limit and len(recipients) >= limit:
-                            break
-
-            self.logger.info(f"Loaded {len(recipients)} recipients from CSV file")
-            if ignored_count > 0:
-                self.logger.info(f"Ignored {ignored_count} recipients due to ignore patterns")
-            return recipients
+            with open(recipients_path, mode="r", newline="", encoding="utf-8",
+                      buffering=CSV_BUFFER_SIZE) as csvfile:
+                # Without quoted fields the email is simply everything before the first comma
+                simple_csv = '"' not in csvfile.read(CSV_SAMPLE_SIZE)
+                csvfile.seek(0)
+
+                if simple_csv:
+                    emails = self._iter_first_column(csvfile)
+                else:
+                    emails = (row[0] if row else '' for row in csv.reader(csvfile))
+
+                for row_num, email in enumerate(emails, 1):
+                    email = email.strip()
+                    if not email:  # Skip empty rows
+                        continue
+
+                    # Check if email should be ignored
+                    if self._should_ignore_email(email):
+                        ignored_count += 1
+                        continue
+
+                    loaded_count += 1
+                    yield Recipient(email, row_num, CSV_SOURCE)
+
+                    # Check if we've reached the limit (None/0 never matches)
+                    if loaded_count == limit:
+                        break
 
         except Exception as e:
             self.logger.error(f"Error reading CSV file {recipients_path}: {e}")
             raise
+
+        finally:
+            # Also reached when the caller stops iterating early
+            self.logger.info(f"Loaded {loaded_count} recipients from CSV file")
+            if ignored_count > 0:
+                self.logger.info(f"Ignored {ignored_count} recipients due to ignore patterns")
     
-    def _get_recipients_from_db(self, limit: int = None) -> List[Dict]:
+    @staticmethod
+    def _iter_first_column(csvfile):
+        """Yield the first column of each line of a CSV file without quoted fields."""
+        for line in csvfile:
+            if '"' in line:
+                # Quoted field beyond the sampled part, let the csv module parse this line
+                row = next(csv.reader([line]), None)
+                yield row[0] if row else ''
+            else:
+                yield line.split(',', 1)[0]
+
+    def _iter_recipients_from_db(self, limit: int = None) -> Iterator[Recipient]:
         """Load recipients from database, excluding already sent emails and applying filters."""
-        recipients = []
+        loaded_count = 0
         ignored_count = 0
+        filter_conditions = ignore_conditions = ""
+        ignore_params = []
 
         try:
-            connection = self._get_db_connection()
-            cursor = connection.cursor()
-
-            # Build the base query
-            query = f"""
-                SELECT {self.config['db_id_column']} as id, {self.config['db_email_column']} as email, email_sent
-                FROM {self.config['db_table']}
-                WHERE {self.config['db_email_column']} IS NOT NULL
-                AND {self.config['db_email_column']} != ''
-                AND (email_sent IS NULL OR email_sent = '')
-            """
+            with self._borrow_read_conn() as connection:
+                cursor = connection.cursor()
 
-            # Add column filters if specified
-            filter_conditions, filter_params = self._build_filter_conditions()
-            if filter_conditions:
-                query += f" AND ({filter_conditions})"
+                # Start from the prepared base query
+                query = self._select_unsent_sql
 
-            # Add LIMIT clause if specified
-            if limit and limit > 0:
-                query += f" LIMIT {limit}"
+                # Add column filters if specified
+                filter_conditions, filter_params = self._filter_sql
+                if filter_conditions:
+                    query += f" AND ({filter_conditions})"
 
-            self.logger.debug(f"Executing query: {query}")
-            self.logger.debug(f"With parameters: {filter_params}")
-            cursor.execute(query, filter_params)
-            rows = cursor.fetchall()
+                # Let SQLite drop rows matching simple ignore patterns before they reach Python
+                ignore_conditions, ignore_params = self._ignore_sql
+                if ignore_conditions:
+                    query += f" AND ({ignore_conditions})"
+                    filter_params = filter_params + ignore_params
 
-            for row in rows:
-                email = row['email']
+                # Add LIMIT clause if specified
+                if limit and limit > 0:
+                    query += f" LIMIT {limit}"
 
-                # Check if email should be ignored
-                if self._should_ignore_email(email):
-                    ignored_count += 1
-                    continue
+                self.logger.debug("Executing query: %s", query)
+                self.logger.debug("With parameters: %s", filter_params)
+                cursor.execute(query, filter_params)
 
-                recipients.append({
-                    'email': email,
-                    'row_id': row['id'],  # Now uses the configurable primary key
-                    'source': 'db',
-                    'status': row['email_sent']
-                })
+                # Stream rows in chunks instead of materializing the whole result set
+                cursor.arraysize = DB_FETCH_SIZE
+                while True:
+                    rows = cursor.fetchmany()
+                    if not rows:
+                        break
 
-            self.logger.info(f"Loaded {len(recipients)} unsent recipients from database")
-            if filter_conditions:
-                self.logger.info(f"Applied column filters: {filter_conditions}")
-            if ignored_count > 0:
-                self.logger.info(f"Ignored {ignored_count} recipients due to ignore patterns")
-            return recipients
+                    for row in rows:
+                        email = row['email'].strip()
+
+                        # Check if email should be ignored
+                        if self._should_ignore_email(email):
+                            ignored_count += 1
+                            continue
+
+                        loaded_count += 1
+                        # row_id uses the configurable primary key
+                        yield Recipient(email, row['id'], 'db', row['email_sent'])
 
         except Exception as e:
             self.logger.error(f"Error reading from database: {e}")
             raise
 
+        finally:
+            # Also reached when the caller stops iterating early
+            self.logger.info(f"Loaded {loaded_count} unsent recipients from database")
+            if filter_conditions:
+                self.logger.info(f"Applied column filters: {filter_conditions}")
+            if ignore_conditions:
+                self.logger.info(f"Applied {len(ignore_params)} ignore patterns in the database query")
+            if ignored_count > 0:
+                self.logger.info(f"Ignored {ignored_count} recipients due to ignore patterns")
+
     def _build_filter_conditions(self) -> Tuple[str, List]:
         """Build SQL WHERE conditions and parameters based on column filters."""
         filter_columns = self.config.get('filter_columns', {})
@@ -266,12 +520,43 @@ class RecipientManager:
         
         return ' AND '.join(conditions) if conditions else "", parameters
 
+    def _build_ignore_conditions(self) -> Tuple[str, List]:
+        """
+        Build SQL WHERE conditions that exclude emails matching ignore patterns.
+
+        Exact addresses become a NOT IN list and patterns using only * and ?
+        become NOT LIKE clauses. Patterns with [...] classes cannot be expressed
+        in LIKE and are left to _should_ignore_email().
+        """
+        email_column = f"lower(trim({self.config['db_email_column']}))"
+        conditions = []
+        parameters = []
+
+        if self._ignore_exact:
+            placeholders = ','.join(['?' for _ in self._ignore_exact])
+            conditions.append(f"{email_column} NOT IN ({placeholders})")
+            parameters.extend(self._ignore_exact)
+
+        like_patterns = [f"*@{domain}" for domain in self._ignore_domains]
+        like_patterns += [pattern.lower() for pattern in self._ignore_patterns if '[' not in pattern]
+        for pattern in like_patterns:
+            conditions.append(f"{email_column} NOT LIKE ? ESCAPE '\\'")
+            parameters.append(self._glob_to_like(pattern))
+
+        return ' AND '.join(conditions), parameters
+
+    @staticmethod
+    def _glob_to_like(pattern: str) -> str:
+        """Translate a glob using only * and ? into a LIKE pattern (escape character: backslash)."""
+        pattern = pattern.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return pattern.replace('*', '%').replace('?', '_')
+
     def _should_ignore_email(self, email: str) -> bool:
         """
         Check if an email should be ignored based on ignore patterns.
 
         Args:
-            email: Email address to check
+            email: Email address to check (already stripped by the loaders)
 
         Returns:
             True if email should be ignored, False otherwise
@@ -279,87 +564,147 @@ class RecipientManager:
         if not email:
             return True
 
-        ignore_patterns = self.config.get('ignore_patterns', [])
-        if not ignore_patterns:
+        if not self._has_ignore_patterns:
             return False
 
-        email_lower = email.lower().strip()
-
-        for pattern in ignore_patterns:
-            if not pattern:
-                continue
+        try:
+            pattern = self._ignore_cache[email]
+        except KeyError:
+            pattern = self._match_ignore_pattern(email)
 
-            # Convert pattern to lowercase for case-insensitive matching
-            pattern_lower = pattern.lower().strip()
+            if len(self._ignore_cache) >= IGNORE_CACHE_MAX_SIZE:
+                self._ignore_cache.clear()
+            self._ignore_cache[email] = pattern
 
-            # Use fnmatch for wildcard pattern matching
-            if fnmatch.fnmatch(email_lower, pattern_lower):
-                self.logger.debug(f"Email '{email}' ignored due to pattern '{pattern}'")
-                return True
+        if pattern is not None:
+            self.logger.debug("Email '%s' ignored due to pattern '%s'", email, pattern)
+            return True
 
         return False
     
+    def _match_ignore_pattern(self, email: str) -> Optional[str]:
+        """Return the ignore pattern matching an email, or None."""
+        if self._has_lookup_patterns:
+            # Lookup keys are lowercased, so only these need a lowercased copy
+            email_lower = email.lower()
+            pattern = self._ignore_exact.get(email_lower)
+            if pattern is not None:
+                return pattern
+
+            _, at, domain = email_lower.rpartition('@')
+            if at:
+                pattern = self._ignore_domains.get(domain)
+                if pattern is not None:
+                    return pattern
+
+        if self._ignore_re is not None:
+            match = self._ignore_re.match(email)
+            if match:
+                return self._ignore_patterns[int(match.lastgroup[1:])]
+
+        return None
+
     def update_recipient_status(self, recipient: Dict, status: str) -> bool:
-        """Update recipient status in database. Only works for database source."""
-        if self.config['recipients_from'] != 'db':
-            self.logger.debug(f"Status update skipped for CSV source: {recipient['email']}")
+        """
+        Queue a recipient status update. Only works for database source.
+
+        Updates are written in batches by a background thread; call flush()
+        (or close()) to make sure every queued update has been written.
+        """
+        if self._recipients_from != 'db':
+            self.logger.debug("Status update skipped for CSV source: %s", recipient['email'])
             return True
-        
-        try:
-            connection = self._get_db_connection()
-            cursor = connection.cursor()
-            cursor.execute(f"""
-                UPDATE {self.config['db_table']}
-                SET email_sent = ?
-                WHERE {self.config['db_id_column']} = ?
-            """, (status, recipient['row_id']))
 
-            connection.commit()
-            
-            if cursor.rowcount > 0:
-                self.logger.debug(f"Updated status for {recipient['email']} to '{status}'")
+        with self._pending_cond:
+            if self._closing:
+                self.logger.warning(f"Status update for {recipient['email']} not written: recipient manager is closed")
+                return False
+
+            if self._status_thread is None:
+                self._start_status_writer()
+
+            self._pending_statuses.append((status, recipient['row_id']))
+            queue_full = len(self._pending_statuses) >= STATUS_QUEUE_MAX_SIZE
+            if len(self._pending_statuses) >= STATUS_BATCH_SIZE:
+                self._pending_cond.notify()
+
+        self.logger.debug("Queued status update for %s to '%s'", recipient['email'], status)
+
+        # Writer has fallen behind; write synchronously rather than grow the queue further
+        if queue_full:
+            return self.flush()
+        return True
+
+    def _start_status_writer(self):
+        """Start the background thread that writes queued status updates. Caller holds _pending_cond."""
+        self._status_thread = threading.Thread(target=self._status_writer_loop,
+                                               name="RecipientStatusWriter", daemon=True)
+        self._status_thread.start()
+        # Daemon threads are killed at exit, so write whatever is still queued then
+        atexit.register(self.flush)
+
+    def _status_writer_loop(self):
+        """Write queued status updates every STATUS_BATCH_SIZE rows or STATUS_FLUSH_INTERVAL seconds."""
+        while True:
+            with self._pending_cond:
+                self._pending_cond.wait_for(
+                    lambda: len(self._pending_statuses) >= STATUS_BATCH_SIZE or self._closing,
+                    STATUS_FLUSH_INTERVAL)
+                if self._closing:
+                    return
+
+            if not self.flush():
+                # Failed batch stays queued; back off before retrying it
+                with self._pending_cond:
+                    self._pending_cond.wait_for(lambda: self._closing, STATUS_FLUSH_INTERVAL)
+
+    def flush(self) -> bool:
+        """
+        Write all queued status updates in one transaction.
+
+        Updates are only removed from the queue once the transaction has
+        committed, so a failed write is retried by the next flush.
+        """
+        # Draining under the writer lock keeps batches in the order they were queued
+        with self._writer_lock:
+            with self._pending_cond:
+                batch = list(self._pending_statuses)
+
+            if not batch:
                 return True
-            else:
-                self.logger.warning(f"No rows updated for recipient {recipient['email']}")
+
+            if self._writer_conn is None:
+                self.logger.warning(f"{len(batch)} recipient status updates not written: database connection is closed")
                 return False
-                
-        except Exception as e:
-            self.logger.error(f"Error updating recipient status: {e}")
-            return False
+
+            try:
+                cursor = self._writer_conn.executemany(self._update_status_sql, batch)
+                self._writer_conn.commit()
+            except Exception as e:
+                self._writer_conn.rollback()
+                self.logger.error(f"Error updating recipient status: {e}")
+                return False
+
+            # New updates are only ever appended, so the written batch is still at the front
+            with self._pending_cond:
+                for _ in range(len(batch)):
+                    self._pending_statuses.popleft()
+
+        if cursor.rowcount < len(batch):
+            self.logger.warning(f"Only {cursor.rowcount} of {len(batch)} recipient status updates matched a row")
+        else:
+            self.logger.debug("Wrote %d recipient status updates", len(batch))
+        return True
     
     def get_recipient_statistics(self) -> Dict:
         """Get statistics about recipient status. Only works for database source."""
-        if self.config['recipients_from'] != 'db':
+        if self._recipients_from != 'db':
             return {'message': 'Statistics only available for database source'}
         
         try:
-            connection = self._get_db_connection()
-            cursor = connection.cursor()
-            
-            # Get total count
-            cursor.execute(f"""
-                SELECT COUNT(*) as total 
-                FROM {self.config['db_table']} 
-                WHERE {self.config['db_email_column']} IS NOT NULL 
-                AND {self.config['db_email_column']} != ''
-            """)
-            total = cursor.fetchone()[0]
-            
-            # Get sent count
-            cursor.execute(f"""
-                SELECT COUNT(*) as sent 
-                FROM {self.config['db_table']} 
-                WHERE email_sent = 'sent'
-            """)
-            sent = cursor.fetchone()[0]
-            
-            # Get error count
-            cursor.execute(f"""
-                SELECT COUNT(*) as errors 
-                FROM {self.config['db_table']} 
-                WHERE email_sent = 'error'
-            """)
-            errors = cursor.fetchone()[0]
+            with self._borrow_read_conn() as connection:
+                # Get total, sent and error counts
+                total, sent, errors = connection.execute(self._stats_sql).fetchone()
             
             # Get pending count
             pending = total - sent - errors
@@ -376,10 +721,25 @@ class RecipientManager:
             return {'error': str(e)}
     
     def close(self):
-        """Close database connection if open."""
-        if hasattr(self.local_data, 'connection'):
-            self.local_data.connection.close()
-            delattr(self.local_data, 'connection')
+        """Write pending status updates and close database connections if open."""
+        with self._pending_cond:
+            self._closing = True
+            self._pending_cond.notify()
+        if self._status_thread is not None and self._status_thread is not threading.current_thread():
+            self._status_thread.join()
+        self.flush()
+        atexit.unregister(self.flush)
+
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+        with self._writer_lock:
+            if self._writer_conn is not None:
+                self._writer_conn.close()
+                self._writer_conn = None
     
     def __del__(self):
         """Ensure database connection is closed when object is destroyed."""
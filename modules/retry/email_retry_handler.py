@@ -1,4 +1,5 @@
 import time
+import threading
 from typing import Dict, Any, Optional
 
 class EmailRetryHandler:
@@ -7,6 +8,14 @@ class EmailRetryHandler:
     def __init__(self, retry_settings, logger=None):
         self.retry_settings = retry_settings
         self.logger = logger
+
+        # Settings read on every send, looked up once
+        self._max_retries = retry_settings['max_retries_per_sender']
+        self._retry_delay = retry_settings['retry_delay']
+        self._max_recipient_retries = retry_settings['max_retries_per_recipient']
+
+        # Set by shutdown() to cut retry and gap waits short
+        self._shutdown = threading.Event()
         
         self.logger.info("EmailRetryHandler initialized with settings: "
                         f"max_retries_per_sender={retry_settings['max_retries_per_sender']}, "
@@ -26,8 +35,8 @@ class EmailRetryHandler:
         sender_password = sender_info["password"]
         smtp_id = sender_info.get("smtp_id", "default")
         
-        max_retries = self.retry_settings['max_retries_per_sender']
-        retry_delay = self.retry_settings['retry_delay']
+        max_retries = self._max_retries
+        retry_delay = self._retry_delay
         
         result = {
             'success': False,
@@ -43,8 +52,8 @@ class EmailRetryHandler:
             result['attempts'] = attempt + 1
             
             try:
-                self.logger.debug(f"Attempt {attempt + 1}/{max_retries + 1} to send email "
-                                f"from '{sender_email}' to '{recipient_email}'")
+                self.logger.debug("Attempt %s/%s to send email from '%s' to '%s'",
+                                  attempt + 1, max_retries + 1, sender_email, recipient_email)
                 
                 success = email_sender.send_email(
                     sender_email=sender_email,
@@ -75,8 +84,10 @@ class EmailRetryHandler:
             
             # Don't wait after the last attempt
             if attempt < max_retries:
-                self.logger.debug(f"Waiting {retry_delay} seconds before retry...")
-                time.sleep(retry_delay)
+                self.logger.debug("Waiting %s seconds before retry...", retry_delay)
+                if self._shutdown.wait(retry_delay):
+                    self.logger.info(f"Shutdown requested, abandoning retries for '{recipient_email}'")
+                    return result
         
         # All attempts failed
         self.logger.error(f"All {result['attempts']} attempts failed for '{sender_email}' to '{recipient_email}'. "
@@ -96,7 +107,7 @@ class EmailRetryHandler:
         if max_fallback_attempts is None:
             max_fallback_attempts = len(available_senders)
         
-        max_recipient_retries = self.retry_settings['max_retries_per_recipient']
+        max_recipient_retries = self._max_recipient_retries
         
         result = {
             'success': False,
@@ -112,15 +123,29 @@ class EmailRetryHandler:
         
         senders_tried = 0
         
-        # Sort senders by availability (gap-aware) for optimal selection
-        if rate_limiter:
-            import time
-            current_time = time.time()
-            # Sort by gap wait time (ascending) - prefer immediately available senders
-            available_senders = sorted(available_senders,
-                                     key=lambda s: rate_limiter.get_gap_wait_time(s["email"], current_time))
-
+        # Snapshot each sender's gap deadline, blocked state and rate limit state once
+        now = time.monotonic()
+        candidates = []
         for sender_info in available_senders:
+            sender_email = sender_info["email"]
+            candidates.append((
+                rate_limiter.schedule_next_slot(sender_email) if rate_limiter else float('-inf'),
+                failure_tracker.is_sender_blocked(sender_email) if failure_tracker else False,
+                rate_limiter.can_send_ignoring_gap(sender_email) if rate_limiter else True,
+                sender_info
+            ))
+
+        # Sort by gap deadline (ascending) - prefer immediately available senders
+        candidates.sort(key=lambda candidate: candidate[0])
+
+        # Which senders could send right now, and how many of them are still ahead in the loop
+        immediate = [deadline <= now and not blocked and can_send
+                     for deadline, blocked, can_send, _ in candidates]
+        immediate_remaining = sum(immediate)
+
+        for i, (deadline, blocked, can_send, sender_info) in enumerate(candidates):
+            immediate_remaining -= immediate[i]
+
             if senders_tried >= max_fallback_attempts:
                 self.logger.info(f"Reached max fallback attempts ({max_fallback_attempts}) for '{recipient_email}'")
                 break
@@ -132,33 +157,33 @@ class EmailRetryHandler:
             sender_email = sender_info["email"]
 
             # Check if sender is blocked
-            if failure_tracker and failure_tracker.is_sender_blocked(sender_email):
+            if blocked:
                 self.logger.info(f"Skipping blocked sender '{sender_email}' for '{recipient_email}'")
                 continue
 
             # Check rate limits (excluding gap for now)
-            if rate_limiter and not rate_limiter.can_send_ignoring_gap(sender_email):
+            if not can_send:
                 self.logger.info(f"Skipping rate-limited sender '{sender_email}' for '{recipient_email}'")
                 continue
 
             # Check if gap is satisfied, if not, wait only if this is our best option
             if rate_limiter:
-                wait_time = rate_limiter.get_gap_wait_time(sender_email)
+                wait_time = deadline - time.monotonic()
                 if wait_time > 0:
-                    # Check if there are other immediately available senders
-                    has_immediate_alternative = any(
-                        rate_limiter.get_gap_wait_time(s["email"]) == 0
-                        and not (failure_tracker and failure_tracker.is_sender_blocked(s["email"]))
-                        and rate_limiter.can_send_ignoring_gap(s["email"])
-                        for s in available_senders[available_senders.index(sender_info)+1:]
-                    )
-
-                    if has_immediate_alternative:
-                        self.logger.debug(f"Skipping sender '{sender_email}' (gap: {wait_time:.1f}s) - better options available")
+                    # Skip if there are other immediately available senders
+                    if immediate_remaining > 0:
+                        self.logger.debug("Skipping sender '%s' (gap: %.1fs) - better options available", sender_email, wait_time)
                         continue
                     else:
                         self.logger.info(f"Waiting {wait_time:.2f}s for sender '{sender_email}' (best available option)")
-                        time.sleep(wait_time)
+                        if self._shutdown.wait(wait_time):
+                            self.logger.info(f"Shutdown requested, abandoning fallbacks for '{recipient_email}'")
+                            return result
+
+            # Atomically check all limits and reserve a send slot
+            if rate_limiter and not rate_limiter.try_acquire(sender_email):
+                self.logger.info(f"Skipping rate-limited sender '{sender_email}' for '{recipient_email}'")
+                continue
 
             senders_tried += 1
 
@@ -168,7 +193,7 @@ class EmailRetryHandler:
                 sender_info=sender_info,
                 recipient_email=recipient_email,
                 subject=subject,
-                body_html=body_html,
+                body_content=body_html,
                 attachments=attachments
             )
             
@@ -208,6 +233,10 @@ class EmailRetryHandler:
         
         return result
 
+    def shutdown(self):
+        """Stop waiting between retries; in-progress sends return after their current attempt."""
+        self._shutdown.set()
+
     def get_stats(self):
         """Get retry handler statistics."""
         return {
@@ -1,8 +1,17 @@
+import os
+import queue
 import time
 import threading
-from typing import List, Dict, Any, Callable, Optional
+import types
+from collections.abc import Mapping
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import List, Dict, Any, Callable, Iterable, Optional, Sized
 from modules.core.email_task import EmailTask
 
+# Marks the end of the recipient iterator
+_END = object()
+
 class BatchScheduler:
     """
     Manages batch processing of emails with intelligent scheduling.
@@ -10,27 +19,46 @@ class BatchScheduler:
     """
     
     def __init__(self, queue_manager, batch_size: int = 60, 
-                 batch_interval: int = 30, logger=None):
+                 batch_interval: int = 30, logger=None,
+                 target_batch_latency: Optional[float] = None,
+                 min_batch_size: int = 1, max_batch_size: Optional[int] = None,
+                 aimd_step: int = 5, aimd_backoff: float = 0.9):
         """
         Initialize batch scheduler.
         
         Args:
             queue_manager: SmartQueueManager instance
             batch_size: Number of emails to process per batch
-            batch_interval: Minimum seconds between batches
+            batch_interval: Minimum seconds between batch starts
             logger: Logger instance
+            target_batch_latency: Batch time (seconds) below which the batch size
+                grows; None keeps the batch size fixed
+            min_batch_size: Lower bound for the adaptive batch size
+            max_batch_size: Upper bound for the adaptive batch size
+                (defaults to 10x batch_size)
+            aimd_step: Emails added to the batch size after a healthy batch
+            aimd_backoff: Factor applied to the batch size after a slow or
+                partially failed batch
         """
         self.queue_manager = queue_manager
         self.batch_size = batch_size
         self.batch_interval = batch_interval
         self.logger = logger
         
+        # Adaptive (AIMD) batch sizing
+        self.target_batch_latency = target_batch_latency
+        self.min_batch_size = max(1, min_batch_size)
+        self.max_batch_size = max_batch_size if max_batch_size is not None else batch_size * 10
+        self.aimd_step = aimd_step
+        self.aimd_backoff = aimd_backoff
+        
         # Scheduling state
         self.is_running = False
         self.current_batch = 0
         self.total_batches = 0
         self.last_batch_time = 0
         self.scheduler_thread = None
+        self._stop_event = threading.Event()
         
         # Batch statistics
         self.batch_stats = {
@@ -41,21 +69,34 @@ class BatchScheduler:
             'start_time': None,
             'end_time': None
         }
+        self._stats_view = types.MappingProxyType(self.batch_stats)
+        # Guards batch_stats updates so snapshots never see a half-applied batch
+        self._stats_lock = threading.Lock()
+        # Batch and run durations are measured in monotonic nanoseconds
+        self._total_batch_time_ns = 0
+        self._run_start_ns = 0
+        self._run_time_ns = 0
         
         # Callbacks
         self.on_batch_start: Optional[Callable] = None
         self.on_batch_complete: Optional[Callable] = None
         self.on_all_batches_complete: Optional[Callable] = None
     
-    def schedule_batches(self, recipients: List[Dict], email_template: Dict,
-                        process_batch_callback: Callable) -> None:
+    def schedule_batches(self, recipients: Iterable[Dict], email_template: Dict,
+                        process_batch_callback: Callable,
+                        total_recipients: Optional[int] = None) -> None:
         """
         Schedule and process email batches.
         
+        Recipients are pulled from the iterable one batch at a time, so a
+        generator (e.g. over a database cursor) is never fully materialized.
+        
         Args:
-            recipients: List of recipient dictionaries
+            recipients: Iterable of recipient dictionaries
             email_template: Email template configuration
             process_batch_callback: Function to call for processing each batch
+            total_recipients: Recipient count for progress reporting; taken
+                from len() when recipients is sized, otherwise left unknown
         """
         if self.is_running:
             if self.logger:
@@ -63,66 +104,267 @@ class BatchScheduler:
             return
         
         self.is_running = True
+        self._stop_event.clear()
         self.batch_stats['start_time'] = time.time()
+        self._run_start_ns = time.monotonic_ns()
+        
+        if total_recipients is None and isinstance(recipients, Sized):
+            total_recipients = len(recipients)
+        total_label = total_recipients if total_recipients is not None else "?"
         
-        # Calculate total batches
-        self.total_batches = (len(recipients) + self.batch_size - 1) // self.batch_size
+        # Calculate total batches (0 while unknown)
+        self.total_batches = self._batches_left(total_recipients)
         
         if self.logger:
-            self.logger.info(f"Scheduling {len(recipients)} emails in {self.total_batches} batches "
+            self.logger.info(f"Scheduling {total_label} emails in {self.total_batches or '?'} batches "
                            f"(batch size: {self.batch_size})")
         
+        # Bind what the loop touches on every batch; batches are sized as they
+        # are pulled, so slice bounds cannot be precomputed
+        logger = self.logger
+        on_start = self.on_batch_start
+        stop_requested = self._stop_event.is_set
+        run_batch = self._run_batch
+        
+        # A single worker sends batch N while the scheduler paces batch N+1; the
+        # pool only lives for this run, so its thread is shut down when it ends
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="batch-sender")
+        submit = executor.submit
+        
+        in_flight = None
         try:
-            for batch_num in range(self.total_batches):
-                if not self.is_running:
+            if self.batch_size == 1 and self.target_batch_latency is None:
+                # Strict per-email pacing needs no slicing or resizing
+                self._schedule_unit_batches(recipients, email_template, process_batch_callback,
+                                            total_label, submit)
+                return
+            
+            recipient_iter = iter(recipients)
+            # One recipient of lookahead tells whether another batch follows
+            # before the batch interval is waited out
+            next_recipient = next(recipient_iter, _END)
+            batch_num = 0
+            pos = 0
+            while next_recipient is not _END:
+                if stop_requested():
                     break
                 
-                # Calculate batch range
-                start_idx = batch_num * self.batch_size
-                end_idx = min(start_idx + self.batch_size, len(recipients))
-                batch_recipients = recipients[start_idx:end_idx]
-                
-                # Wait for batch interval if needed
+                # Wait for batch interval if needed; the previous batch keeps
+                # sending on the worker meanwhile
                 self._wait_for_batch_interval()
+                if stop_requested():
+                    break
                 
-                # Process batch
-                batch_start_time = time.time()
-                self.current_batch = batch_num + 1
+                # Collect the previous batch before sizing the next one
+                if in_flight:
+                    self._complete_batch(*in_flight)
+                    in_flight = None
                 
-                if self.logger:
-                    self.logger.info(f"Processing batch {self.current_batch}/{self.total_batches}: "
-                                   f"emails {start_idx + 1}-{end_idx} of {len(recipients)}")
+                # The batch size may have changed after the previous batch, so
+                # the batch count is recomputed from what is left
+                if total_recipients is not None:
+                    self.total_batches = batch_num + self._batches_left(total_recipients - pos)
                 
-                # Call batch start callback
-                if self.on_batch_start:
-                    self.on_batch_start(batch_num + 1, batch_recipients)
+                # Pull the next batch
+                batch_recipients = [next_recipient]
+                batch_recipients.extend(islice(recipient_iter, self.batch_size - 1))
+                next_recipient = next(recipient_iter, _END)
+                start_idx = pos
+                pos += len(batch_recipients)
                 
-                # Process the batch
-                batch_result = process_batch_callback(batch_recipients, email_template)
+                batch_num += 1
+                self.current_batch = batch_num
                 
-                # Update statistics
-                batch_time = time.time() - batch_start_time
-                self._update_batch_stats(len(batch_recipients), batch_time, batch_result)
+                if logger:
+                    logger.info(f"Processing batch {batch_num}/{self.total_batches or '?'}: "
+                                f"emails {start_idx + 1}-{pos} of {total_label}")
                 
-                # Call batch complete callback
-                if self.on_batch_complete:
-                    self.on_batch_complete(batch_num + 1, batch_result)
+                # Call batch start callback
+                if on_start:
+                    on_start(batch_num, batch_recipients)
                 
-                self.last_batch_time = time.time()
+                # Hand the batch to the worker and move on to pacing the next one
+                future = submit(run_batch, process_batch_callback, batch_recipients, email_template)
+                in_flight = (batch_num, len(batch_recipients), future)
+                self.last_batch_time = time.monotonic()
+            
+            if in_flight:
+                self._complete_batch(*in_flight)
         
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error in batch scheduler: {e}")
         finally:
-            self.is_running = False
-            self.batch_stats['end_time'] = time.time()
+            executor.shutdown(wait=True)
+            self._finish_scheduling()
+    
+    def _schedule_unit_batches(self, recipients: Iterable[Dict], email_template: Dict,
+                               process_batch_callback: Callable, total_label,
+                               submit: Callable) -> None:
+        """schedule_batches loop for a fixed batch size of one, submitting to the run's worker."""
+        logger = self.logger
+        on_start = self.on_batch_start
+        stop_requested = self._stop_event.is_set
+        run_batch = self._run_batch
+        
+        in_flight = None
+        batch_num = 0
+        for recipient in recipients:
+            # Wait for batch interval if needed; the previous email keeps
+            # sending on the worker meanwhile
+            self._wait_for_batch_interval()
+            if stop_requested():
+                break
             
-            # Call completion callback
-            if self.on_all_batches_complete:
-                self.on_all_batches_complete(self.batch_stats)
+            if in_flight:
+                self._complete_batch(*in_flight)
+                in_flight = None
             
+            batch_num += 1
+            self.current_batch = batch_num
+            batch_recipients = [recipient]
+            
+            if logger:
+                logger.info(f"Processing batch {batch_num}/{self.total_batches or '?'}: "
+                            f"email {batch_num} of {total_label}")
+            
+            if on_start:
+                on_start(batch_num, batch_recipients)
+            
+            future = submit(run_batch, process_batch_callback, batch_recipients, email_template)
+            in_flight = (batch_num, 1, future)
+            self.last_batch_time = time.monotonic()
+        
+        if in_flight:
+            self._complete_batch(*in_flight)
+    
+    def schedule_batches_multiprocess(self, recipients: List[Dict], email_template: Dict,
+                                      process_batch_callback: Callable,
+                                      workers: Optional[int] = None,
+                                      shards_per_worker: int = 4) -> None:
+        """
+        Process recipients in parallel worker processes.
+        
+        Recipients are split into workers * shards_per_worker shards that are
+        sent as soon as a process is free; the batch interval does not apply.
+        process_batch_callback must be a module-level function and the
+        recipients and template must be picklable. Each process opens its own
+        SMTP connections, so the rotate strategy, which shares connections,
+        should keep using schedule_batches.
+        
+        Args:
+            recipients: List of recipient dictionaries
+            email_template: Email template configuration
+            process_batch_callback: Module-level function processing one shard
+            workers: Number of processes (defaults to the CPU count)
+            shards_per_worker: Shards per process, for load balancing
+        """
+        if self.is_running:
             if self.logger:
-                self._log_final_stats()
+                self.logger.warning("Batch scheduler is already running")
+            return
+        
+        self.is_running = True
+        self._stop_event.clear()
+        self.batch_stats['start_time'] = time.time()
+        self._run_start_ns = time.monotonic_ns()
+        
+        workers = workers or os.cpu_count() or 1
+        total_recipients = len(recipients)
+        shard_size = max(1, -(-total_recipients // (workers * shards_per_worker)))
+        shards = [recipients[i:i + shard_size] for i in range(0, total_recipients, shard_size)]
+        self.total_batches = len(shards)
+        self.current_batch = 0
+        
+        if self.logger:
+            self.logger.info(f"Scheduling {total_recipients} emails in {self.total_batches} shards "
+                           f"across {workers} processes")
+        
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {}
+                for batch_num, shard in enumerate(shards, 1):
+                    if self.on_batch_start:
+                        self.on_batch_start(batch_num, shard)
+                    future = executor.submit(self._run_batch, process_batch_callback,
+                                             shard, email_template)
+                    futures[future] = (batch_num, len(shard))
+                
+                for future in as_completed(futures):
+                    if self._stop_event.is_set():
+                        for pending in futures:
+                            pending.cancel()
+                        break
+                    self.current_batch += 1
+                    self._complete_batch(*futures[future], future)
+        
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error in batch scheduler: {e}")
+        finally:
+            self._finish_scheduling()
+    
+    def schedule_batches_from_cursor(self, cursor, email_template: Dict,
+                                     process_batch_callback: Callable,
+                                     batch_size: Optional[int] = None,
+                                     total_recipients: Optional[int] = None) -> None:
+        """
+        Schedule batches from an executed database cursor.
+        
+        A producer thread fetches the next rows while the current batch is
+        processed, so database round trips overlap with sending. Rows are
+        turned into dicts keyed by column name. For sqlite3 the connection
+        must be opened with check_same_thread=False.
+        
+        Args:
+            cursor: DB-API cursor with the recipient query already executed
+            email_template: Email template configuration
+            process_batch_callback: Function to call for processing each batch
+            batch_size: Rows per fetch (defaults to the scheduler batch size)
+            total_recipients: Recipient count for progress reporting
+        """
+        fetch_size = batch_size or self.batch_size
+        columns = [column[0] for column in cursor.description]
+        prefetched = queue.Queue(maxsize=1)
+        consumer_done = threading.Event()
+        
+        def produce():
+            while True:
+                try:
+                    rows = cursor.fetchmany(fetch_size)
+                except Exception as e:
+                    rows = e
+                # Keep offering the rows until the consumer takes them or quits
+                while not consumer_done.is_set():
+                    try:
+                        prefetched.put(rows, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if not rows or isinstance(rows, Exception) or consumer_done.is_set():
+                    return
+        
+        def recipients():
+            try:
+                while True:
+                    rows = prefetched.get()
+                    if isinstance(rows, Exception):
+                        raise rows
+                    if not rows:
+                        return
+                    for row in rows:
+                        yield row if isinstance(row, Mapping) else dict(zip(columns, row))
+            finally:
+                consumer_done.set()
+        
+        producer = threading.Thread(target=produce, name="batch-prefetch", daemon=True)
+        producer.start()
+        try:
+            self.schedule_batches(recipients(), email_template, process_batch_callback,
+                                  total_recipients=total_recipients)
+        finally:
+            consumer_done.set()
+            producer.join()
     
     def schedule_batches_async(self, recipients: List[Dict], email_template: Dict,
                               process_batch_callback: Callable) -> threading.Thread:
@@ -143,6 +385,7 @@ class BatchScheduler:
     def stop_scheduling(self) -> None:
         """Stop the batch scheduler."""
         self.is_running = False
+        self._stop_event.set()
         if self.logger:
             self.logger.info("Batch scheduler stop requested")
     
@@ -161,57 +404,124 @@ class BatchScheduler:
             return not self.scheduler_thread.is_alive()
         return True
     
+    def _batches_left(self, remaining: Optional[int]) -> int:
+        """Number of batches needed for the remaining recipients (0 if unknown)."""
+        if remaining is None:
+            return 0
+        return (remaining + self.batch_size - 1) // self.batch_size
+    
+    def _finish_scheduling(self) -> None:
+        """Record the end of a run and report it."""
+        self.is_running = False
+        self.batch_stats['end_time'] = time.time()
+        self._run_time_ns = time.monotonic_ns() - self._run_start_ns
+        
+        # Call completion callback
+        if self.on_all_batches_complete:
+            self.on_all_batches_complete(self.batch_stats)
+        
+        if self.logger:
+            self._log_final_stats()
+    
+    @staticmethod
+    def _run_batch(process_batch_callback: Callable, batch_recipients: List[Dict],
+                   email_template: Dict):
+        """Run one batch on a worker and time it in nanoseconds."""
+        batch_start_ns = time.monotonic_ns()
+        batch_result = process_batch_callback(batch_recipients, email_template)
+        return batch_result, time.monotonic_ns() - batch_start_ns
+    
+    def _complete_batch(self, batch_num: int, emails_in_batch: int, future: Future) -> None:
+        """Wait for a submitted batch, then record its statistics."""
+        batch_result, batch_time_ns = future.result()
+        
+        # Update statistics
+        self._update_batch_stats(emails_in_batch, batch_time_ns, batch_result)
+        
+        # Call batch complete callback
+        if self.on_batch_complete:
+            self.on_batch_complete(batch_num, batch_result)
+    
     def _wait_for_batch_interval(self) -> None:
-        """Wait for the minimum batch interval if needed."""
+        """Wait for the minimum batch interval if needed; returns early on stop."""
         if self.last_batch_time > 0:
-            elapsed = time.time() - self.last_batch_time
-            if elapsed < self.batch_interval:
-                wait_time = self.batch_interval - elapsed
+            deadline = self.last_batch_time + self.batch_interval
+            wait_time = deadline - time.monotonic()
+            if wait_time > 0:
                 if self.logger:
-                    self.logger.debug(f"Waiting {wait_time:.1f}s for batch interval")
-                time.sleep(wait_time)
+                    self.logger.debug("Waiting %.1fs for batch interval", wait_time)
+                self._stop_event.wait(wait_time)
     
-    def _update_batch_stats(self, emails_in_batch: int, batch_time: float, 
+    def _update_batch_stats(self, emails_in_batch: int, batch_time_ns: int, 
                            batch_result: Dict) -> None:
-        """Update batch processing statistics."""
-        self.batch_stats['total_batches_processed'] += 1
-        self.batch_stats['total_emails_queued'] += emails_in_batch
-        
-        if batch_result:
-            self.batch_stats['total_emails_processed'] += batch_result.get('processed', 0)
-        
-        # Update average batch time
-        total_batches = self.batch_stats['total_batches_processed']
-        current_avg = self.batch_stats['average_batch_time']
-        self.batch_stats['average_batch_time'] = (
-            (current_avg * (total_batches - 1) + batch_time) / total_batches
-        )
+        """Update batch processing statistics (batch_time_ns in nanoseconds)."""
+        stats = self.batch_stats
+        processed = batch_result.get('processed', 0) if batch_result else 0
+        
+        with self._stats_lock:
+            total_batches = stats['total_batches_processed'] + 1
+            stats['total_batches_processed'] = total_batches
+            stats['total_emails_queued'] += emails_in_batch
+            stats['total_emails_processed'] += processed
+            
+            # Update average batch time (seconds) from the running total
+            self._total_batch_time_ns += batch_time_ns
+            stats['average_batch_time'] = self._total_batch_time_ns / total_batches / 1e9
+        
+        if self.target_batch_latency is not None:
+            self._adjust_batch_size(emails_in_batch, processed, batch_time_ns / 1e9)
+    
+    def _adjust_batch_size(self, emails_in_batch: int, processed: int,
+                           batch_time: float) -> None:
+        """Grow the batch size additively after a healthy batch, shrink it multiplicatively otherwise."""
+        success_rate = processed / emails_in_batch if emails_in_batch else 1.0
+        
+        if batch_time < self.target_batch_latency and success_rate > 0.98:
+            self.batch_size = min(self.max_batch_size, self.batch_size + self.aimd_step)
+        else:
+            self.batch_size = max(self.min_batch_size, int(self.batch_size * self.aimd_backoff))
     
     def _log_final_stats(self) -> None:
         """Log final batch processing statistics."""
         stats = self.batch_stats
-        total_time = stats['end_time'] - stats['start_time']
+        total_time = self._run_time_ns / 1e9
         
         if self.logger:
-            self.logger.info("=" * 50)
-            self.logger.info("BATCH SCHEDULER FINAL STATISTICS")
-            self.logger.info("=" * 50)
-            self.logger.info(f"Total batches processed: {stats['total_batches_processed']}")
-            self.logger.info(f"Total emails queued: {stats['total_emails_queued']}")
-            self.logger.info(f"Total emails processed: {stats['total_emails_processed']}")
-            self.logger.info(f"Average batch time: {stats['average_batch_time']:.2f}s")
-            self.logger.info(f"Total processing time: {total_time:.2f}s")
+            lines = [
+                "=" * 50,
+                "BATCH SCHEDULER FINAL STATISTICS",
+                "=" * 50,
+                f"Total batches processed: {stats['total_batches_processed']}",
+                f"Total emails queued: {stats['total_emails_queued']}",
+                f"Total emails processed: {stats['total_emails_processed']}",
+                f"Average batch time: {stats['average_batch_time']:.2f}s",
+                f"Total processing time: {total_time:.2f}s",
+            ]
             if stats['total_emails_processed'] > 0:
                 rate = stats['total_emails_processed'] / total_time
-                self.logger.info(f"Processing rate: {rate:.2f} emails/second")
-            self.logger.info("=" * 50)
+                lines.append(f"Processing rate: {rate:.2f} emails/second")
+            lines.append("=" * 50)
+            # One record for the whole block instead of one per line
+            self.logger.info("\n".join(lines))
     
-    def get_progress(self) -> Dict[str, Any]:
-        """Get current batch processing progress."""
+    def get_progress(self, snapshot: bool = False) -> Dict[str, Any]:
+        """
+        Get current batch processing progress.
+        
+        Args:
+            snapshot: Copy the batch statistics under the stats lock instead of
+                returning a live read-only view of them
+        """
+        if snapshot:
+            with self._stats_lock:
+                batch_stats = self.batch_stats.copy()
+        else:
+            batch_stats = self._stats_view
+        
         return {
             'current_batch': self.current_batch,
             'total_batches': self.total_batches,
-            'progress_percentage': (self.current_batch / max(1, self.total_batches)) * 100,
+            'progress_percentage': (self.current_batch / self.total_batches) * 100 if self.total_batches else 0.0,
             'is_running': self.is_running,
-            'batch_stats': self.batch_stats.copy()
+            'batch_stats': batch_stats
         }
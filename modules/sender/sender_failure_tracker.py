@@ -1,5 +1,5 @@
 import time
-from collections import defaultdict, deque
+from collections import deque
 from datetime import datetime, timedelta
 
 class SenderFailureTracker:
@@ -9,11 +9,11 @@ class SenderFailureTracker:
         self.failure_settings = failure_settings
         self.logger = logger
         
-        # Track failures per sender
-        self.failure_counts = defaultdict(int)  # Current failure count per sender
-        self.failure_timestamps = defaultdict(deque)  # Timestamps of failures
-        self.blocked_until = defaultdict(float)  # When each sender will be unblocked
-        self.last_failure_reset = defaultdict(float)  # Last time failure count was reset
+        # Track failures per sender (plain dicts: a status lookup never creates entries)
+        self.failure_counts = {}  # Current failure count per sender
+        self.failure_timestamps = {}  # Timestamps of failures
+        self.blocked_until = {}  # When each sender will be unblocked
+        self.last_failure_reset = {}  # Last time failure count was reset
         
         self.logger.info("SenderFailureTracker initialized with settings: "
                         f"max_failures={failure_settings['max_failures_before_block']}, "
@@ -28,7 +28,7 @@ class SenderFailureTracker:
         if sender_email in self.blocked_until:
             if current_time < self.blocked_until[sender_email]:
                 remaining_time = self.blocked_until[sender_email] - current_time
-                self.logger.debug(f"Sender '{sender_email}' is blocked for {remaining_time:.1f} more seconds")
+                self.logger.debug("Sender '%s' is blocked for %.1f more seconds", sender_email, remaining_time)
                 return True
             else:
                 # Cooldown period expired, unblock sender
@@ -45,8 +45,11 @@ class SenderFailureTracker:
         self._clean_old_failures(sender_email, current_time)
         
         # Add new failure
-        self.failure_counts[sender_email] += 1
-        self.failure_timestamps[sender_email].append(current_time)
+        self.failure_counts[sender_email] = self.failure_counts.get(sender_email, 0) + 1
+        timestamps = self.failure_timestamps.get(sender_email)
+        if timestamps is None:
+            timestamps = self.failure_timestamps[sender_email] = deque()
+        timestamps.append(current_time)
         
         self.logger.warning(f"Failure recorded for sender '{sender_email}': {error_message}. "
                            f"Total failures in window: {self.failure_counts[sender_email]}")
@@ -63,7 +66,7 @@ class SenderFailureTracker:
         if sender_email in self.failure_counts:
             old_count = self.failure_counts[sender_email]
             self.failure_counts[sender_email] = 0
-            self.failure_timestamps[sender_email].clear()
+            self._clear_timestamps(sender_email)
             
             if old_count > 0:
                 self.logger.info(f"Success recorded for sender '{sender_email}', "
@@ -84,29 +87,39 @@ class SenderFailureTracker:
         window_start = current_time - self.failure_settings['failure_window']
         
         # Remove old timestamps
-        timestamps = self.failure_timestamps[sender_email]
-        while timestamps and timestamps[0] < window_start:
-            timestamps.popleft()
-            self.failure_counts[sender_email] -= 1
+        timestamps = self.failure_timestamps.get(sender_email)
+        if timestamps:
+            expired = 0
+            while timestamps and timestamps[0] < window_start:
+                timestamps.popleft()
+                expired += 1
+            if expired:
+                self.failure_counts[sender_email] -= expired
         
         # Reset failure count periodically if configured
         if self.failure_settings['reset_failures_after'] > 0:
-            last_reset = self.last_failure_reset[sender_email]
+            last_reset = self.last_failure_reset.get(sender_email, 0.0)
             if current_time - last_reset > self.failure_settings['reset_failures_after']:
-                if self.failure_counts[sender_email] > 0:
+                if self.failure_counts.get(sender_email, 0) > 0:
                     self.logger.info(f"Resetting failure count for sender '{sender_email}' "
                                    f"(periodic reset after {self.failure_settings['reset_failures_after']}s)")
                 self.failure_counts[sender_email] = 0
-                self.failure_timestamps[sender_email].clear()
+                self._clear_timestamps(sender_email)
                 self.last_failure_reset[sender_email] = current_time
 
+    def _clear_timestamps(self, sender_email):
+        """Drop all recorded failure timestamps for a sender."""
+        timestamps = self.failure_timestamps.get(sender_email)
+        if timestamps is not None:
+            timestamps.clear()
+
     def get_sender_status(self, sender_email):
         """Get current status of a sender."""
         current_time = time.time()
         self._clean_old_failures(sender_email, current_time)
         
         is_blocked = self.is_sender_blocked(sender_email)
-        failure_count = self.failure_counts[sender_email]
+        failure_count = self.failure_counts.get(sender_email, 0)
         
         status = {
             'is_blocked': is_blocked,
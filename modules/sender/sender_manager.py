@@ -27,25 +27,57 @@
 # For complete documentation, visit: https://github.com/krishna-kush/Bulk-Mailer
 # ================================================================================
 
-import itertools
+import threading
 
 class SenderManager:
     """Manages sender accounts and provides methods for sender rotation and duplication."""
 
-    def __init__(self, senders, strategy):
+    def __init__(self, senders, strategy, weights=None):
+        """
+        Args:
+            senders: List of sender configurations
+            strategy: Sender strategy ("rotate_email" or "duplicate_send")
+            weights: Optional list of positive integers, one per sender; a sender
+                with weight N is returned N times per rotation
+        """
         self.senders = senders
         self.strategy = strategy
-        self.sender_iterator = itertools.cycle(self.senders)
+
+        # Rotation order with each sender repeated by its weight, walked by a
+        # shared counter so concurrent callers never skip or repeat a slot
+        if weights is None:
+            self._rotation = list(senders)
+        else:
+            self._rotation = [sender for sender, weight in zip(senders, weights)
+                              for _ in range(weight)]
+        self._index = 0
+        self._lock = threading.Lock()
+
+        # Resolve the strategy once instead of comparing strings on every call
+        strategies = {
+            "rotate_email": self._next_rotate,
+            "duplicate_send": self._next_external,
+        }
+        self._next_impl = strategies.get(strategy, self._next_external)
 
     def get_next_sender(self):
         """Returns the next sender based on the rotation strategy."""
-        if self.strategy == "rotate_email":
-            return next(self.sender_iterator)
-        elif self.strategy == "duplicate_send":
-            # For duplicate_send, we iterate through all senders for each recipient,
-            # but this method is called per recipient, so it will always return the current sender
-            # in the iteration. The outer loop (in main.py) will handle iterating through all senders.
-            pass # This logic will be handled externally
+        return self._next_impl()
+
+    def _next_rotate(self):
+        """Returns the next sender in the (weighted) rotation."""
+        if not self._rotation:
+            return None
+        with self._lock:
+            sender = self._rotation[self._index]
+            self._index = (self._index + 1) % len(self._rotation)
+        return sender
+
+    def _next_external(self):
+        """Returns None; the caller picks senders itself."""
+        # For duplicate_send, we iterate through all senders for each recipient,
+        # but this method is called per recipient, so it will always return the current sender
+        # in the iteration. The outer loop (in main.py) will handle iterating through all senders.
         return None
 
     def record_sent(self, sender_email):
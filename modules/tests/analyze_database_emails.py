@@ -34,14 +34,44 @@ Analyze emails in the geo-mail database to classify them as personal vs company
 
 import sys
 import os
+import json
 import sqlite3
-from collections import defaultdict
+from functools import lru_cache
 
 # Add parent directories to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from modules.core.utils import extract_name_from_email
+from modules.core.utils import extract_name_from_email, is_generic_mailbox
+
+# Examples printed per class
+EXAMPLE_COUNT = 10
+
+# Email count per domain and class; the company local parts are passed as a
+# JSON array. Addresses without '@' count as personal under 'unknown'.
+DOMAIN_COUNTS_QUERY = """
+    SELECT CASE WHEN instr(email, '@') > 0
+                THEN substr(email, instr(email, '@') + 1) ELSE 'unknown' END AS domain,
+           instr(email, '@') > 0
+               AND substr(email, 1, instr(email, '@') - 1) IN (SELECT value FROM json_each(?)) AS is_company,
+           COUNT(*) AS emails
+    FROM emails
+    WHERE email IS NOT NULL AND email != ''
+    GROUP BY domain, is_company
+    ORDER BY emails DESC, domain
+"""
+
+
+@lru_cache(maxsize=None)
+def _is_company_local(local_part):
+    """
+    Whether a local part marks a company/generic email.
+    
+    With no_company=True the classification never looks at the domain, so
+    results are cached per local part and shared across all domains.
+    """
+    return extract_name_from_email(local_part + '@x', no_company=True,
+                                   name_to_return_when_company_name="COMPANY_DETECTED") == "COMPANY_DETECTED"
 
 
 def analyze_database_emails():
@@ -61,108 +91,110 @@ def analyze_database_emails():
     try:
         # Connect to database
         conn = sqlite3.connect(db_path)
+        
+        # One read-only scan: map pages instead of copying them and keep a
+        # large page cache
+        conn.execute("PRAGMA query_only=1")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        
+        # Every query selects a single column, so rows are returned as that value
+        conn.row_factory = lambda cursor, row: row[0]
         cursor = conn.cursor()
         
-        # Get all emails from the emails table
-        cursor.execute("SELECT email FROM emails WHERE email IS NOT NULL AND email != ''")
-        emails = cursor.fetchall()
+        # Count first so the rows themselves can be streamed
+        cursor.execute("SELECT COUNT(*) FROM emails WHERE email IS NOT NULL AND email != ''")
+        total_emails = cursor.fetchone()
         
-        if not emails:
+        if not total_emails:
             print("❌ No emails found in the database")
             return
         
-        total_emails = len(emails)
         print(f"📊 Total emails found: {total_emails:,}")
         print()
         
-        # Analyze each email
+        # Analyze each email, keeping only the first few of each class as examples
         personal_emails = []
         company_emails = []
-        analysis_results = defaultdict(int)
+        company_locals = set()
+        personal_count = 0
+        company_count = 0
         
         print("🔄 Analyzing emails...")
         
-        for i, (email,) in enumerate(emails):
+        cursor.execute("SELECT email FROM emails WHERE email IS NOT NULL AND email != ''")
+        for i, email in enumerate(cursor):
             if i % 1000 == 0:
                 print(f"   Processed {i:,}/{total_emails:,} emails ({i/total_emails*100:.1f}%)")
             
-            # Use our name extraction function to classify
-            # If no_company=True returns the same as no_company=False, it's likely a person
-            # If they differ, it's likely a company email
-            
-            name_default = extract_name_from_email(email, no_company=False)
-            name_no_company = extract_name_from_email(email, no_company=True, name_to_return_when_company_name="COMPANY_DETECTED")
+            local, at, _ = email.partition('@')
             
-            if name_no_company == "COMPANY_DETECTED":
+            # Role mailboxes (info@, no-reply@, ...) are settled by a set/regex
+            # lookup; only the rest go through name-based classification
+            if at and (is_generic_mailbox(local) or _is_company_local(local)):
                 # This is a company/generic email
-                company_emails.append((email, name_default))
-                analysis_results['company'] += 1
+                if len(company_emails) < EXAMPLE_COUNT:
+                    company_emails.append((email, extract_name_from_email(email, no_company=False)))
+                company_locals.add(local)
+                company_count += 1
             else:
                 # This is a personal email
-                personal_emails.append((email, name_default))
-                analysis_results['personal'] += 1
+                if len(personal_emails) < EXAMPLE_COUNT:
+                    personal_emails.append((email, extract_name_from_email(email, no_company=False)))
+                personal_count += 1
         
         print(f"   Processed {total_emails:,}/{total_emails:,} emails (100.0%)")
+        print(f"   Classified {_is_company_local.cache_info().currsize:,} distinct local parts")
         print()
         
-        # Print results
-        print("="*80)
-        print("📈 ANALYSIS RESULTS")
-        print("="*80)
-        
-        personal_count = analysis_results['personal']
-        company_count = analysis_results['company']
-        
-        print(f"👤 Personal emails: {personal_count:,} ({personal_count/total_emails*100:.1f}%)")
-        print(f"🏢 Company emails:  {company_count:,} ({company_count/total_emails*100:.1f}%)")
-        print(f"📊 Total analyzed:  {total_emails:,}")
-        print()
+        # Print results (each section is printed with a single call)
+        print("\n".join([
+            "="*80,
+            "📈 ANALYSIS RESULTS",
+            "="*80,
+            f"👤 Personal emails: {personal_count:,} ({personal_count/total_emails*100:.1f}%)",
+            f"🏢 Company emails:  {company_count:,} ({company_count/total_emails*100:.1f}%)",
+            f"📊 Total analyzed:  {total_emails:,}",
+            "",
+        ]))
         
         # Show some examples
-        print("="*80)
-        print("📋 EXAMPLES")
-        print("="*80)
-        
-        print("👤 Personal Email Examples:")
-        for i, (email, name) in enumerate(personal_emails[:10]):
-            print(f"   {i+1:2d}. {email:<40} → {name}")
-        
-        if len(personal_emails) > 10:
-            print(f"   ... and {len(personal_emails)-10:,} more personal emails")
-        
-        print()
-        print("🏢 Company Email Examples:")
-        for i, (email, name) in enumerate(company_emails[:10]):
-            print(f"   {i+1:2d}. {email:<40} → {name}")
-        
-        if len(company_emails) > 10:
-            print(f"   ... and {len(company_emails)-10:,} more company emails")
-        
-        # Domain analysis
-        print()
-        print("="*80)
-        print("🌐 DOMAIN ANALYSIS")
-        print("="*80)
-        
-        personal_domains = defaultdict(int)
-        company_domains = defaultdict(int)
-        
-        for email, _ in personal_emails:
-            domain = email.split('@')[1] if '@' in email else 'unknown'
-            personal_domains[domain] += 1
-        
-        for email, _ in company_emails:
-            domain = email.split('@')[1] if '@' in email else 'unknown'
-            company_domains[domain] += 1
-        
-        print("Top Personal Email Domains:")
-        for domain, count in sorted(personal_domains.items(), key=lambda x: x[1], reverse=True)[:10]:
-            print(f"   {domain:<30} {count:,} emails")
-        
-        print()
-        print("Top Company Email Domains:")
-        for domain, count in sorted(company_domains.items(), key=lambda x: x[1], reverse=True)[:10]:
-            print(f"   {domain:<30} {count:,} emails")
+        lines = ["="*80, "📋 EXAMPLES", "="*80, "👤 Personal Email Examples:"]
+        for i, (email, name) in enumerate(personal_emails):
+            lines.append(f"   {i+1:2d}. {email:<40} → {name}")
+        
+        if personal_count > EXAMPLE_COUNT:
+            lines.append(f"   ... and {personal_count-EXAMPLE_COUNT:,} more personal emails")
+        
+        lines += ["", "🏢 Company Email Examples:"]
+        for i, (email, name) in enumerate(company_emails):
+            lines.append(f"   {i+1:2d}. {email:<40} → {name}")
+        
+        if company_count > EXAMPLE_COUNT:
+            lines.append(f"   ... and {company_count-EXAMPLE_COUNT:,} more company emails")
+        print("\n".join(lines))
+        
+        # Domain analysis: SQLite splits and counts the domains, so only one
+        # row per (domain, class) comes back
+        domain_cursor = conn.cursor()
+        domain_cursor.row_factory = None
+        domain_cursor.execute(DOMAIN_COUNTS_QUERY, (json.dumps(list(company_locals)),))
+        personal_domains = []
+        company_domains = []
+        for domain, is_company, count in domain_cursor:
+            top_domains = company_domains if is_company else personal_domains
+            if len(top_domains) < 10:
+                top_domains.append((domain, count))
+        
+        lines = ["", "="*80, "🌐 DOMAIN ANALYSIS", "="*80, "Top Personal Email Domains:"]
+        for domain, count in personal_domains:
+            lines.append(f"   {domain:<30} {count:,} emails")
+        
+        lines += ["", "Top Company Email Domains:"]
+        for domain, count in company_domains:
+            lines.append(f"   {domain:<30} {count:,} emails")
+        print("\n".join(lines))
         
         conn.close()
         
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+# ================================================================================
+# BULK_MAILER - Professional Email Campaign Manager
+# ================================================================================
+#
+# Author: Krishna Kushwaha
+# GitHub: https://github.com/krishna-kush
+# Project: BULK_MAILER - Enterprise Email Campaign Management System
+# Repository: https://github.com/krishna-kush/Bulk-Mailer
+#
+# Description: Shared pytest fixtures for the browser test scripts
+#
+# ================================================================================
+
+import os
+import sys
+
+import pytest
+
+# Add the parent directories to the path so we can import modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+modules_dir = os.path.dirname(current_dir)
+mailer_dir = os.path.dirname(modules_dir)
+sys.path.insert(0, mailer_dir)
+
+
+@pytest.fixture(scope="session")
+def browser_handler():
+    """
+    Launch Playwright and one browser for the whole test session.
+
+    Tests open their own contexts on the shared browser and close them when
+    done, so the browser start-up cost is paid once instead of per test.
+    """
+    # Imported here so collecting the non-browser tests does not load Playwright
+    from config.config_loader import ConfigLoader
+    from modules.logger.logger import AppLogger
+    from modules.browser.browser_handler import BrowserHandler
+
+    config = ConfigLoader(mailer_dir)
+    logger = AppLogger(mailer_dir, config_path=config.config_path).get_logger()
+    handler = BrowserHandler(config.get_browser_automation_settings(), logger)
+
+    if not handler.start_playwright() or not handler.launch_browser():
+        handler.close_browser()
+        pytest.skip("Browser could not be launched")
+
+    yield handler
+
+    handler.close_browser()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+
+# ================================================================================
+# BULK_MAILER - Professional Email Campaign Manager
+# ================================================================================
+#
+# Author: Krishna Kushwaha
+# GitHub: https://github.com/krishna-kush
+# Project: BULK_MAILER - Enterprise Email Campaign Management System
+# Repository: https://github.com/krishna-kush/Bulk-Mailer
+#
+# Description: Test script for batch slicing and statistics in the batch scheduler
+#
+# ================================================================================
+
+import os
+import sys
+import sqlite3
+import time
+import threading
+
+# Add the parent directories to the path so we can import modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+modules_dir = os.path.dirname(current_dir)
+mailer_dir = os.path.dirname(modules_dir)
+sys.path.insert(0, mailer_dir)
+
+from modules.scheduler.batch_scheduler import BatchScheduler
+
+
+def _recipients(count):
+    return [{'email': f'user{n}@example.com'} for n in range(count)]
+
+
+def _process_all(batch, template):
+    return {'processed': len(batch)}
+
+
+def test_fixed_batches():
+    """Without a latency target every batch has the configured size."""
+    scheduler = BatchScheduler(None, batch_size=4, batch_interval=0)
+    sizes = []
+    scheduler.on_batch_start = lambda num, batch: sizes.append(len(batch))
+
+    scheduler.schedule_batches(_recipients(10), {}, _process_all)
+
+    assert sizes == [4, 4, 2]
+    stats = scheduler.get_progress()['batch_stats']
+    assert stats['total_batches_processed'] == 3
+    assert stats['total_emails_queued'] == 10
+    assert stats['total_emails_processed'] == 10
+
+    snapshot = scheduler.get_progress(snapshot=True)['batch_stats']
+    scheduler.schedule_batches(_recipients(2), {}, _process_all)
+    assert stats['total_emails_queued'] == 12
+    assert snapshot['total_emails_queued'] == 10
+
+
+def test_average_batch_time():
+    """The average batch time is the mean over all processed batches."""
+    scheduler = BatchScheduler(None)
+    for batch_time_ns in (1_000_000_000, 2_000_000_000, 6_000_000_000):
+        scheduler._update_batch_stats(5, batch_time_ns, {'processed': 5})
+
+    stats = scheduler.get_progress()['batch_stats']
+    assert stats['average_batch_time'] == 3.0
+    assert stats['total_batches_processed'] == 3
+
+
+def test_single_email_batches():
+    """A batch size of one sends every recipient as its own batch."""
+    scheduler = BatchScheduler(None, batch_size=1, batch_interval=0)
+    batches = []
+    scheduler.on_batch_start = lambda num, batch: batches.append((num, batch[0]['email']))
+
+    scheduler.schedule_batches((r for r in _recipients(3)), {}, _process_all)
+
+    assert batches == [(1, 'user0@example.com'), (2, 'user1@example.com'), (3, 'user2@example.com')]
+    stats = scheduler.get_progress()['batch_stats']
+    assert stats['total_batches_processed'] == 3
+    assert stats['total_emails_processed'] == 3
+
+
+def test_generator_recipients():
+    """Recipients can be streamed from a generator without a known total."""
+    scheduler = BatchScheduler(None, batch_size=4, batch_interval=0)
+    sizes = []
+    scheduler.on_batch_start = lambda num, batch: sizes.append(len(batch))
+
+    scheduler.schedule_batches((r for r in _recipients(9)), {}, _process_all)
+
+    assert sizes == [4, 4, 1]
+    assert scheduler.total_batches == 0
+    assert scheduler.get_progress()['progress_percentage'] == 0.0
+
+    scheduler.schedule_batches((r for r in _recipients(8)), {}, _process_all, total_recipients=8)
+    assert scheduler.current_batch == scheduler.total_batches == 2
+
+
+def test_cursor_recipients():
+    """Rows from a database cursor are prefetched and scheduled as dicts."""
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.execute("CREATE TABLE recipients (email TEXT, name TEXT)")
+    conn.executemany("INSERT INTO recipients VALUES (?, ?)",
+                     [(f"user{n}@example.com", f"User {n}") for n in range(7)])
+    cursor = conn.execute("SELECT email, name FROM recipients ORDER BY rowid")
+
+    scheduler = BatchScheduler(None, batch_size=3, batch_interval=0)
+    batches = []
+    scheduler.on_batch_start = lambda num, batch: batches.append(batch)
+
+    scheduler.schedule_batches_from_cursor(cursor, {}, _process_all, batch_size=2)
+    conn.close()
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert batches[0][0] == {'email': 'user0@example.com', 'name': 'User 0'}
+    assert scheduler.get_progress()['batch_stats']['total_emails_processed'] == 7
+
+
+def test_aimd_grows_on_healthy_batches():
+    """Fast, fully processed batches grow the batch size by the step."""
+    scheduler = BatchScheduler(None, batch_size=2, batch_interval=0,
+                               target_batch_latency=60, aimd_step=2, max_batch_size=5)
+    sizes = []
+    scheduler.on_batch_start = lambda num, batch: sizes.append(len(batch))
+
+    scheduler.schedule_batches(_recipients(20), {}, _process_all)
+
+    assert sizes == [2, 4, 5, 5, 4]
+    assert sum(sizes) == 20
+    assert scheduler.current_batch == scheduler.total_batches == 5
+
+
+def test_aimd_backs_off_on_failures():
+    """Partially failed batches shrink the batch size, down to the minimum."""
+    scheduler = BatchScheduler(None, batch_size=10, batch_interval=0,
+                               target_batch_latency=60, aimd_backoff=0.5, min_batch_size=3)
+    sizes = []
+    scheduler.on_batch_start = lambda num, batch: sizes.append(len(batch))
+
+    scheduler.schedule_batches(_recipients(30), {}, lambda batch, template: {'processed': 0})
+
+    assert sizes == [10, 5, 3, 3, 3, 3, 3]
+    assert scheduler.batch_size == 3
+
+
+def test_batches_run_on_worker_thread():
+    """Batches are sent on the worker, one at a time and in order."""
+    scheduler = BatchScheduler(None, batch_size=3, batch_interval=0)
+    seen = []
+
+    def process(batch, template):
+        seen.append((threading.current_thread() is threading.main_thread(), batch[0]['email']))
+        return {'processed': len(batch)}
+
+    scheduler.schedule_batches(_recipients(7), {}, process)
+
+    assert seen == [(False, 'user0@example.com'), (False, 'user3@example.com'),
+                    (False, 'user6@example.com')]
+
+
+def test_multiprocess_shards():
+    """The multiprocess path covers every recipient exactly once."""
+    scheduler = BatchScheduler(None)
+    shards = []
+    scheduler.on_batch_start = lambda num, batch: shards.append(batch)
+
+    scheduler.schedule_batches_multiprocess(_recipients(10), {}, _process_all, workers=2)
+
+    assert sum(len(shard) for shard in shards) == 10
+    assert len(shards) == scheduler.total_batches == scheduler.current_batch
+    stats = scheduler.get_progress()['batch_stats']
+    assert stats['total_emails_processed'] == 10
+    assert not scheduler.is_running
+
+
+def test_stop_interrupts_batch_interval():
+    """stop_scheduling wakes the scheduler out of the batch interval wait."""
+    scheduler = BatchScheduler(None, batch_size=1, batch_interval=30)
+    processed = []
+
+    def process(batch, template):
+        processed.extend(batch)
+        return {'processed': len(batch)}
+
+    thread = scheduler.schedule_batches_async(_recipients(3), {}, process)
+    time.sleep(0.1)
+    started = time.monotonic()
+    scheduler.stop_scheduling()
+
+    assert scheduler.wait_for_completion(timeout=5)
+    assert time.monotonic() - started < 5
+    assert len(processed) == 1
+    assert not thread.is_alive()
+
+
+def test_worker_thread_ends_with_run():
+    """The batch worker is shut down when a run finishes or is stopped."""
+    def sender_threads():
+        return [t for t in threading.enumerate() if t.name.startswith("batch-sender")]
+
+    for batch_size in (1, 3):
+        scheduler = BatchScheduler(None, batch_size=batch_size, batch_interval=0)
+        scheduler.schedule_batches(_recipients(5), {}, _process_all)
+        assert not sender_threads()
+
+    scheduler = BatchScheduler(None, batch_size=1, batch_interval=30)
+    scheduler.schedule_batches_async(_recipients(3), {}, _process_all)
+    time.sleep(0.1)
+    scheduler.stop_scheduling()
+    assert scheduler.wait_for_completion(timeout=5)
+    assert not sender_threads()
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -30,6 +30,7 @@
 import os
 import sys
 import time
+from functools import lru_cache
 
 # Add modules to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -38,6 +39,55 @@ from config.config_loader import ConfigLoader
 from modules.logger.logger import AppLogger
 from modules.browser.browser_handler import BrowserHandler
 from modules.browser.providers.protonmail import ProtonMailAutomation
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+@lru_cache(maxsize=1)
+def get_config(base_dir):
+    """Load the configuration once per process."""
+    return ConfigLoader(base_dir)
+
+@lru_cache(maxsize=1)
+def get_logger(base_dir, config_path):
+    """Set up the application logger once per process."""
+    return AppLogger(base_dir, config_path=config_path).get_logger()
+
+# Page-side checks used instead of fixed sleeps
+FOCUSED_JS = "el => document.activeElement === el"
+EMPTY_JS = "el => !(el.value || el.textContent)"
+CONTAINS_JS = "([el, text]) => (el.value || el.textContent || '').includes(text)"
+
+# Replace the field content in one call instead of one key event per character
+SET_CONTENT_JS = """(el, value) => {
+    if ('value' in el) { el.value = value; } else { el.innerText = value; }
+    el.dispatchEvent(new InputEvent('input', {bubbles: true, data: value}));
+}"""
+
+# For each visible element matching any selector: its index and the selectors it matches
+VISIBLE_MATCHES_JS = """selectors => {
+    const found = [];
+    document.querySelectorAll(selectors.join(', ')).forEach((el, index) => {
+        if (el.offsetParent !== null || el.getClientRects().length) {
+            found.push([index, selectors.filter(s => el.matches(s))]);
+        }
+    });
+    return found;
+}"""
+
+def find_visible_candidates(page, selectors):
+    """Return (element, matched selectors) for every visible match in two round-trips."""
+    visible = page.evaluate(VISIBLE_MATCHES_JS, selectors)
+    if not visible:
+        return []
+    elements = page.query_selector_all(', '.join(selectors))
+    return [(elements[index], matched) for index, matched in visible if index < len(elements)]
+
+def wait_for_state(page, expression, arg, timeout=2000):
+    """Wait until expression is truthy in the page; return False on timeout."""
+    try:
+        page.wait_for_function(expression, arg=arg, timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
 
 def test_body_field_selectors():
     """Test different body field selectors to find the working one."""
@@ -52,9 +102,8 @@ def test_body_field_selectors():
     try:
         # Setup
         base_dir = os.path.join(os.path.dirname(__file__), '..', '..')
-        config = ConfigLoader(base_dir)
-        app_logger = AppLogger(config.base_dir, config_path=config.config_path)
-        logger = app_logger.get_logger()
+        config = get_config(base_dir)
+        logger = get_logger(config.base_dir, config.config_path)
         
         # Load configurations
         browser_config = config.get_browser_automation_settings()
@@ -216,104 +265,98 @@ def test_body_field_selectors():
         
         print(f"Testing {len(body_selectors_to_test)} different selectors...")
         
+        # Discover every visible match at once instead of one query per selector
+        candidates = find_visible_candidates(page, body_selectors_to_test)
+        print(f"Found {len(candidates)} visible candidate element(s)")
+        
         working_selectors = []
         
-        for i, selector in enumerate(body_selectors_to_test, 1):
+        # Probe and report lines are collected and written in one call
+        lines = []
+        log = lines.append
+        
+        for i, (element, matched) in enumerate(candidates, 1):
             try:
-                print(f"   {i:2d}. Testing: {selector}")
+                log(f"   {i:2d}. Testing element matched by: {', '.join(matched)}")
                 
-                # Try to find the element
-                element = page.query_selector(selector)
-                if element and element.is_visible():
-                    print(f"       ✅ Element found and visible")
+                # Try to click and fill
+                try:
+                    element.click()
+                    wait_for_state(page, FOCUSED_JS, element)
                     
-                    # Try to click and fill
-                    try:
-                        element.click()
-                        time.sleep(0.5)
-                        
-                        # Clear any existing content
-                        page.keyboard.press("Control+a")
-                        time.sleep(0.2)
-                        page.keyboard.press("Delete")
-                        time.sleep(0.5)
-                        
-                        # Type test content
-                        page.keyboard.type(test_content)
-                        time.sleep(1)
-                        
-                        # Check if content was actually filled
-                        current_content = element.text_content() or element.input_value() or ""
-                        if test_content.lower() in current_content.lower():
-                            print(f"       🎉 SUCCESS! Content filled successfully")
-                            working_selectors.append(selector)
-                            
-                            # Clear the content for next test
-                            element.click()
-                            page.keyboard.press("Control+a")
-                            page.keyboard.press("Delete")
-                            time.sleep(0.5)
-                        else:
-                            print(f"       ❌ Content not filled (got: '{current_content[:50]}...')")
+                    # Replace any existing content with the test content
+                    element.evaluate(SET_CONTENT_JS, test_content)
+                    wait_for_state(page, CONTAINS_JS, [element, test_content])
                     
-                    except Exception as fill_error:
-                        print(f"       ❌ Error filling content: {fill_error}")
+                    # Check if content was actually filled
+                    current_content = element.text_content() or element.input_value() or ""
+                    if test_content.lower() in current_content.lower():
+                        log(f"       🎉 SUCCESS! Content filled successfully")
+                        working_selectors.extend(s for s in matched if s not in working_selectors)
+                        
+                        # Clear the content for next test
+                        element.evaluate(SET_CONTENT_JS, "")
+                        wait_for_state(page, EMPTY_JS, element)
+                    else:
+                        log(f"       ❌ Content not filled (got: '{current_content[:50]}...')")
                 
-                else:
-                    print(f"       ❌ Element not found or not visible")
+                except Exception as fill_error:
+                    log(f"       ❌ Error filling content: {fill_error}")
                     
             except Exception as e:
-                print(f"       ❌ Error testing selector: {e}")
+                log(f"       ❌ Error testing element: {e}")
+        
+        # Keep the original selector priority order
+        working_selectors.sort(key=body_selectors_to_test.index)
         
         # Report results
-        print(f"\n" + "=" * 60)
-        print("📊 BODY FIELD SELECTOR TEST RESULTS")
-        print("=" * 60)
+        log("\n" + "=" * 60)
+        log("📊 BODY FIELD SELECTOR TEST RESULTS")
+        log("=" * 60)
         
         if working_selectors:
-            print(f"🎉 SUCCESS! Found {len(working_selectors)} working selector(s):")
-            for i, selector in enumerate(working_selectors, 1):
-                print(f"   {i}. {selector}")
+            log(f"🎉 SUCCESS! Found {len(working_selectors)} working selector(s):")
+            lines.extend(f"   {i}. {selector}" for i, selector in enumerate(working_selectors, 1))
             
-            print(f"\n📋 Recommended action:")
-            print(f"   Update the body_field selectors in email_composer.py")
-            print(f"   Put the working selector(s) at the top of the list")
+            log("\n📋 Recommended action:")
+            log("   Update the body_field selectors in email_composer.py")
+            log("   Put the working selector(s) at the top of the list")
             
             # Test with the best working selector
             best_selector = working_selectors[0]
-            print(f"\n🧪 Final test with best selector: {best_selector}")
+            log(f"\n🧪 Final test with best selector: {best_selector}")
+            sys.stdout.write('\n'.join(lines) + '\n')
             
             try:
                 element = page.query_selector(best_selector)
                 if element:
                     element.click()
-                    time.sleep(0.5)
+                    wait_for_state(page, FOCUSED_JS, element)
                     page.keyboard.press("Control+a")
                     page.keyboard.press("Delete")
-                    time.sleep(0.5)
+                    wait_for_state(page, EMPTY_JS, element)
                     
                     final_test_content = "Final test: Body field is working perfectly! ✅"
                     page.keyboard.type(final_test_content)
-                    time.sleep(2)
+                    wait_for_state(page, CONTAINS_JS, [element, final_test_content])
                     
-                    print(f"✅ Final test successful!")
-                    print(f"   Content: {final_test_content}")
+                    sys.stdout.write(f"✅ Final test successful!\n   Content: {final_test_content}\n")
                     
             except Exception as e:
                 print(f"❌ Final test failed: {e}")
         
         else:
-            print("❌ No working selectors found!")
-            print("   The body field might use a different approach (iframe, shadow DOM, etc.)")
-            print("   Manual inspection of the HTML structure is needed.")
-        
-        # Keep browser open for inspection
-        print(f"\n⏹️  Keeping browser open for 30 seconds for manual inspection...")
-        print("   You can manually inspect the compose window to identify the body field.")
-        
-        for i in range(30, 0, -1):
-            print(f"   Closing in {i} seconds...", end='\r')
-            time.sleep(1)
+            log("❌ No working selectors found!")
+            log("   The body field might use a different approach (iframe, shadow DOM, etc.)")
+            log("   Manual inspection of the HTML structure is needed.")
+            sys.stdout.write('\n'.join(lines) + '\n')
+        
+        # Keep browser open for inspection only when asked to (INSPECT_HOLD_SECONDS)
+        hold_seconds = int(os.environ.get('INSPECT_HOLD_SECONDS', '0'))
+        if hold_seconds > 0:
+            print(f"\n⏹️  Keeping browser open for {hold_seconds} seconds for manual inspection...")
+            print("   You can manually inspect the compose window to identify the body field.")
+            time.sleep(hold_seconds)
         
         print("\n🛑 Closing browser...")
         
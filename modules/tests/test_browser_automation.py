@@ -26,6 +26,8 @@
 
 import os
 import sys
+import copy
+import logging
 import unittest
 import tempfile
 import json
@@ -34,17 +36,25 @@ from unittest.mock import Mock, patch, MagicMock
 # Add parent directories to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+# Skip the module only when Playwright itself is missing; other import errors must surface
+import pytest
+pytest.importorskip("playwright")
+
 from modules.browser.browser_handler import BrowserHandler
-from modules.browser.providers.protonmail_automation import ProtonMailAutomation
+from modules.browser.providers.protonmail import ProtonMailAutomation
 from modules.browser.browser_email_sender import BrowserEmailSender
 from modules.mailer.unified_email_sender import UnifiedEmailSender
 
+# Shared logger for every test; none of them assert on logging calls
+_NOOP_LOGGER = Mock(spec=logging.Logger)
+
 class TestBrowserHandler(unittest.TestCase):
     """Test cases for BrowserHandler class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.config = {
+    @classmethod
+    def setUpClass(cls):
+        """Build the handler once; each test works on a shallow copy."""
+        cls.config = {
             "headless": True,
             "max_concurrent_browsers": 2,
             "browser_timeout": 30,
@@ -54,8 +64,13 @@ class TestBrowserHandler(unittest.TestCase):
             "randomize_viewport": True,
             "use_random_user_agent": True
         }
-        self.logger = Mock()
-        self.browser_handler = BrowserHandler(self.config, self.logger)
+        cls._template_handler = BrowserHandler(cls.config, _NOOP_LOGGER)
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.logger = _NOOP_LOGGER
+        self.browser_handler = copy.copy(self._template_handler)
+        self.browser_handler.logger = self.logger
     
     def test_initialization(self):
         """Test browser handler initialization."""
@@ -67,21 +82,19 @@ class TestBrowserHandler(unittest.TestCase):
     
     def test_random_viewport_generation(self):
         """Test random viewport generation."""
-        viewport = self.browser_handler._get_random_viewport()
+        viewport = self.browser_handler._get_fullscreen_viewport()
         self.assertIn("width", viewport)
         self.assertIn("height", viewport)
         self.assertIsInstance(viewport["width"], int)
         self.assertIsInstance(viewport["height"], int)
     
-    def test_simulate_human_delay(self):
+    @patch('modules.browser.browser_handler.random.uniform', return_value=0.15)
+    @patch('modules.browser.browser_handler.time.sleep')
+    def test_simulate_human_delay(self, mock_sleep, mock_uniform):
         """Test human delay simulation."""
-        import time
-        start_time = time.time()
         self.browser_handler.simulate_human_delay(0.1, 0.2)
-        end_time = time.time()
-        delay = end_time - start_time
-        self.assertGreaterEqual(delay, 0.1)
-        self.assertLessEqual(delay, 0.3)  # Allow some tolerance
+        mock_uniform.assert_called_once_with(0.1, 0.2)
+        mock_sleep.assert_called_once_with(0.15)
     
     def test_typing_delay(self):
         """Test typing delay generation."""
@@ -93,9 +106,10 @@ class TestBrowserHandler(unittest.TestCase):
 class TestProtonMailAutomation(unittest.TestCase):
     """Test cases for ProtonMail automation."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.config = {
+    @classmethod
+    def setUpClass(cls):
+        """Build the automation once; each test works on a shallow copy."""
+        cls.config = {
             "base_url": "https://mail.proton.me",
             "login_url": "https://account.proton.me/login",
             "compose_button": '[data-testid="sidebar:compose"]',
@@ -107,39 +121,53 @@ class TestProtonMailAutomation(unittest.TestCase):
             "send_wait": 1,
             "page_load_wait": 3
         }
-        self.logger = Mock()
-        self.automation = ProtonMailAutomation(self.config, self.logger)
+        cls._template_automation = ProtonMailAutomation(cls.config, _NOOP_LOGGER)
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.logger = _NOOP_LOGGER
+        self.automation = copy.copy(self._template_automation)
+        self.automation.logger = self.logger
     
     def test_initialization(self):
         """Test ProtonMail automation initialization."""
         self.assertIsNotNone(self.automation)
         self.assertEqual(self.automation.config, self.config)
-        self.assertEqual(self.automation.base_url, "https://mail.proton.me")
-        self.assertIn("compose_button", self.automation.selectors)
+        self.assertEqual(self.automation.auth.base_url, "https://mail.proton.me")
+        self.assertIn("compose_button", self.automation.composer.selectors)
 
 class TestBrowserEmailSender(unittest.TestCase):
     """Test cases for BrowserEmailSender class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.browser_config = {
+    @classmethod
+    def setUpClass(cls):
+        """Build the sender once; each test works on a shallow copy."""
+        cls.browser_config = {
             "enable_browser_automation": True,
             "headless": True,
             "max_concurrent_browsers": 2
         }
-        self.providers_config = {
+        cls.providers_config = {
             "protonmail": {
                 "enabled": True,
                 "base_url": "https://mail.proton.me"
+            },
+            "yahoo": {
+                "enabled": False
             }
         }
-        self.logger = Mock()
-        self.browser_sender = BrowserEmailSender(
-            self.browser_config, 
-            self.providers_config, 
-            self.logger
+        cls._template_sender = BrowserEmailSender(
+            cls.browser_config, 
+            cls.providers_config, 
+            _NOOP_LOGGER
         )
     
+    def setUp(self):
+        """Set up test fixtures."""
+        self.logger = _NOOP_LOGGER
+        self.browser_sender = copy.copy(self._template_sender)
+        self.browser_sender.logger = self.logger
+    
     def test_initialization(self):
         """Test browser email sender initialization."""
         self.assertIsNotNone(self.browser_sender)
@@ -159,43 +187,49 @@ class TestBrowserEmailSender(unittest.TestCase):
 class TestUnifiedEmailSender(unittest.TestCase):
     """Test cases for UnifiedEmailSender class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.smtp_configs = {
+    @classmethod
+    def setUpClass(cls):
+        """Build the configs and the read-only SMTP-mode sender once."""
+        cls.smtp_configs = {
             "default": {
                 "host": "smtp.example.com",
                 "port": 587,
                 "use_tls": True
             }
         }
-        self.browser_config = {
+        cls.browser_config = {
             "enable_browser_automation": True,
             "headless": True
         }
-        self.providers_config = {
+        cls.providers_config = {
             "protonmail": {
                 "enabled": True,
                 "base_url": "https://mail.proton.me"
             }
         }
-        self.logger = Mock()
+        cls._smtp_sender = UnifiedEmailSender(
+            cls.smtp_configs, 
+            cls.browser_config, 
+            cls.providers_config, 
+            "smtp", 
+            _NOOP_LOGGER
+        )
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.logger = _NOOP_LOGGER
     
     def test_smtp_mode_initialization(self):
         """Test unified sender initialization in SMTP mode."""
-        sender = UnifiedEmailSender(
-            self.smtp_configs, 
-            self.browser_config, 
-            self.providers_config, 
-            "smtp", 
-            self.logger
-        )
+        sender = self._smtp_sender
         self.assertEqual(sender.get_sending_mode(), "smtp")
         self.assertIsNotNone(sender.smtp_sender)
         self.assertIsNone(sender.browser_sender)
     
     def test_browser_mode_initialization(self):
         """Test unified sender initialization in browser mode."""
-        with patch('modules.browser.browser_email_sender.BrowserEmailSender') as mock_browser:
+        with patch('modules.mailer.unified_email_sender.BrowserEmailSender') as mock_browser, \
+             patch('config.config_loader.ConfigLoader'):
             mock_instance = Mock()
             mock_instance.start_browser.return_value = True
             mock_browser.return_value = mock_instance
@@ -223,12 +257,10 @@ class TestUnifiedEmailSender(unittest.TestCase):
 class TestCookieValidation(unittest.TestCase):
     """Test cases for cookie validation functionality."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.logger = Mock()
-        
-        # Create temporary cookie file
-        self.temp_cookie_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
+    @classmethod
+    def setUpClass(cls):
+        """Write the temporary cookie file once for all tests."""
+        cls.temp_cookie_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
         cookie_data = [
             {
                 "domain": ".proton.me",
@@ -240,16 +272,21 @@ class TestCookieValidation(unittest.TestCase):
                 "httpOnly": False
             }
         ]
-        json.dump(cookie_data, self.temp_cookie_file)
-        self.temp_cookie_file.close()
+        json.dump(cookie_data, cls.temp_cookie_file)
+        cls.temp_cookie_file.close()
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test fixtures."""
         try:
-            os.unlink(self.temp_cookie_file.name)
+            os.unlink(cls.temp_cookie_file.name)
         except:
             pass
     
+    def setUp(self):
+        """Set up test fixtures."""
+        self.logger = _NOOP_LOGGER
+    
     def test_cookie_file_loading(self):
         """Test cookie file loading."""
         config = {"headless": True}
@@ -263,6 +300,22 @@ class TestCookieValidation(unittest.TestCase):
             context = handler.create_context_with_cookies("test@proton.me", self.temp_cookie_file.name)
             self.assertIsNotNone(context)
     
+    def test_cookie_file_parsed_once(self):
+        """Test that an unchanged cookie file is parsed only once."""
+        handler = BrowserHandler({"headless": True}, self.logger)
+        BrowserHandler._load_cookies_cached.cache_clear()
+        
+        with patch.object(handler, 'browser') as mock_browser:
+            mock_browser.new_context.return_value = Mock()
+            handler.create_context_with_cookies("a@proton.me", self.temp_cookie_file.name)
+            handler.create_context_with_cookies("b@proton.me", self.temp_cookie_file.name)
+            
+            cookies = mock_browser.new_context.call_args.kwargs["storage_state"]["cookies"]
+            self.assertEqual(cookies[0]["sameSite"], "Lax")
+        
+        info = BrowserHandler._load_cookies_cached.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+    
     def test_missing_cookie_file(self):
         """Test handling of missing cookie file."""
         config = {"headless": True}
@@ -276,7 +329,7 @@ class TestIntegration(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        self.logger = Mock()
+        self.logger = _NOOP_LOGGER
     
     def test_end_to_end_configuration(self):
         """Test end-to-end configuration validation."""
@@ -290,7 +343,8 @@ class TestIntegration(unittest.TestCase):
         browser_config = {"enable_browser_automation": True}
         providers_config = {"protonmail": {"enabled": True}}
         
-        with patch('modules.browser.browser_email_sender.BrowserEmailSender') as mock_browser:
+        with patch('modules.mailer.unified_email_sender.BrowserEmailSender') as mock_browser, \
+             patch('config.config_loader.ConfigLoader'):
             mock_instance = Mock()
             mock_instance.start_browser.return_value = True
             mock_instance.is_provider_supported.return_value = True
@@ -305,16 +359,10 @@ class TestIntegration(unittest.TestCase):
             # Note: Will be False due to missing cookie file, but shouldn't crash
 
 if __name__ == '__main__':
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add test cases
-    test_suite.addTest(unittest.makeSuite(TestBrowserHandler))
-    test_suite.addTest(unittest.makeSuite(TestProtonMailAutomation))
-    test_suite.addTest(unittest.makeSuite(TestBrowserEmailSender))
-    test_suite.addTest(unittest.makeSuite(TestUnifiedEmailSender))
-    test_suite.addTest(unittest.makeSuite(TestCookieValidation))
-    test_suite.addTest(unittest.makeSuite(TestIntegration))
+    # Create test suite from every test case in this module. The tests patch
+    # module globals, so run them in separate processes (pytest -n auto) rather
+    # than threads when parallelism is wanted.
+    test_suite = unittest.defaultTestLoader.loadTestsFromModule(sys.modules[__name__])
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
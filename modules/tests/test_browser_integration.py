@@ -26,29 +26,55 @@
 import os
 import sys
 import time
+from functools import lru_cache
 
 # Add parent directories to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from config.config_loader import ConfigLoader
 from modules.logger.logger import AppLogger
-from modules.browser.browser_handler import BrowserHandler
-from modules.browser.providers.protonmail_automation import ProtonMailAutomation
-from modules.browser.browser_email_sender import BrowserEmailSender
 
-def test_browser_automation():
-    """Test browser automation functionality with real browser."""
+@lru_cache(maxsize=1)
+def get_config(base_dir):
+    """Load the configuration once per process."""
+    return ConfigLoader(base_dir)
+
+@lru_cache(maxsize=1)
+def get_logger(base_dir, config_path):
+    """Set up the application logger once per process."""
+    return AppLogger(base_dir, config_path=config_path).get_logger()
+
+def launch_browser_handler(browser_config, logger):
+    """Start Playwright and launch a browser; return None if either fails."""
+    from modules.browser.browser_handler import BrowserHandler
+    
+    browser_handler = BrowserHandler(browser_config, logger)
+    
+    if not browser_handler.start_playwright():
+        logger.error("Failed to start Playwright")
+        return None
+    
+    if not browser_handler.launch_browser():
+        logger.error("Failed to launch browser")
+        browser_handler.close_browser()
+        return None
+    
+    return browser_handler
+
+def test_browser_automation(browser_handler):
+    """Test browser automation functionality on an already launched browser."""
     
     # Setup
     base_dir = os.path.join(os.path.dirname(__file__), '..', '..')
-    config = ConfigLoader(base_dir)
-    app_logger = AppLogger(config.base_dir, config_path=config.config_path)
-    logger = app_logger.get_logger()
+    config = get_config(base_dir)
+    logger = get_logger(config.base_dir, config.config_path)
     
     logger.info("=" * 60)
     logger.info("BROWSER AUTOMATION INTEGRATION TEST")
     logger.info("=" * 60)
     
+    context = None
+    page = None
     try:
         # Load configurations
         browser_config = config.get_browser_automation_settings()
@@ -82,16 +108,10 @@ def test_browser_automation():
         
         logger.info(f"Cookie file found: {cookie_file}")
         
-        # Test 1: Browser Handler
+        # Test 1: Browser Handler (launched once and shared between tests)
         logger.info("\n--- Test 1: Browser Handler ---")
-        browser_handler = BrowserHandler(browser_config, logger)
-        
-        if not browser_handler.start_playwright():
-            logger.error("Failed to start Playwright")
-            return False
-        
-        if not browser_handler.launch_browser():
-            logger.error("Failed to launch browser")
+        if not browser_handler.is_browser_ready():
+            logger.error("Browser is not ready")
             return False
         
         logger.info("✓ Browser handler initialized successfully")
@@ -105,7 +125,6 @@ def test_browser_automation():
         
         if not context:
             logger.error("Failed to create browser context with cookies")
-            browser_handler.close_browser()
             return False
         
         logger.info("✓ Browser context created with cookies")
@@ -116,9 +135,9 @@ def test_browser_automation():
         
         if not page:
             logger.error("Failed to create page")
-            browser_handler.close_browser()
             return False
         
+        from modules.browser.providers.protonmail import ProtonMailAutomation
         protonmail_automation = ProtonMailAutomation(
             providers_config['protonmail'], 
             logger
@@ -129,8 +148,6 @@ def test_browser_automation():
         if not is_logged_in:
             logger.error("ProtonMail login validation failed")
             logger.info("Please check if cookies are valid and not expired")
-            page.close()
-            browser_handler.close_browser()
             return False
         
         logger.info("✓ ProtonMail login validation successful")
@@ -141,15 +158,11 @@ def test_browser_automation():
         # Navigate to mail interface
         if not protonmail_automation.navigate_to_mail(page):
             logger.error("Failed to navigate to ProtonMail interface")
-            page.close()
-            browser_handler.close_browser()
             return False
         
         # Open compose window
         if not protonmail_automation.open_compose(page):
             logger.error("Failed to open compose window")
-            page.close()
-            browser_handler.close_browser()
             return False
         
         logger.info("✓ Compose window opened successfully")
@@ -161,20 +174,14 @@ def test_browser_automation():
         
         if not protonmail_automation.fill_recipient(page, test_recipient):
             logger.error("Failed to fill recipient")
-            page.close()
-            browser_handler.close_browser()
             return False
         
         if not protonmail_automation.fill_subject(page, test_subject):
             logger.error("Failed to fill subject")
-            page.close()
-            browser_handler.close_browser()
             return False
         
         if not protonmail_automation.fill_body(page, test_body, "plain"):
             logger.error("Failed to fill body")
-            page.close()
-            browser_handler.close_browser()
             return False
         
         logger.info("✓ Email composition successful")
@@ -189,29 +196,24 @@ def test_browser_automation():
         
         # Test 5: Browser Email Sender
         logger.info("\n--- Test 5: Browser Email Sender ---")
+        from modules.browser.browser_email_sender import BrowserEmailSender
         browser_sender = BrowserEmailSender(browser_config, providers_config, logger)
         
         if not browser_sender.start_browser():
             logger.error("Failed to start browser email sender")
-            page.close()
-            browser_handler.close_browser()
             return False
         
         # Validate sender configuration
         if not browser_sender.validate_sender_cookies(protonmail_sender):
             logger.error("Sender cookie validation failed")
             browser_sender.close()
-            page.close()
-            browser_handler.close_browser()
             return False
         
         logger.info("✓ Browser email sender validation successful")
         
         # Cleanup
         logger.info("\n--- Cleanup ---")
-        page.close()
         browser_sender.close()
-        browser_handler.close_browser()
         
         logger.info("✓ All resources cleaned up")
         
@@ -231,6 +233,14 @@ def test_browser_automation():
         logger.error(f"Browser automation test failed: {e}")
         logger.error("Please check your configuration and try again")
         return False
+    
+    finally:
+        # Close only this test's page and context; the browser stays up for reuse
+        if page:
+            page.close()
+        if context:
+            context.close()
+            browser_handler.contexts.pop(protonmail_sender['email'], None)
 
 def main():
     """Main function to run the integration test."""
@@ -242,7 +252,18 @@ def main():
     print("3. Browser binaries installed (playwright install)")
     print()
     
-    success = test_browser_automation()
+    base_dir = os.path.join(os.path.dirname(__file__), '..', '..')
+    config = get_config(base_dir)
+    logger = get_logger(config.base_dir, config.config_path)
+    
+    browser_handler = launch_browser_handler(config.get_browser_automation_settings(), logger)
+    if browser_handler is None:
+        sys.exit(1)
+    
+    try:
+        success = test_browser_automation(browser_handler)
+    finally:
+        browser_handler.close_browser()
     
     if success:
         print("\n🎉 Browser automation is ready to use!")
@@ -25,8 +25,6 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from config.config_loader import ConfigLoader
 from modules.logger.logger import AppLogger
-from modules.browser.browser_handler import BrowserHandler
-from modules.browser.providers.protonmail import ProtonMailAutomation
 
 def test_complete_email_system():
     """Test the complete email system with enhanced body filling."""
@@ -86,6 +84,7 @@ def test_complete_email_system():
         
         # Create ProtonMail automation with full configuration
         print(f"\n🤖 Step 1: Initializing enhanced ProtonMail automation...")
+        from modules.browser.providers.protonmail import ProtonMailAutomation
         protonmail_automation = ProtonMailAutomation(
             providers_config['protonmail'], 
             logger,
@@ -126,6 +125,7 @@ def test_complete_email_system():
         
         # Create browser handler
         print(f"\n🚀 Step 3: Starting browser with enhanced settings...")
+        from modules.browser.browser_handler import BrowserHandler
         browser_handler = BrowserHandler(browser_config, logger)
         
         if not browser_handler.start_playwright():
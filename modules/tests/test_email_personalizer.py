@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+# ================================================================================
+# BULK_MAILER - Professional Email Campaign Manager
+# ================================================================================
+#
+# Author: Krishna Kushwaha
+# GitHub: https://github.com/krishna-kush
+# Project: BULK_MAILER - Enterprise Email Campaign Management System
+# Repository: https://github.com/krishna-kush/Bulk-Mailer
+#
+# Description: Test script for the personalizer's compiled template cache
+#
+# ================================================================================
+
+import os
+import sys
+import logging
+
+# Add the parent directories to the path so we can import modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+modules_dir = os.path.dirname(current_dir)
+mailer_dir = os.path.dirname(modules_dir)
+sys.path.insert(0, mailer_dir)
+
+import pytest
+
+from modules.mailer import email_personalizer
+from modules.mailer.email_personalizer import EmailPersonalizer
+
+pytestmark = pytest.mark.skipif(not email_personalizer.JINJA2_AVAILABLE, reason="Jinja2 not installed")
+
+
+def _personalizer():
+    return EmailPersonalizer({}, mailer_dir, logging.getLogger("test_email_personalizer"))
+
+
+def test_template_is_compiled_once():
+    """Repeated personalization of one template reuses the compiled template."""
+    personalizer = _personalizer()
+    template = "<p>Hi {{ recipient_name }}</p>"
+
+    outputs = [personalizer.personalize_email(template, {'email': email})
+               for email in ('john.doe@example.com', 'jane.roe@example.com', 'john.doe@example.com')]
+
+    assert outputs == ["<p>Hi John Doe</p>", "<p>Hi Jane Roe</p>", "<p>Hi John Doe</p>"]
+    assert len(personalizer._template_cache) == 1
+    assert personalizer._get_compiled_template(template)[1] == {'recipient_name'}
+
+
+def test_randomized_templates_are_not_cached():
+    """Randomized output differs per call, so it is compiled without filling the cache."""
+    personalizer = _personalizer()
+    template = ("<style>.a { color: red; margin: 0; padding: 0; }</style>"
+                "<p>{Hi|Hello|Hey} {{ recipient_name }}</p>")
+
+    outputs = [personalizer.personalize_email(template, {'email': 'john.doe@example.com'})
+               for _ in range(3)]
+
+    assert all("John Doe" in output and "{{" not in output for output in outputs)
+    assert len(personalizer._template_cache) == 0
+
+
+def test_template_cache_is_bounded():
+    """The least recently used template is evicted past the cache size."""
+    personalizer = _personalizer()
+    size = email_personalizer.TEMPLATE_CACHE_SIZE
+
+    for n in range(size + 1):
+        personalizer.personalize_email(f"<p>{n} {{{{ recipient_name }}}}</p>", {'email': 'a@example.com'})
+
+    assert len(personalizer._template_cache) == size
+    assert "<p>0 {{ recipient_name }}</p>" not in personalizer._template_cache
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+# ================================================================================
+# BULK_MAILER - Professional Email Campaign Manager
+# ================================================================================
+#
+# Author: Krishna Kushwaha
+# GitHub: https://github.com/krishna-kush
+# Project: BULK_MAILER - Enterprise Email Campaign Management System
+# Repository: https://github.com/krishna-kush/Bulk-Mailer
+#
+# Description: Test script for email retry and sender fallback handling
+#
+# ================================================================================
+
+import os
+import sys
+import time
+import logging
+import threading
+
+# Add the parent directories to the path so we can import modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+modules_dir = os.path.dirname(current_dir)
+mailer_dir = os.path.dirname(modules_dir)
+sys.path.insert(0, mailer_dir)
+
+from modules.retry.email_retry_handler import EmailRetryHandler
+
+
+class FakeEmailSender:
+    """Email sender stub that succeeds only for the given sender addresses."""
+
+    def __init__(self, working_senders=()):
+        self.working_senders = set(working_senders)
+        self.calls = []
+
+    def send_email(self, sender_email, **kwargs):
+        self.calls.append(sender_email)
+        return sender_email in self.working_senders
+
+
+def _handler(max_retries=0, retry_delay=0):
+    retry_settings = {
+        'max_retries_per_sender': max_retries,
+        'retry_delay': retry_delay,
+        'max_retries_per_recipient': 10
+    }
+    return EmailRetryHandler(retry_settings, logging.getLogger(__name__))
+
+
+def test_retries_until_attempts_exhausted():
+    """A failing sender is attempted once plus max_retries_per_sender times."""
+    sender = FakeEmailSender()
+    result = _handler(max_retries=2).attempt_send_with_retries(
+        sender, {'email': 'a@example.com', 'password': 'x'}, 'r@example.com', 'Subject', 'Body')
+
+    assert not result['success']
+    assert result['attempts'] == 3
+    assert sender.calls == ['a@example.com'] * 3
+
+
+def test_fallback_moves_to_next_sender():
+    """A failing sender falls back to the next one, which delivers the email."""
+    sender = FakeEmailSender(working_senders=['b@example.com'])
+    senders = [{'email': 'a@example.com', 'password': 'x'}, {'email': 'b@example.com', 'password': 'y'}]
+
+    result = _handler().attempt_send_with_fallbacks(sender, senders, 'r@example.com', 'Subject', '<p>Body</p>')
+
+    assert result['success']
+    assert result['successful_sender'] == 'b@example.com'
+    assert [failed['sender_email'] for failed in result['failed_senders']] == ['a@example.com']
+    assert sender.calls == ['a@example.com', 'b@example.com']
+
+
+def test_shutdown_interrupts_retry_delay():
+    """shutdown() ends the wait between retries immediately."""
+    handler = _handler(max_retries=3, retry_delay=30)
+    threading.Timer(0.1, handler.shutdown).start()
+
+    start = time.monotonic()
+    result = handler.attempt_send_with_retries(
+        FakeEmailSender(), {'email': 'a@example.com', 'password': 'x'}, 'r@example.com', 'Subject', 'Body')
+
+    assert time.monotonic() - start < 5
+    assert result['attempts'] == 1
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+# ================================================================================
+# BULK_MAILER - Professional Email Campaign Manager
+# ================================================================================
+#
+# Author: Krishna Kushwaha
+# GitHub: https://github.com/krishna-kush
+# Project: BULK_MAILER - Enterprise Email Campaign Management System
+# Repository: https://github.com/krishna-kush/Bulk-Mailer
+#
+# Description: Test script for batched sending over one SMTP session
+#
+# ================================================================================
+
+import os
+import sys
+import logging
+import smtplib
+
+# Add the parent directories to the path so we can import modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+modules_dir = os.path.dirname(current_dir)
+mailer_dir = os.path.dirname(modules_dir)
+sys.path.insert(0, mailer_dir)
+
+from modules.mailer.email_sender import EmailSender
+
+
+SMTP_CONFIGS = {"default": {"host": "smtp.example.com", "port": 587, "use_tls": True}}
+
+
+class FakeSMTP:
+    """Records SMTP sessions instead of connecting."""
+
+    sessions = []
+
+    def __init__(self, host, port):
+        self.logins = 0
+        self.sent = []
+        FakeSMTP.sessions.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        self.logins += 1
+
+    def send_message(self, msg):
+        if msg["To"] == "refused@example.com":
+            raise smtplib.SMTPRecipientsRefused({msg["To"]: (550, b"no such user")})
+        if msg["To"] == "drop@example.com":
+            raise smtplib.SMTPServerDisconnected("connection lost")
+        self.sent.append(msg["To"])
+
+
+def _messages(*recipients):
+    return [{"recipient_email": r, "subject": "Hi", "body_content": "<p>Hi</p>"} for r in recipients]
+
+
+def _sender(monkeypatch):
+    FakeSMTP.sessions = []
+    monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+    return EmailSender(SMTP_CONFIGS, logging.getLogger("test_email_sender"))
+
+
+def test_send_batch_uses_one_session(monkeypatch):
+    """All emails of a batch go out over one login."""
+    sender = _sender(monkeypatch)
+
+    results = sender.send_batch("me@example.com", "pw", _messages("a@example.com", "b@example.com"))
+
+    assert results == [True, True]
+    assert len(FakeSMTP.sessions) == 1
+    assert FakeSMTP.sessions[0].logins == 1
+    assert FakeSMTP.sessions[0].sent == ["a@example.com", "b@example.com"]
+
+
+def test_send_batch_reports_failures(monkeypatch):
+    """A refused recipient fails alone; a dropped session fails the rest."""
+    sender = _sender(monkeypatch)
+
+    results = sender.send_batch("me@example.com", "pw",
+                                _messages("a@example.com", "refused@example.com", "b@example.com",
+                                          "drop@example.com", "c@example.com"))
+
+    assert results == [True, False, True, False, False]
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+# ================================================================================
+# BULK_MAILER - Professional Email Campaign Manager
+# ================================================================================
+#
+# Author: Krishna Kushwaha
+# GitHub: https://github.com/krishna-kush
+# Project: BULK_MAILER - Enterprise Email Campaign Management System
+# Repository: https://github.com/krishna-kush/Bulk-Mailer
+#
+# Description: Test script for single-pass HTML obfuscation
+#
+# ================================================================================
+
+import os
+import re
+import sys
+import random
+
+# Add the parent directories to the path so we can import modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+modules_dir = os.path.dirname(current_dir)
+mailer_dir = os.path.dirname(modules_dir)
+sys.path.insert(0, mailer_dir)
+
+from modules.mailer.html_obfuscator import HTMLObfuscator
+
+HTML = """<html><head><style>.btn { color: red; } .btn-primary { color: blue; }</style></head>
+<body><div class="btn btn-primary" style="color: red; margin: 0"><p>Hello there</p></div>
+<a href="https://example.com" title="x" data-id="1" aria-label="y">Link</a></body></html>"""
+
+
+def _text(html):
+    return re.sub(r'<[^>]+>|\s+', '', re.sub(r'<!--.*?-->', '', html, flags=re.DOTALL))
+
+
+def test_text_content_is_preserved():
+    """Obfuscation only touches markup, never the visible text."""
+    random.seed(7)
+    for intensity in ('light', 'medium', 'heavy'):
+        output = HTMLObfuscator().obfuscate_html(HTML, intensity)
+        assert 'Hello there' in output
+        assert 'Link' in output
+        assert 'href="https://example.com"' in output
+
+
+def test_class_renames_match_css():
+    """Renamed classes are applied consistently to CSS selectors and class attributes."""
+    random.seed(3)
+    output = HTMLObfuscator().obfuscate_html(HTML, 'medium')
+
+    class_value = re.search(r'class="([^"]*)"', output).group(1).split()
+    assert len(class_value) == 2
+    for name in class_value:
+        assert '.' + name + ' ' in output
+
+
+def test_light_mode_keeps_classes():
+    """Light intensity leaves class names and attribute order alone."""
+    random.seed(5)
+    output = HTMLObfuscator().obfuscate_html(HTML, 'light')
+
+    assert 'class="btn btn-primary"' in output
+    assert '.btn-primary {' in output
+    assert 'title="x" data-id="1" aria-label="y"' in output
+    assert _text(output) == _text(HTML)
+
+
+
+def test_plain_text_is_returned_unchanged():
+    """Content without tags is passed through as-is."""
+    text = "Hello there, no markup here"
+    assert HTMLObfuscator().obfuscate_html(text, 'heavy') is text
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
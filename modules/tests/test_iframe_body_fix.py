@@ -288,9 +288,11 @@ def test_iframe_body_filling():
         print(f"\n⏹️  Keeping browser open for 30 seconds for inspection...")
         
         # Keep browser open for inspection
+        write = sys.stdout.write
         for i in range(30, 0, -1):
-            print(f"   Closing in {i} seconds...", end='\r')
+            write(f"   Closing in {i} seconds...\r")
             time.sleep(1)
+        sys.stdout.flush()
         
         print("\n🛑 Closing browser...")
         
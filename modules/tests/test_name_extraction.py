@@ -40,7 +40,7 @@ import unittest
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from modules.core.utils import extract_name_from_email, _is_likely_company_name
+from modules.core.utils import extract_name_from_email, is_generic_mailbox, _is_likely_company_name
 
 
 class TestNameExtraction(unittest.TestCase):
@@ -76,6 +76,37 @@ class TestNameExtraction(unittest.TestCase):
                 result = extract_name_from_email(email, no_company=False)
                 self.assertEqual(result, expected)
 
+    def test_generic_mailbox_detection(self):
+        """Test generic mailbox detection by name set and spelling variants."""
+        test_cases = [
+            ("info", True),
+            ("Support", True),
+            ("no_reply", True),
+            ("Do-Not-Reply", True),
+            ("mailer-daemon", True),
+            ("rahul", False),
+            ("information", False),
+        ]
+        
+        for local_part, expected in test_cases:
+            with self.subTest(local_part=local_part):
+                self.assertEqual(is_generic_mailbox(local_part), expected)
+
+    def test_generic_mailbox_variants_are_not_names(self):
+        """Test that spelling variants of generic mailboxes are not greeted by name."""
+        test_cases = [
+            ("no_reply@company.com", "There"),
+            ("do-not-reply@company.com", "There"),
+            ("notifications@company.com", "There"),
+            ("bounces@company.com", "There"),
+            ("mailer-daemon@company.com", "There"),
+        ]
+        
+        for email, expected in test_cases:
+            with self.subTest(email=email):
+                result = extract_name_from_email(email, no_company=True)
+                self.assertEqual(result, expected)
+
     def test_no_company_behavior(self):
         """Test no_company=True behavior."""
         test_cases = [
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+
+# ================================================================================
+# BULK_MAILER - Professional Email Campaign Manager
+# ================================================================================
+#
+# Author: Krishna Kushwaha
+# GitHub: https://github.com/krishna-kush
+# Project: BULK_MAILER - Enterprise Email Campaign Management System
+# Repository: https://github.com/krishna-kush/Bulk-Mailer
+#
+# Description: Test script for per-sender and global limits in the rate limiter
+#
+# ================================================================================
+
+import os
+import sys
+import time
+import threading
+
+# Add the parent directories to the path so we can import modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+modules_dir = os.path.dirname(current_dir)
+mailer_dir = os.path.dirname(modules_dir)
+sys.path.insert(0, mailer_dir)
+
+from modules.rate_limiter.rate_limiter import RateLimiter
+
+
+def _sender(email, **limits):
+    sender = {
+        'email': email,
+        'total_limit_per_run': 0,
+        'limit_per_min': 0,
+        'limit_per_hour': 0,
+        'per_email_gap_sec': 0,
+        'per_email_gap_sec_randomizer': 0
+    }
+    sender.update(limits)
+    return sender
+
+
+def test_per_minute_limit():
+    """Sender is blocked once its per-minute window is full."""
+    limiter = RateLimiter([_sender('a@example.com', limit_per_min=2)])
+
+    for _ in range(2):
+        assert limiter.can_send_ignoring_gap('a@example.com')
+        limiter.record_sent_legacy('a@example.com')
+
+    assert not limiter.can_send_ignoring_gap('a@example.com')
+
+
+def test_try_acquire_checks_windows_and_gap():
+    """try_acquire applies the window limits and the gap in one step."""
+    limiter = RateLimiter([_sender('a@example.com', limit_per_min=2),
+                           _sender('b@example.com', per_email_gap_sec=30)])
+
+    assert limiter.try_acquire('a@example.com')
+    assert limiter.try_acquire('a@example.com')
+    assert not limiter.try_acquire('a@example.com')
+
+    assert limiter.try_acquire('b@example.com')
+    limiter.record_sent('b@example.com')
+    assert not limiter.try_acquire('b@example.com')
+    assert limiter.get_stats()['b@example.com']['total_sent_this_run'] == 1
+
+
+def test_try_acquire_starts_gap():
+    """A second acquire inside the gap is refused without any record_sent() in between."""
+    limiter = RateLimiter([_sender('b@example.com', per_email_gap_sec=30)])
+
+    assert limiter.try_acquire('b@example.com', now=1000.0)
+    assert not limiter.try_acquire('b@example.com', now=1000.0)
+    assert not limiter.try_acquire('b@example.com', now=1029.0)
+    assert limiter.try_acquire('b@example.com', now=1030.0)
+    assert limiter.get_stats()['b@example.com']['total_sent_this_run'] == 2
+
+
+def test_token_buckets_refill():
+    """Buckets allow a burst up to the limit, then refill at limit per window."""
+    limiter = RateLimiter([_sender('a@example.com', limit_per_min=2),
+                           _sender('b@example.com', limit_per_hour=2)])
+
+    assert limiter.try_acquire('a@example.com', now=1000.0)
+    assert limiter.try_acquire('a@example.com', now=1000.0)
+    assert not limiter.try_acquire('a@example.com', now=1000.0)
+    assert not limiter.try_acquire('a@example.com', now=1029.0)
+    assert limiter.try_acquire('a@example.com', now=1031.0)
+
+    assert limiter.try_acquire('b@example.com', now=1000.0)
+    assert limiter.try_acquire('b@example.com', now=1000.0)
+    assert not limiter.try_acquire('b@example.com', now=2000.0)
+    assert limiter.try_acquire('b@example.com', now=2801.0)
+
+
+def test_per_hour_limit():
+    """Sender is blocked once its per-hour window is full."""
+    limiter = RateLimiter([_sender('a@example.com', limit_per_min=10, limit_per_hour=3)])
+
+    for _ in range(3):
+        assert limiter.can_send_ignoring_gap('a@example.com')
+        limiter.record_sent_legacy('a@example.com')
+
+    assert not limiter.can_send_ignoring_gap('a@example.com')
+
+
+def test_total_limit_per_run():
+    """Reservations stop once the per-run total is used up."""
+    limiter = RateLimiter([_sender('a@example.com', total_limit_per_run=2)])
+
+    assert limiter.try_acquire('a@example.com')
+    assert limiter.try_acquire('a@example.com')
+    assert not limiter.try_acquire('a@example.com')
+    assert limiter.get_stats()['a@example.com']['total_sent_this_run'] == 2
+
+
+def test_global_limit():
+    """The global limit applies across all senders."""
+    limiter = RateLimiter([_sender('a@example.com'), _sender('b@example.com')], global_limit=3)
+
+    assert limiter.try_acquire('a@example.com')
+    assert limiter.try_acquire('b@example.com')
+    assert limiter.try_acquire('a@example.com')
+    assert not limiter.try_acquire('b@example.com')
+    assert limiter.is_global_limit_reached()
+    assert limiter.get_stats()['global']['total_sent'] == 3
+
+
+def test_global_limit_concurrent():
+    """Concurrent reservations never exceed the global limit."""
+    senders = [_sender(f'user{n}@example.com') for n in range(4)]
+    limiter = RateLimiter(senders, global_limit=100)
+    reserved = []
+
+    def worker(sender_email):
+        for _ in range(50):
+            if limiter.try_acquire(sender_email):
+                reserved.append(sender_email)
+
+    threads = [threading.Thread(target=worker, args=(s['email'],)) for s in senders for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(reserved) == 100
+    assert limiter.get_stats()['global']['total_sent'] == 100
+
+
+def test_single_threaded_limits():
+    """The lock-free single-threaded mode enforces the same limits."""
+    limiter = RateLimiter([_sender('a@example.com', total_limit_per_run=2)], global_limit=5,
+                          single_threaded=True)
+
+    assert limiter.try_acquire('a@example.com')
+    assert limiter.try_acquire('a@example.com')
+    assert not limiter.try_acquire('a@example.com')
+    assert limiter.try_acquire('other@example.com')
+    assert limiter.get_stats()['global']['total_sent'] == 3
+
+
+def test_gap_control():
+    """Gap control blocks a sender until its gap has elapsed."""
+    limiter = RateLimiter([_sender('a@example.com', per_email_gap_sec=30)])
+
+    assert limiter.can_send('a@example.com')
+    limiter.record_sent_legacy('a@example.com')
+
+    assert not limiter.can_send('a@example.com')
+    assert 0 < limiter.get_gap_wait_time('a@example.com') <= 30
+    assert limiter.schedule_next_slot('a@example.com') > time.monotonic()
+    assert limiter.schedule_next_slot('other@example.com') == float('-inf')
+    assert limiter.get_average_gap_time('a@example.com') == 30.0
+
+
+def test_randomized_gap_range():
+    """Randomized gaps stay within base ± randomizer (minimum 1 second)."""
+    limiter = RateLimiter([_sender('a@example.com', per_email_gap_sec=5, per_email_gap_sec_randomizer=10)])
+
+    for _ in range(200):
+        gap = limiter.get_randomized_gap_time('a@example.com')
+        assert 1.0 <= gap <= 15.0
+
+
+def test_unknown_sender_is_unlimited():
+    """Senders without configuration are never rate limited."""
+    limiter = RateLimiter([_sender('a@example.com', limit_per_min=1)])
+
+    assert limiter.can_send('other@example.com')
+    assert limiter.try_acquire('other@example.com')
+    assert limiter.get_gap_wait_time('other@example.com') == 0.0
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+
+# ================================================================================
+# BULK_MAILER - Professional Email Campaign Manager
+# ================================================================================
+#
+# Author: Krishna Kushwaha
+# GitHub: https://github.com/krishna-kush
+# Project: BULK_MAILER - Enterprise Email Campaign Management System
+# Repository: https://github.com/krishna-kush/Bulk-Mailer
+#
+# Description: Test script for loading and filtering recipients
+#
+# ================================================================================
+
+import os
+import sys
+import sqlite3
+import logging
+
+# Add the parent directories to the path so we can import modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+modules_dir = os.path.dirname(current_dir)
+mailer_dir = os.path.dirname(modules_dir)
+sys.path.insert(0, mailer_dir)
+
+from modules.recipient.recipient_manager import RecipientManager
+
+
+def _csv_manager(tmp_path, emails, patterns):
+    csv_path = tmp_path / "recipients.csv"
+    csv_path.write_text("".join(f"{email}\n" for email in emails), encoding="utf-8")
+    config_settings = {
+        'recipients_from': 'csv',
+        'recipients_path': str(csv_path),
+        'ignore_patterns': patterns
+    }
+    return RecipientManager(config_settings, mailer_dir, logging.getLogger(__name__))
+
+
+def test_ignore_patterns_match_case_insensitively(tmp_path):
+    """Glob patterns are matched regardless of case."""
+    manager = _csv_manager(tmp_path, [], ["*@Example.com", "noreply*", "test?@*", "[ab]*@x.com"])
+
+    assert manager._should_ignore_email("John@EXAMPLE.com")
+    assert manager._should_ignore_email("NoReply@business.com")
+    assert manager._should_ignore_email("test1@demo.com")
+    assert not manager._should_ignore_email("test12@demo.com")
+    assert manager._should_ignore_email("bob@x.com")
+    assert not manager._should_ignore_email("carol@x.com")
+    assert manager._should_ignore_email("")
+
+
+def test_simple_ignore_patterns_use_lookups(tmp_path):
+    """Exact and "*@domain" patterns bypass the wildcard regex."""
+    manager = _csv_manager(tmp_path, [], ["Admin@Z.com", "*@Gmail.com", "*@demo.*"])
+
+    assert manager._ignore_exact == {"admin@z.com": "Admin@Z.com"}
+    assert manager._ignore_domains == {"gmail.com": "*@Gmail.com"}
+    assert manager._ignore_patterns == ["*@demo.*"]
+    assert manager._should_ignore_email("admin@z.com")
+    assert manager._should_ignore_email("x@y@gmail.com")
+    assert not manager._should_ignore_email("gmail.com")
+    assert manager._should_ignore_email("demo@demo.org")
+
+
+def test_wildcard_match_reports_its_pattern(tmp_path, monkeypatch):
+    """The matching wildcard is found even when translate() adds its own groups."""
+    import fnmatch
+    from modules.recipient import recipient_manager
+
+    # Older Pythons translate multi-star patterns with numbered groups
+    original_translate = fnmatch.translate
+    monkeypatch.setattr(fnmatch, "translate", lambda pattern: f"(){original_translate(pattern)}")
+    recipient_manager._build_ignore_matchers.cache_clear()
+    try:
+        manager = _csv_manager(tmp_path, [], ["*a*b*", "x*"])
+        assert manager._match_ignore_pattern("xyz") == "x*"
+        assert manager._match_ignore_pattern("cab") == "*a*b*"
+        assert manager._match_ignore_pattern("zzz") is None
+    finally:
+        recipient_manager._build_ignore_matchers.cache_clear()
+
+
+def test_ignore_matchers_shared_between_managers(tmp_path):
+    """Managers built from the same patterns reuse one compiled regex."""
+    first = _csv_manager(tmp_path, [], ["test*", "*@example.com"])
+    second = _csv_manager(tmp_path, [], ["test*", "*@example.com"])
+
+    assert first._ignore_re is second._ignore_re
+    assert first._ignore_cache is not second._ignore_cache
+
+
+def test_ignore_results_are_cached(tmp_path):
+    """Repeated lookups reuse the cached result for the email."""
+    manager = _csv_manager(tmp_path, [], ["*@example.com"])
+
+    assert manager._should_ignore_email("a@example.com")
+    assert not manager._should_ignore_email("a@company.com")
+    assert manager._ignore_cache == {"a@example.com": "*@example.com", "a@company.com": None}
+    assert manager._should_ignore_email("a@example.com")
+
+
+def test_csv_recipients_skip_ignored(tmp_path):
+    """CSV loading drops ignored emails and stops at the limit."""
+    emails = ["a@company.com", "b@example.com", "c@company.com", "d@company.com"]
+    manager = _csv_manager(tmp_path, emails, ["*@example.com"])
+
+    assert [r['email'] for r in manager.get_recipients()] == ["a@company.com", "c@company.com", "d@company.com"]
+    assert [r['row_id'] for r in manager.get_recipients(limit=2)] == [1, 3]
+
+
+def test_iter_recipients_is_lazy(tmp_path):
+    """iter_recipients yields recipients one at a time and can be stopped early."""
+    manager = _csv_manager(tmp_path, [f"user{n}@company.com" for n in range(10)], [])
+
+    recipients = manager.iter_recipients()
+    assert next(recipients)['email'] == "user0@company.com"
+    assert next(recipients)['row_id'] == 2
+    recipients.close()
+
+
+def test_recipients_behave_as_mappings(tmp_path):
+    """Recipient records support the dict-style access existing callers use."""
+    manager = _csv_manager(tmp_path, ["a@company.com"], [])
+
+    recipient = manager.get_recipients()[0]
+    assert recipient.email == recipient['email'] == recipient.get('email') == "a@company.com"
+    assert recipient.get('name') is None
+    assert dict(recipient) == {'email': "a@company.com", 'row_id': 1, 'source': 'csv', 'status': None}
+
+
+def test_csv_quoted_fields(tmp_path):
+    """Quoted CSV files are parsed with the csv module; only column 0 is the email."""
+    emails = ['"a@company.com","Doe, John"', '', 'b@company.com,extra', '  c@company.com  ']
+    manager = _csv_manager(tmp_path, emails, [])
+
+    recipients = manager.get_recipients()
+    assert [r['email'] for r in recipients] == ["a@company.com", "b@company.com", "c@company.com"]
+    assert [r['row_id'] for r in recipients] == [1, 3, 4]
+
+
+def test_db_recipients_filter_ignored_in_query(tmp_path):
+    """Simple ignore patterns are applied in SQL, [...] classes in Python."""
+    db_path = tmp_path / "recipients.db"
+    connection = sqlite3.connect(db_path)
+    connection.execute("CREATE TABLE people (id INTEGER PRIMARY KEY, email TEXT)")
+    emails = ["a@company.com", "B@Example.com", "noreply@company.com", "x_y@company.com",
+              "xzy@company.com", "bob@x.com", "d@company.com"]
+    connection.executemany("INSERT INTO people (email) VALUES (?)", [(email,) for email in emails])
+    connection.commit()
+    connection.close()
+
+    config_settings = {
+        'recipients_from': 'db',
+        'recipients_path': str(db_path),
+        'db_table': 'people',
+        'db_email_column': 'email',
+        'db_id_column': 'id',
+        'ignore_patterns': ["*@example.com", "NoReply@company.com", "x_y@*", "[ab]*@x.com"]
+    }
+    manager = RecipientManager(config_settings, mailer_dir, logging.getLogger(__name__))
+
+    with manager._borrow_read_conn() as read_connection:
+        assert read_connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        indexes = [row[1] for row in read_connection.execute("PRAGMA index_list(people)")]
+    assert "idx_people_unsent" in indexes
+    conditions, params = manager._build_ignore_conditions()
+    assert params == ["noreply@company.com", "%@example.com", "x\\_y@%"]
+    assert [r['email'] for r in manager.get_recipients()] == ["a@company.com", "xzy@company.com", "d@company.com"]
+    assert len(manager.get_recipients(limit=2)) == 2
+
+    recipient = manager.get_recipients(limit=1)[0]
+    assert manager.update_recipient_status(recipient, 'sent')
+    assert manager.flush()
+    assert manager.get_recipient_statistics()['sent'] == 1
+    assert recipient['email'] not in [r['email'] for r in manager.get_recipients()]
+    manager.close()
+
+
+def test_db_status_updates_are_batched(tmp_path):
+    """Queued status updates are all written by flush()/close()."""
+    db_path = tmp_path / "recipients.db"
+    connection = sqlite3.connect(db_path)
+    connection.execute("CREATE TABLE people (id INTEGER PRIMARY KEY, email TEXT)")
+    connection.executemany("INSERT INTO people (email) VALUES (?)", [(f"user{n}@company.com",) for n in range(500)])
+    connection.commit()
+    connection.close()
+
+    config_settings = {
+        'recipients_from': 'db',
+        'recipients_path': str(db_path),
+        'db_table': 'people',
+        'db_email_column': 'email',
+        'db_id_column': 'id'
+    }
+    manager = RecipientManager(config_settings, mailer_dir, logging.getLogger(__name__))
+    for recipient in manager.get_recipients():
+        manager.update_recipient_status(recipient, 'sent')
+    manager.close()
+
+    connection = sqlite3.connect(db_path)
+    assert connection.execute("SELECT COUNT(*) FROM people WHERE email_sent = 'sent'").fetchone()[0] == 500
+    connection.close()
+
+
+
+def test_failed_status_flush_keeps_updates(tmp_path):
+    """A failed write leaves the batch queued so a later flush writes it."""
+    db_path = tmp_path / "recipients.db"
+    connection = sqlite3.connect(db_path)
+    connection.execute("CREATE TABLE people (id INTEGER PRIMARY KEY, email TEXT)")
+    connection.executemany("INSERT INTO people (email) VALUES (?)", [(f"user{n}@company.com",) for n in range(3)])
+    connection.commit()
+    connection.close()
+
+    config_settings = {
+        'recipients_from': 'db',
+        'recipients_path': str(db_path),
+        'db_table': 'people',
+        'db_email_column': 'email',
+        'db_id_column': 'id'
+    }
+    manager = RecipientManager(config_settings, mailer_dir, logging.getLogger(__name__))
+    writer_conn = manager._writer_conn
+
+    class LockedConnection:
+        def executemany(self, *args):
+            raise sqlite3.OperationalError("database is locked")
+
+        def __getattr__(self, name):
+            return getattr(writer_conn, name)
+
+    with manager._writer_lock:
+        manager._writer_conn = LockedConnection()
+    for recipient in manager.get_recipients():
+        manager.update_recipient_status(recipient, 'sent')
+    assert not manager.flush()
+    assert len(manager._pending_statuses) == 3
+
+    with manager._writer_lock:
+        manager._writer_conn = writer_conn
+    assert manager.flush()
+    assert manager.get_recipient_statistics()['sent'] == 3
+    manager.close()
+
+
+def test_status_update_after_close_is_refused(tmp_path):
+    """Updates after close() are refused instead of being queued with no writer."""
+    db_path = tmp_path / "recipients.db"
+    connection = sqlite3.connect(db_path)
+    connection.execute("CREATE TABLE people (id INTEGER PRIMARY KEY, email TEXT)")
+    connection.execute("INSERT INTO people (email) VALUES ('a@company.com')")
+    connection.commit()
+    connection.close()
+
+    config_settings = {
+        'recipients_from': 'db',
+        'recipients_path': str(db_path),
+        'db_table': 'people',
+        'db_email_column': 'email',
+        'db_id_column': 'id'
+    }
+    manager = RecipientManager(config_settings, mailer_dir, logging.getLogger(__name__))
+    recipient = manager.get_recipients()[0]
+    manager.close()
+
+    assert not manager.update_recipient_status(recipient, 'sent')
+    assert not manager._pending_statuses
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+# ================================================================================
+# BULK_MAILER - Professional Email Campaign Manager
+# ================================================================================
+#
+# Author: Krishna Kushwaha
+# GitHub: https://github.com/krishna-kush
+# Project: BULK_MAILER - Enterprise Email Campaign Management System
+# Repository: https://github.com/krishna-kush/Bulk-Mailer
+#
+# Description: Test script for sender failure tracking and blocking
+#
+# ================================================================================
+
+import os
+import sys
+import logging
+
+# Add the parent directories to the path so we can import modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+modules_dir = os.path.dirname(current_dir)
+mailer_dir = os.path.dirname(modules_dir)
+sys.path.insert(0, mailer_dir)
+
+from modules.sender.sender_failure_tracker import SenderFailureTracker
+
+
+def _tracker(max_failures=2):
+    settings = {
+        'max_failures_before_block': max_failures,
+        'cooldown_period': 60,
+        'failure_window': 300,
+        'reset_failures_after': 0
+    }
+    return SenderFailureTracker(settings, logging.getLogger(__name__))
+
+
+def test_blocks_after_max_failures():
+    """Sender is blocked once it reaches the failure limit."""
+    tracker = _tracker()
+
+    tracker.record_failure('a@example.com', 'timeout')
+    assert not tracker.is_sender_blocked('a@example.com')
+    tracker.record_failure('a@example.com', 'timeout')
+    assert tracker.is_sender_blocked('a@example.com')
+    assert tracker.get_sender_status('a@example.com')['failure_count'] == 2
+
+
+def test_success_resets_failures():
+    """A success clears the sender's consecutive failures."""
+    tracker = _tracker()
+
+    tracker.record_failure('a@example.com', 'timeout')
+    tracker.record_success('a@example.com')
+    tracker.record_failure('a@example.com', 'timeout')
+    assert not tracker.is_sender_blocked('a@example.com')
+
+
+def test_unknown_sender_status_is_clean():
+    """Looking up an untracked sender reports no failures and tracks nothing."""
+    tracker = _tracker()
+
+    status = tracker.get_sender_status('other@example.com')
+    assert not status['is_blocked']
+    assert status['failure_count'] == 0
+    tracker.record_success('other@example.com')
+    assert tracker.get_stats()['_summary']['total_senders_tracked'] == 0
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
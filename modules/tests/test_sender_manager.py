@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+# ================================================================================
+# BULK_MAILER - Professional Email Campaign Manager
+# ================================================================================
+#
+# Author: Krishna Kushwaha
+# GitHub: https://github.com/krishna-kush
+# Project: BULK_MAILER - Enterprise Email Campaign Management System
+# Repository: https://github.com/krishna-kush/Bulk-Mailer
+#
+# Description: Test script for sender rotation in the sender manager
+#
+# ================================================================================
+
+import os
+import sys
+import threading
+from collections import Counter
+
+# Add the parent directories to the path so we can import modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+modules_dir = os.path.dirname(current_dir)
+mailer_dir = os.path.dirname(modules_dir)
+sys.path.insert(0, mailer_dir)
+
+from modules.sender.sender_manager import SenderManager
+
+
+SENDERS = [{'email': 'a@example.com'}, {'email': 'b@example.com'}, {'email': 'c@example.com'}]
+
+
+def test_rotate_email_cycles_senders():
+    """rotate_email returns the senders in order and wraps around."""
+    manager = SenderManager(SENDERS, "rotate_email")
+
+    emails = [manager.get_next_sender()['email'] for _ in range(4)]
+
+    assert emails == ['a@example.com', 'b@example.com', 'c@example.com', 'a@example.com']
+
+
+def test_weighted_rotation():
+    """A sender with weight N appears N times per rotation."""
+    manager = SenderManager(SENDERS, "rotate_email", weights=[3, 1, 0])
+
+    emails = [manager.get_next_sender()['email'] for _ in range(8)]
+
+    assert Counter(emails) == {'a@example.com': 6, 'b@example.com': 2}
+
+
+def test_concurrent_rotation_is_even():
+    """Concurrent callers share one rotation without skipping slots."""
+    manager = SenderManager(SENDERS, "rotate_email")
+    picked = []
+
+    def worker():
+        for _ in range(300):
+            picked.append(manager.get_next_sender()['email'])
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert set(Counter(picked).values()) == {400}
+
+
+def test_duplicate_send_returns_none():
+    """duplicate_send leaves sender iteration to the caller."""
+    manager = SenderManager(SENDERS, "duplicate_send")
+
+    assert manager.get_next_sender() is None
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -22,6 +22,11 @@ sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '
 from modules.mailer.template_randomizer import TemplateRandomizer
 from modules.mailer.html_obfuscator import HTMLObfuscator
 
+# Patterns used by the checks below
+_BRACE_PATTERN_RE = re.compile(r'\{[^}]+\}')
+_IMG_TAG_RE = re.compile(r'<img[^>]*>')
+_TITLE_RE = re.compile(r'<title>(.*?)</title>')
+
 class HTMLValidator(HTMLParser):
     """Custom HTML parser to validate structure."""
     
@@ -78,7 +83,7 @@ def test_template_processing():
     print(f"Template size: {len(original_template)} characters")
     
     # Count randomization patterns
-    randomization_patterns = re.findall(r'\{[^}]+\}', original_template)
+    randomization_patterns = _BRACE_PATTERN_RE.findall(original_template)
     print(f"Randomization patterns found: {len(randomization_patterns)}")
     
     # Step 1: Process randomization
@@ -89,7 +94,7 @@ def test_template_processing():
     randomized_html = randomizer.process_template(original_template)
     
     # Check if randomization was processed
-    remaining_patterns = re.findall(r'\{[^}]+\}', randomized_html)
+    remaining_patterns = _BRACE_PATTERN_RE.findall(randomized_html)
     randomization_success = len(remaining_patterns) == 0
     
     print(f"✅ Randomization processed: {randomization_success}")
@@ -168,14 +173,14 @@ def check_specific_issues(html):
     issues = {}
     
     # Check 1: Multiple images
-    img_count = len(re.findall(r'<img[^>]*>', html))
+    img_count = len(_IMG_TAG_RE.findall(html))
     issues['Image count'] = {
         'passed': img_count == 1,
         'message': f"Found {img_count} images (should be 1)"
     }
     
     # Check 2: Unprocessed randomization syntax
-    unprocessed = re.findall(r'\{[^}]+\}', html)
+    unprocessed = _BRACE_PATTERN_RE.findall(html)
     issues['Randomization processing'] = {
         'passed': len(unprocessed) == 0,
         'message': f"Found {len(unprocessed)} unprocessed patterns"
@@ -204,7 +209,7 @@ def check_specific_issues(html):
     }
     
     # Check 5: Title spacing
-    title_match = re.search(r'<title>(.*?)</title>', html)
+    title_match = _TITLE_RE.search(html)
     title_has_spacing_issue = False
     if title_match:
         title = title_match.group(1)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+# ================================================================================
+# BULK_MAILER - Professional Email Campaign Manager
+# ================================================================================
+#
+# Author: Krishna Kushwaha
+# GitHub: https://github.com/krishna-kush
+# Project: BULK_MAILER - Enterprise Email Campaign Management System
+# Repository: https://github.com/krishna-kush/Bulk-Mailer
+#
+# Description: Test script for randomization syntax in the template randomizer
+#
+# ================================================================================
+
+import os
+import sys
+
+# Add the parent directories to the path so we can import modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+modules_dir = os.path.dirname(current_dir)
+mailer_dir = os.path.dirname(modules_dir)
+sys.path.insert(0, mailer_dir)
+
+from modules.mailer.template_randomizer import TemplateRandomizer
+
+
+def test_options_are_selected():
+    """Every group is replaced by one of its stripped options."""
+    randomizer = TemplateRandomizer()
+
+    for _ in range(20):
+        result = randomizer.process_template("<p>{Hi | Hello|Hey} {there|friend}</p>")
+        greeting, name = result[3:-4].split(' ')
+        assert greeting in ('Hi', 'Hello', 'Hey')
+        assert name in ('there', 'friend')
+
+
+def test_synchronized_groups_match():
+    """Groups sharing a sync key pick the same option within one template."""
+    randomizer = TemplateRandomizer()
+
+    for _ in range(20):
+        first, second = randomizer.process_template("{@tone:a|b|c} {@tone:a|b|c}").split(' ')
+        assert first == second
+
+
+def test_preview_variations():
+    """Preview variations resolve every group and keep sync groups aligned."""
+    randomizer = TemplateRandomizer()
+
+    variations = randomizer.preview_variations("{@k:a|b} {x|y} {@k:a|b}", count=30)
+
+    assert len(variations) == 30
+    for variation in variations:
+        first, middle, last = variation.split(' ')
+        assert first == last and first in ('a', 'b')
+        assert middle in ('x', 'y')
+    assert len(set(variations)) > 1
+    assert randomizer.preview_variations("", count=2) == ["", ""]
+
+
+def test_process_template_batch():
+    """Batch processing resolves every group once per output."""
+    randomizer = TemplateRandomizer()
+
+    outputs = randomizer.process_template_batch("<p>{Hi|Hello} {there|friend}</p>", 20)
+
+    assert len(outputs) == 20
+    for output in outputs:
+        greeting, name = output[3:-4].split(' ')
+        assert greeting in ('Hi', 'Hello') and name in ('there', 'friend')
+    assert randomizer.process_template_batch("<p>plain</p>", 2) == ["<p>plain</p>"] * 2
+    assert randomizer.process_template_batch("{a|b}", 0) == []
+
+    outputs = randomizer.process_template_batch("{@k:x|y}-{@k:x|y}", 5)
+    assert randomizer.sync_values == {'k': outputs[-1][0]}
+
+
+def test_parse_is_cached():
+    """Repeated processing of one template reuses its parsed patterns."""
+    randomizer = TemplateRandomizer()
+    template = "<p>{Hi|Hello} {@k:x|y}</p><style>p { {color: red|color: blue}; }</style>"
+    TemplateRandomizer._tokenize.cache_clear()
+
+    for _ in range(5):
+        randomizer.process_template(template)
+
+    info = TemplateRandomizer._tokenize.cache_info()
+    assert info.misses == 1 and info.hits == 4
+    contexts = [pattern[2] for pattern in TemplateRandomizer._parse_patterns(template)]
+    assert contexts == ['HTML', 'SYNC', 'CSS']
+
+
+def test_plain_template_is_returned_unchanged():
+    """Templates without braces skip parsing entirely."""
+    randomizer = TemplateRandomizer()
+    template = "<p>Hello there</p>"
+    TemplateRandomizer._tokenize.cache_clear()
+
+    assert randomizer.process_template(template) is template
+    assert TemplateRandomizer._tokenize.cache_info().misses == 0
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))